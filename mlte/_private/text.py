@@ -18,3 +18,20 @@ def cleantext(text: str) -> str:
     :rtype: str
     """
     return " ".join(textwrap.dedent(text).strip().split("\n"))
+
+
+def parse_bool(value: str) -> bool:
+    """
+    Parse a boolean option from its string representation.
+
+    :param value: The option value, e.g. "true", "off" or "1"
+    :type value: str
+
+    :return: The parsed value
+    :rtype: bool
+    """
+    if value.lower() in ("1", "true", "yes", "on"):
+        return True
+    if value.lower() in ("0", "false", "no", "off"):
+        return False
+    raise ValueError(f"Invalid boolean value: {value}")
@@ -1,5 +1,5 @@
-from typing import Optional, Tuple
-from urllib.parse import ParseResult, quote, urlparse
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import ParseResult, parse_qsl, quote, urlencode, urlparse
 
 
 def set_url_username_password(url: str, username: str, password: str) -> str:
@@ -27,3 +27,34 @@ def remove_url_username_password(
         url = clear_uri.geturl()
 
     return url, parsed_uri.username, parsed_uri.password
+
+
+def extract_query_options(
+    url: str, parsers: Dict[str, Callable[[str], Any]], kind: str
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Extract and parse the given options from the query string of an URL.
+    :param url: The URL
+    :param parsers: The parser for the value of each option to extract
+    :param kind: What the options configure, for error messages
+    :return: The URL without the extracted options, and the parsed options
+    """
+    base, separator, query = url.partition("?")
+    if not separator:
+        return url, {}
+
+    options: Dict[str, Any] = {}
+    remaining = []
+    for key, value in parse_qsl(query, keep_blank_values=True):
+        if key not in parsers:
+            remaining.append((key, value))
+            continue
+        try:
+            options[key] = parsers[key](value)
+        except ValueError:
+            raise RuntimeError(
+                f"Invalid value for {kind} option {key}: {value}"
+            ) from None
+    if remaining:
+        base = f"{base}?{urlencode(remaining)}"
+    return base, options
@@ -7,7 +7,7 @@ Artifact protocol implementation.
 from __future__ import annotations
 
 import abc
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, Sequence
 
 import mlte._private.meta as meta
 import mlte.store.artifact.query as query
@@ -17,6 +17,9 @@ from mlte.context.context import Context
 from mlte.session.state import session
 from mlte.store.artifact.store import ArtifactStore, ManagedArtifactSession
 
+if TYPE_CHECKING:
+    from mlte.store.artifact.underlying.http_async import AsyncHttpArtifactStore
+
 
 class Artifact(metaclass=abc.ABCMeta):
     """
@@ -148,6 +151,94 @@ class Artifact(metaclass=abc.ABCMeta):
                 parents=parents,
             )
 
+    async def save_async(
+        self,
+        context: Context,
+        store: AsyncHttpArtifactStore,
+        *,
+        force: bool = False,
+        parents: bool = False,
+    ) -> None:
+        """
+        Save an artifact with the given context and asyncio store, so that many
+        artifacts can be saved concurrently, e.g. with asyncio.gather().
+        The pre-save hook runs synchronously, against the store's sync_store.
+        :param context: The context in which to save the artifact
+        :param store: The store in which to save the artifact
+        :param force: Indicates that an existing artifact may be overwritten
+        :param parents: Indicates whether organizational elements for the
+        artifact are created implicitly on write (default: False)
+        """
+        self.pre_save_hook(context, store.sync_store)
+
+        artifact_model = self.to_model()
+        async with store.session() as handle:
+            await handle.write_artifact_with_header(
+                context.model,
+                context.version,
+                artifact_model,
+                force=force,
+                parents=parents,
+            )
+
+    @staticmethod
+    def save_many(
+        artifacts: Sequence[Artifact],
+        *,
+        force: bool = False,
+        parents: bool = False,
+    ) -> None:
+        """
+        Save a batch of artifacts with parameters from the configured global session.
+
+        This is equivalent to calling:
+            Artifact.save_many_with(artifacts, session().context, session().store)
+
+        :param artifacts: The artifacts to save
+        :param force: Indicates that existing artifacts may be overwritten
+        :param parents: Indicates whether organizational elements for the
+        artifacts are created implicitly on write (default: False)
+        """
+        Artifact.save_many_with(
+            artifacts,
+            session().context,
+            session().store,
+            force=force,
+            parents=parents,
+        )
+
+    @staticmethod
+    def save_many_with(
+        artifacts: Sequence[Artifact],
+        context: Context,
+        store: ArtifactStore,
+        *,
+        force: bool = False,
+        parents: bool = False,
+    ) -> None:
+        """
+        Save a batch of artifacts with the given context and store configuration,
+        writing all of them through a single store operation.
+        :param artifacts: The artifacts to save
+        :param context: The context in which to save the artifacts
+        :param store: The store in which to save the artifacts
+        :param force: Indicates that existing artifacts may be overwritten
+        :param parents: Indicates whether organizational elements for the
+        artifacts are created implicitly on write (default: False)
+        """
+        for artifact in artifacts:
+            artifact.pre_save_hook(context, store)
+
+        artifact_models = [artifact.to_model() for artifact in artifacts]
+        with ManagedArtifactSession(store.session()) as handle:
+            handle.write_artifacts_with_header(
+                context.model,
+                context.version,
+                artifact_models,
+                force=force,
+                parents=parents,
+            )
+
     @classmethod
     def load(cls, identifier: Optional[str] = None) -> Artifact:
         """
@@ -190,6 +281,37 @@ class Artifact(metaclass=abc.ABCMeta):
         artifact.post_load_hook(context, store)
         return artifact
 
+    @classmethod
+    async def load_async(
+        cls,
+        identifier: Optional[str] = None,
+        *,
+        context: Context,
+        store: AsyncHttpArtifactStore,
+    ) -> Artifact:
+        """
+        Load an artifact with the given context and asyncio store, so that many
+        artifacts can be loaded concurrently, e.g. with asyncio.gather().
+        The post-load hook runs synchronously, against the store's sync_store.
+        :param identifier: The identifier for the artifact
+        :param context: The context from which to load the artifact
+        :param store: The store from which to load the artifact
+        """
+        if identifier is None:
+            identifier = cls.get_default_id()
+
+        async with store.session() as handle:
+            artifact = cls.from_model(
+                await handle.read_artifact(
+                    context.model,
+                    context.version,
+                    identifier,
+                )
+            )
+
+        artifact.post_load_hook(context, store.sync_store)
+        return artifact
+
     @staticmethod
     def load_all_models(artifact_type: ArtifactType) -> list[ArtifactModel]:
         """Loads all artifact models of the given type from the session."""
@@ -4,14 +4,48 @@ mlte/backend/api/auth/authentication.py
 Authentication handling.
 """
 
+from __future__ import annotations
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+from mlte.backend.core.config import settings
 from mlte.store.user.store_session import UserStoreSession
 from mlte.user import passwords
+from mlte.user.model import BasicUser, UserWithPassword
+
+T = TypeVar("T")
+
+_password_pool: Optional[ThreadPoolExecutor] = None
+"""The threads that hash and verify passwords, created when first needed."""
+
+
+async def run_password_task(function: Callable[..., T], *args) -> T:
+    """
+    Run a function that hashes or verifies passwords in the bounded password
+    worker pool, so that the event loop keeps serving other requests meanwhile.
+    bcrypt releases the GIL while hashing, so workers run in parallel.
+    :param function: The function
+    :return: The result of the function
+    """
+    global _password_pool
+    if _password_pool is None:
+        _password_pool = ThreadPoolExecutor(
+            max_workers=settings.PASSWORD_WORKERS,
+            thread_name_prefix="mlte-password",
+        )
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _password_pool, functools.partial(function, *args)
+    )
 
 
 def authenticate_user(
     username: str, password: str, user_store_session: UserStoreSession
 ) -> bool:
-    """Validates the credentials."""
+    """Validates the credentials, upgrading the stored hash if it was made with another cost factor."""
     user = None
     try:
         user = user_store_session.user_mapper.read(username)
@@ -22,7 +56,14 @@ def authenticate_user(
         )
         return False
     if not passwords.verify_password(password, user.hashed_password):
-        # print(f"Could not verify password <{password}> vs hashed <{user.hashed_password}>")
         return False
-    else:
-        return True
+
+    if passwords.needs_rehash(user.hashed_password):
+        # Only possible now, as the plain password is needed to hash it again.
+        user_store_session.user_mapper.edit(
+            UserWithPassword(
+                **BasicUser(**user.model_dump()).model_dump(),
+                password=password,
+            )
+        )
+    return True
@@ -4,7 +4,10 @@ mlte/backend/api/auth/authorization.py
 Setup of OAuth based authorization checks.
 """
 
+import logging
+import time
 from json import JSONDecodeError
+from typing import Optional, Tuple
 
 from fastapi import Depends, HTTPException, Request
 from fastapi.security import OAuth2PasswordBearer
@@ -22,6 +25,7 @@ from mlte.user.model import (
     BasicUser,
     MethodType,
     Permission,
+    PermissionIndex,
     ResourceType,
     RoleType,
 )
@@ -64,7 +68,6 @@ async def get_current_resource(request: Request) -> Permission:
     resource = Permission(
         resource_type=resource_type, resource_id=resource_id, method=method
     )
-    # print(f"Resource: {resource}")
     return resource
 
 
@@ -75,37 +78,39 @@ def get_username_from_token(token: str, key: str) -> str:
     return decoded_token.username
 
 
-def is_authorized(current_user: BasicUser, resource: Permission) -> bool:
-    """Checks if the current user is authorized to access the current resource."""
-    # print(
-    #    f"Checking authorization for user {current_user.username} to resource {resource}"
-    # )
+def is_authorized(
+    current_user: BasicUser,
+    resource: Permission,
+    permissions: Optional[PermissionIndex] = None,
+) -> bool:
+    """
+    Checks if the current user is authorized to access the current resource.
 
+    :param current_user: The user
+    :param resource: The resource and method being accessed
+    :param permissions: The index of the user's permissions, if already built; checking many resources for the same user should reuse one
+    :return: Whether the user is authorized
+    """
     if current_user.role == RoleType.ADMIN:
         # If having admin role, always get access.
-        # print("User is admin")
+        logging.debug(f"Access to {resource} granted to admin.")
         return True
-    else:
-        # Handle special resource cases.
-        if (
-            resource.resource_type == ResourceType.USER
-            and resource.resource_id == USER_ME_ID
-        ):
-            resource.resource_id = current_user.username
-
-        # Check to find if the current user has permissions through any of its groups.
-        # print(current_user.groups)
-        print(f"Resource: {resource}")
-        for group in current_user.groups:
-            # print(group)
-            for permission in group.permissions:
-                if permission.grants_access(resource):
-                    # print("Permission for this model found")
-                    return True
-
-    # If none of the above are true, deny access.
-    # print("Permission not granted.")
-    return False
+
+    # Handle special resource cases.
+    if (
+        resource.resource_type == ResourceType.USER
+        and resource.resource_id == USER_ME_ID
+    ):
+        resource.resource_id = current_user.username
+
+    # Check to find if the current user has permissions through any of its groups.
+    if permissions is None:
+        permissions = PermissionIndex.from_groups(current_user.groups)
+    granted = permissions.grants_access(resource)
+    logging.debug(
+        f"Access to {resource} {'granted to' if granted else 'denied for'} user {current_user.username}."
+    )
+    return granted
 
 
 # -----------------------------------------------------------------------------
@@ -131,42 +136,68 @@ async def get_authorized_user(
     :param resource: A ResourceAction object indicating the resource and actions we are checking for.
     :return: A User data structure, with a User that has access to the resources.
     """
+    start = time.perf_counter()
+
+    # Tokens seen recently were already verified, and their user read.
+    cached = state.authorized_users.get(token)
+    try:
+        user, permissions = (
+            cached if cached is not None else _read_token_user(token)
+        )
+
+        # Check if user is enabled to be used.
+        if user.disabled:
+            raise HTTPException(
+                status_code=codes.FORBIDDEN, detail="User is inactive"
+            )
+
+        # Check proper authorizations.
+        if not is_authorized(user, resource, permissions):
+            raise HTTPException(
+                status_code=codes.FORBIDDEN,
+                detail="User is not authorized to access this resource.",
+            )
+    finally:
+        if state.metrics.enabled:
+            state.metrics.auth_duration.observe(
+                time.perf_counter() - start, str(cached is not None).lower()
+            )
+
+    return user
+
+
+def _read_token_user(token: str) -> Tuple[BasicUser, PermissionIndex]:
+    """Verifies a token and reads the user in it, caching it for the following requests."""
     # Validate token and get username.
-    # print(f"Get authorized user token {token}, resource {resource}")
     try:
-        username = get_username_from_token(token, state.token_key)
+        decoded_token = jwt.decode_user_token(token, state.token_key)
     except Exception as ex:
         raise HTTPAuthException(
             error="invalid_token",
             error_decription=f"Could not decode token: {ex}",
         )
 
-    # Check if user in token exists.
+    # Check if user in token exists. Users read before a change to users, groups
+    # or permissions clears the cache are not cached, as they may be out of date.
+    generation = state.authorized_users.generation
     user = None
     with dependencies.user_store_session() as user_store:
-        user = user_store.user_mapper.read(username)
+        user = user_store.user_mapper.read(decoded_token.username)
     if user is None:
         raise HTTPAuthException(
             error="invalid_token",
             error_decription="Username in token was not found.",
         )
 
-    # Check if user is enabled to be used.
-    if user.disabled:
-        raise HTTPException(
-            status_code=codes.FORBIDDEN, detail="User is inactive"
-        )
-
-    # Check proper authorizations.
-    if not is_authorized(user, resource):
-        raise HTTPException(
-            status_code=codes.FORBIDDEN,
-            detail="User is not authorized to access this resource.",
-        )
-
     # Convert to simple user version to avoid including hashed password.
     basic_user = BasicUser(**user.model_dump())
-    return basic_user
+    permissions = state.authorized_users.put(
+        token,
+        basic_user,
+        decoded_token.expiration_time.timestamp(),
+        generation,
+    )
+    return basic_user, permissions
 
 
 AuthorizedUser = Annotated[BasicUser, Depends(get_authorized_user)]
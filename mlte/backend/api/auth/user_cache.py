@@ -0,0 +1,118 @@
+"""
+mlte/backend/api/auth/user_cache.py
+
+Cache of the users authenticated by each access token.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from mlte.user.model import BasicUser, PermissionIndex
+
+DEFAULT_CACHE_SIZE = 1024
+"""The default maximum number of tokens whose user is kept in the cache."""
+
+DEFAULT_CACHE_TTL = 60.0
+"""The default number of seconds a cached user is trusted before it is read again."""
+
+
+class AuthorizedUserCache:
+    """
+    A bounded LRU cache of verified access tokens to the user, with groups,
+    each of them belongs to, along with the index of the user's permissions.
+
+    Entries expire after a TTL, or when their token does, whichever comes
+    first. Since changes to a group affect all of its members, any change to
+    users, groups or permissions clears the whole cache rather than the
+    entries it affects; such changes are rare compared to requests. Users
+    read before the cache was cleared are not cached, as they may predate
+    the change.
+    """
+
+    def __init__(
+        self,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        ttl: float = DEFAULT_CACHE_TTL,
+    ) -> None:
+        """
+        Initialize the cache.
+        :param cache_size: The maximum number of tokens kept in the cache; 0 disables it
+        :param ttl: The number of seconds a cached user is trusted
+        """
+        self.cache_size = cache_size
+        """The maximum number of tokens kept in the cache."""
+
+        self.ttl = ttl
+        """The number of seconds a cached user is trusted."""
+
+        self.entries: OrderedDict[
+            str, Tuple[float, BasicUser, PermissionIndex]
+        ] = OrderedDict()
+        """The expiration time, user and permission index by token, least recently used first."""
+
+        self.generation = 0
+        """The number of times the cache was cleared, to tell users read before one."""
+
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> Optional[Tuple[BasicUser, PermissionIndex]]:
+        """
+        Get the user authenticated by a token.
+        :param token: The encoded token
+        :return: A copy of the user and the index of its permissions, or None if the token is not cached or has expired
+        """
+        with self._lock:
+            entry = self.entries.get(token)
+            if entry is None:
+                return None
+            expiration, user, permissions = entry
+            if expiration <= time.time():
+                del self.entries[token]
+                return None
+            self.entries.move_to_end(token)
+
+        # Endpoints may modify the user they get, so never hand out the cached instance.
+        return user.model_copy(deep=True), permissions
+
+    def put(
+        self,
+        token: str,
+        user: BasicUser,
+        token_expiration: float,
+        generation: Optional[int] = None,
+    ) -> PermissionIndex:
+        """
+        Cache the user authenticated by a token.
+        :param token: The encoded token, already verified
+        :param user: The user, with its groups
+        :param token_expiration: The time the token expires, as a POSIX timestamp
+        :param generation: The generation of the cache when the user was read, if not now
+        :return: The index of the user's permissions
+        """
+        permissions = PermissionIndex.from_groups(user.groups)
+        if self.cache_size <= 0:
+            return permissions
+        expiration = min(time.time() + self.ttl, token_expiration)
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                # A change may have affected the user while it was being read.
+                return permissions
+            self.entries[token] = (
+                expiration,
+                user.model_copy(deep=True),
+                permissions,
+            )
+            self.entries.move_to_end(token)
+            while len(self.entries) > self.cache_size:
+                self.entries.popitem(last=False)
+        return permissions
+
+    def clear(self) -> None:
+        """Remove all users from the cache."""
+        with self._lock:
+            self.generation += 1
+            self.entries.clear()
@@ -0,0 +1,153 @@
+"""
+mlte/backend/api/body_encoding.py
+
+Middleware that lets clients send and receive gzip compressed and MessagePack encoded bodies.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+from typing import List, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+import mlte.backend.api.codes as codes
+from mlte.store.common import encoding
+
+
+class BodyEncodingMiddleware:
+    """
+    Decodes request bodies that are gzip compressed or MessagePack encoded into
+    the JSON the endpoints expect, and encodes JSON responses as MessagePack
+    for clients that accept it. Compressing responses is left to GZipMiddleware.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        compressed = (
+            headers.get("content-encoding", "").lower()
+            == encoding.GZIP_ENCODING
+        )
+        packed = (
+            encoding.media_type(headers.get("content-type"))
+            == encoding.MSGPACK_CONTENT_TYPE
+        )
+        # Without MessagePack support, responses fall back to JSON, which clients always accept.
+        wants_msgpack = (
+            encoding.msgpack_available()
+            and encoding.accepts_msgpack(headers.get("accept"))
+        )
+        if packed and not encoding.msgpack_available():
+            response = JSONResponse(
+                {"detail": "MessagePack is not supported by this server."},
+                status_code=codes.UNSUPPORTED_MEDIA_TYPE,
+            )
+            await response(scope, receive, send)
+            return
+
+        if compressed or packed:
+            body = await _read_body(receive)
+            try:
+                if compressed:
+                    body = gzip.decompress(body)
+                if packed:
+                    body = json.dumps(
+                        encoding.msgpack_loads(body), separators=(",", ":")
+                    ).encode("utf-8")
+            except Exception:
+                response = JSONResponse(
+                    {"detail": "Malformed request body."},
+                    status_code=codes.BAD_REQUEST,
+                )
+                await response(scope, receive, send)
+                return
+            # Updated in place, so that outer middleware also sees what the router adds to the scope.
+            scope["headers"] = _json_headers(scope, len(body))
+            receive = _replay(body, receive)
+
+        if wants_msgpack:
+            send = _MsgpackSender(send)
+        await self.app(scope, receive, send)
+
+
+class _MsgpackSender:
+    """Wraps the send channel of a request, to encode JSON responses as MessagePack."""
+
+    def __init__(self, send: Send) -> None:
+        self.send = send
+        self.start: Message = {}
+        self.chunks: List[bytes] = []
+        self.converting = False
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            self.converting = (
+                encoding.media_type(headers.get("content-type"))
+                == encoding.JSON_CONTENT_TYPE
+            )
+            if not self.converting:
+                await self.send(message)
+            else:
+                self.start = message
+            return
+        if message["type"] != "http.response.body" or not self.converting:
+            await self.send(message)
+            return
+
+        self.chunks.append(message.get("body", b""))
+        if message.get("more_body", False):
+            return
+        body = encoding.msgpack_dumps(json.loads(b"".join(self.chunks)))
+        headers = MutableHeaders(raw=list(self.start["headers"]))
+        headers["Content-Type"] = encoding.MSGPACK_CONTENT_TYPE
+        headers["Content-Length"] = str(len(body))
+        headers.add_vary_header("Accept")
+        await self.send(dict(self.start, headers=headers.raw))
+        await self.send({"type": "http.response.body", "body": body})
+
+
+async def _read_body(receive: Receive) -> bytes:
+    """Read the whole body of a request."""
+    chunks = []
+    while True:
+        message = await receive()
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            return b"".join(chunks)
+
+
+def _replay(body: bytes, receive: Receive) -> Receive:
+    """Get a receive channel that delivers the given body, then defers to the original channel."""
+    delivered = False
+
+    async def replay() -> Message:
+        nonlocal delivered
+        if delivered:
+            return await receive()
+        delivered = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    return replay
+
+
+def _json_headers(scope: Scope, length: int) -> List[Tuple[bytes, bytes]]:
+    """Get the headers of a request with a decoded body of the given length."""
+    headers = MutableHeaders(scope=scope)
+    if "content-encoding" in headers:
+        del headers["content-encoding"]
+    headers["content-type"] = encoding.JSON_CONTENT_TYPE
+    headers["content-length"] = str(length)
+    return list(headers.raw)
@@ -7,6 +7,9 @@ Status codes for MLTE artifact store.
 OK = 200
 """HTTP 'OK'"""
 
+NOT_MODIFIED = 304
+"""HTTP 'Not Modified'"""
+
 BAD_REQUEST = 400
 """HTTP 'Bad Request'"""
 
@@ -22,6 +25,9 @@ NOT_FOUND = 404
 ALREADY_EXISTS = 409
 """HTTP 'Already Exists'"""
 
+UNSUPPORTED_MEDIA_TYPE = 415
+"""HTTP 'Unsupported Media Type'"""
+
 UNPROCESSABLE_ENTITY = 422
 """HTTP 'Unprocessable Entitiy'"""
 
@@ -26,7 +26,9 @@ def artifact_store_session() -> Generator[ArtifactStoreSession, None, None]:
     Get a handle to underlying store session.
     :return: The session handle
     """
-    session: ArtifactStoreSession = state.artifact_store.session()
+    session: ArtifactStoreSession = state.metrics.timed(
+        state.artifact_store.session(), "artifact"
+    )
     try:
         yield session
     finally:
@@ -39,8 +41,24 @@ def user_store_session() -> Generator[UserStoreSession, None, None]:
     Get a handle to underlying store session.
     :return: The session handle
     """
-    session: UserStoreSession = state.user_store.session()
+    session: UserStoreSession = state.metrics.timed(
+        state.user_store.session(), "user"
+    )
     try:
         yield session
     finally:
         session.close()
+
+
+@contextmanager
+def user_store_write_session() -> Generator[UserStoreSession, None, None]:
+    """
+    Get a handle to underlying store session, to change users, groups or permissions.
+    Cached authenticated users are dropped once done, as their groups may have changed.
+    :return: The session handle
+    """
+    try:
+        with user_store_session() as session:
+            yield session
+    finally:
+        state.authorized_users.clear()
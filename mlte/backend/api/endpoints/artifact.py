@@ -6,22 +6,45 @@ API definition for MLTE artifacts.
 
 from __future__ import annotations
 
+import hashlib
+import itertools
 import traceback
-from typing import List
+from typing import Callable, Dict, Iterator, List, Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 
 import mlte.backend.api.codes as codes
 import mlte.store.error as errors
-from mlte.artifact.model import ArtifactModel
-from mlte.backend.api import dependencies
+from mlte.artifact.model import ArtifactHeaderModel, ArtifactModel
+from mlte.backend.api import dependencies, policies, response_cache
 from mlte.backend.api.auth.authorization import AuthorizedUser
-from mlte.backend.api.model import WriteArtifactRequest, WriteArtifactResponse
-from mlte.store.artifact.query import Query
+from mlte.backend.api.model import (
+    SearchArtifactsPageRequest,
+    WriteArtifactRequest,
+    WriteArtifactResponse,
+    WriteArtifactsRequest,
+    WriteArtifactsResponse,
+)
+from mlte.backend.state import state
+from mlte.store.artifact.cursor import ArtifactPage
+from mlte.store.artifact.query import Query, decode_query, encode_query
+from mlte.store.artifact.store import ArtifactStoreSession
+from mlte.store.common import encoding
 
 # The router exported by this submodule
 router = APIRouter()
 
+_ARTIFACTS = TypeAdapter(List[ArtifactModel])
+"""Serializes lists of artifacts."""
+
+STREAM_PAGE_SIZE = 100
+"""The number of artifacts read from the store at a time when streaming them."""
+
+SEARCH_CACHE_CONTROL = "private, no-cache"
+"""Lets clients keep search results, as long as they revalidate them with their ETag."""
+
 
 @router.post("")
 def write_artifact(
@@ -47,6 +70,9 @@ def write_artifact(
                 parents=request.parents,
                 user=current_user.username,
             )
+            if request.parents:
+                # The model may have just been created, without its policy.
+                policies.ensure_model_policy(model_id)
             return WriteArtifactResponse(artifact=artifact)
         except errors.ErrorNotFound as e:
             raise HTTPException(
@@ -62,34 +88,97 @@ def write_artifact(
                 status_code=codes.INTERNAL_ERROR,
                 detail="Internal server error.",
             )
+        finally:
+            _invalidate_written(model_id, version_id, request.parents)
 
 
-@router.get("/{artifact_id}")
-def read_artifact(
+@router.post("/batch")
+def write_artifacts(
     model_id: str,
     version_id: str,
-    artifact_id: str,
+    request: WriteArtifactsRequest,
     current_user: AuthorizedUser,
-) -> ArtifactModel:
+) -> WriteArtifactsResponse:
     """
-    Read an artifact by identifier.
+    Write a batch of artifacts, in a single operation.
     :param model_id: The model identifier
     :param version_id: The version identifier
-    :param artifact_id: The identifier for the artifact
-    :return: The read artifact
+    :param request: The artifacts write request
+    :return: The created artifacts
     """
-    with dependencies.artifact_store_session() as handle:
+    with dependencies.artifact_store_session() as artifact_store:
         try:
-            return handle.read_artifact(model_id, version_id, artifact_id)
+            artifacts = artifact_store.write_artifacts_with_header(
+                model_id,
+                version_id,
+                request.artifacts,
+                force=request.force,
+                parents=request.parents,
+                user=current_user.username,
+            )
+            if request.parents:
+                # The model may have just been created, without its policy.
+                policies.ensure_model_policy(model_id)
+            return WriteArtifactsResponse(artifacts=artifacts)
         except errors.ErrorNotFound as e:
             raise HTTPException(
                 status_code=codes.NOT_FOUND, detail=f"{e} not found."
             )
+        except errors.ErrorAlreadyExists as e:
+            raise HTTPException(
+                status_code=codes.ALREADY_EXISTS, detail=f"{e} already exists."
+            )
         except Exception:
+            print(traceback.format_exc())
             raise HTTPException(
                 status_code=codes.INTERNAL_ERROR,
                 detail="Internal server error.",
             )
+        finally:
+            _invalidate_written(model_id, version_id, request.parents)
+
+
+@router.get("/{artifact_id}")
+def read_artifact(
+    model_id: str,
+    version_id: str,
+    artifact_id: str,
+    current_user: AuthorizedUser,
+    if_none_match: Optional[str] = Header(default=None),
+) -> ArtifactModel:
+    """
+    Read an artifact by identifier. The response carries a weak ETag, and
+    is 304 Not Modified if the artifact still matches one in If-None-Match.
+    :param model_id: The model identifier
+    :param version_id: The version identifier
+    :param artifact_id: The identifier for the artifact
+    :param if_none_match: The ETags of the copies the client already has, if any
+    :return: The read artifact
+    """
+
+    def read() -> bytes:
+        with dependencies.artifact_store_session() as handle:
+            artifact = handle.read_artifact(model_id, version_id, artifact_id)
+            return artifact.model_dump_json().encode("utf-8")
+
+    try:
+        content = state.responses.get_or_create(
+            ("read_artifact", model_id, version_id, artifact_id),
+            response_cache.version_scope(model_id, version_id),
+            read,
+        )
+        return _etag_response(  # type: ignore[return-value]
+            content, if_none_match
+        )
+    except errors.ErrorNotFound as e:
+        raise HTTPException(
+            status_code=codes.NOT_FOUND, detail=f"{e} not found."
+        )
+    except Exception:
+        raise HTTPException(
+            status_code=codes.INTERNAL_ERROR,
+            detail="Internal server error.",
+        )
 
 
 @router.get("")
@@ -99,18 +188,84 @@ def read_artifacts(
     current_user: AuthorizedUser,
     limit: int = 100,
     offset: int = 0,
+    q: Optional[str] = None,
+    if_none_match: Optional[str] = Header(default=None),
+    accept: Optional[str] = Header(default=None),
 ) -> List[ArtifactModel]:
     """
-    Read artifacts with limit and offset.
+    Read artifacts with limit and offset, or search them if a query is given;
+    searches return all the matching artifacts, with an ETag. Clients that
+    accept newline delimited JSON get the artifacts streamed as they are read instead.
     :param model_id: The model identifier
     :param version_id: The version identifier
     :param limit: The limit on returned artifacts
     :param offset: The offset on returned artifacts
+    :param q: The artifact query encoded by encode_query(), to search artifacts
+    :param if_none_match: The ETags of the search results the client already has, if any
+    :param accept: The media types the client accepts
+    :return: The read artifacts
+    """
+    if q is not None:
+        return _read_artifact_search(  # type: ignore[return-value]
+            model_id, version_id, q, if_none_match, accept
+        )
+
+    if encoding.accepts_ndjson(accept):
+        return _stream_artifacts(  # type: ignore[return-value]
+            lambda handle: _read_artifact_pages(
+                handle, model_id, version_id, limit, offset
+            )
+        )
+
+    def read() -> bytes:
+        with dependencies.artifact_store_session() as handle:
+            return _ARTIFACTS.dump_json(
+                handle.read_artifacts(model_id, version_id, limit, offset)
+            )
+
+    try:
+        body = state.responses.get_or_create(
+            ("read_artifacts", model_id, version_id, limit, offset),
+            response_cache.version_scope(model_id, version_id),
+            read,
+        )
+        return response_cache.json_response(body)  # type: ignore[return-value]
+    except Exception:
+        raise HTTPException(
+            status_code=codes.INTERNAL_ERROR,
+            detail="Internal server error.",
+        )
+
+
+# NOTE: Kept for queries too large to encode in a URL. Being a POST, it needs write permission;
+# read_artifacts() with a query is the GET equivalent, which only needs read permission.
+@router.post("/search")
+def search_artifacts(
+    model_id: str,
+    version_id: str,
+    query: Query,
+    current_user: AuthorizedUser,
+    accept: Optional[str] = Header(default=None),
+) -> List[ArtifactModel]:
+    """
+    Search artifacts. Clients that accept newline delimited JSON get the
+    artifacts streamed as they are read instead.
+
+    :param model_id: The model identifier
+    :param version_id: The version identifier
+    :param query: The artifact query
+    :param accept: The media types the client accepts
     :return: The read artifacts
     """
+    if encoding.accepts_ndjson(accept):
+        return _stream_artifacts(  # type: ignore[return-value]
+            lambda handle: handle.iter_artifacts(
+                model_id, version_id, query, page_size=STREAM_PAGE_SIZE
+            )
+        )
     with dependencies.artifact_store_session() as handle:
         try:
-            return handle.read_artifacts(model_id, version_id, limit, offset)
+            return handle.search_artifacts(model_id, version_id, query)
         except Exception:
             raise HTTPException(
                 status_code=codes.INTERNAL_ERROR,
@@ -118,27 +273,72 @@ def read_artifacts(
             )
 
 
-# TODO: this uses post to take advantge of the Query model. However, this is not corret REST syntax,
-# and it forces us to use write permissions to reach this endpoint. This should be fixed.
-@router.post("/search")
-def search_artifacts(
+@router.post("/search/headers")
+def search_artifact_headers(
     model_id: str,
     version_id: str,
     query: Query,
     current_user: AuthorizedUser,
-) -> List[ArtifactModel]:
+) -> List[ArtifactHeaderModel]:
     """
-    Search artifacts.
+    Search artifacts, returning only their headers.
 
     :param model_id: The model identifier
     :param version_id: The version identifier
     :param query: The artifact query
-    :return: The read artifacts
+    :return: The headers of the matching artifacts
     """
     with dependencies.artifact_store_session() as handle:
         try:
-            return handle.search_artifacts(model_id, version_id, query)
+            return handle.list_artifact_headers(model_id, version_id, query)
+        except errors.ErrorNotFound as e:
+            raise HTTPException(
+                status_code=codes.NOT_FOUND, detail=f"{e} not found."
+            )
+        except Exception:
+            print(traceback.format_exc())
+            raise HTTPException(
+                status_code=codes.INTERNAL_ERROR,
+                detail="Internal server error.",
+            )
+
+
+@router.post("/search/page")
+def search_artifacts_page(
+    model_id: str,
+    version_id: str,
+    request: SearchArtifactsPageRequest,
+    current_user: AuthorizedUser,
+) -> ArtifactPage:
+    """
+    Search a page of artifacts; the returned cursor continues the search.
+
+    The paging order depends on the store backend: the file system and memory
+    stores page by artifact identifier, and the relational store by timestamp
+    and then identifier.
+
+    :param model_id: The model identifier
+    :param version_id: The version identifier
+    :param request: The query, page limit and cursor
+    :return: The page of artifacts
+    """
+    with dependencies.artifact_store_session() as handle:
+        try:
+            return handle.search_artifacts_page(
+                model_id,
+                version_id,
+                request.query,
+                limit=request.limit,
+                cursor=request.cursor,
+            )
+        except errors.ErrorNotFound as e:
+            raise HTTPException(
+                status_code=codes.NOT_FOUND, detail=f"{e} not found."
+            )
+        except errors.ErrorBadRequest as e:
+            raise HTTPException(status_code=codes.BAD_REQUEST, detail=f"{e}")
         except Exception:
+            print(traceback.format_exc())
             raise HTTPException(
                 status_code=codes.INTERNAL_ERROR,
                 detail="Internal server error.",
@@ -161,7 +361,11 @@ def delete_artifact(
     """
     with dependencies.artifact_store_session() as handle:
         try:
-            return handle.delete_artifact(model_id, version_id, artifact_id)
+            deleted = handle.delete_artifact(model_id, version_id, artifact_id)
+            state.responses.invalidate(
+                response_cache.version_scope(model_id, version_id)
+            )
+            return deleted
         except errors.ErrorNotFound as e:
             raise HTTPException(
                 status_code=codes.NOT_FOUND, detail=f"{e} not found."
@@ -171,3 +375,183 @@ def delete_artifact(
                 status_code=codes.INTERNAL_ERROR,
                 detail="Internal server error.",
             )
+
+
+def _stream_artifacts(
+    read: Callable[[ArtifactStoreSession], Iterator[ArtifactModel]]
+) -> StreamingResponse:
+    """
+    Stream artifacts as newline delimited JSON, reading them from the store
+    as they are sent. The first one is read before responding, so that errors
+    such as a missing version still get their status code.
+    :param read: The function that lazily reads the artifacts from a session
+    :return: The response
+    """
+
+    def lines() -> Iterator[bytes]:
+        with dependencies.artifact_store_session() as handle:
+            for artifact in read(handle):
+                yield artifact.model_dump_json().encode("utf-8") + b"\n"
+
+    body = lines()
+    try:
+        first = next(body, None)
+    except errors.ErrorNotFound as e:
+        raise HTTPException(
+            status_code=codes.NOT_FOUND, detail=f"{e} not found."
+        )
+    except Exception:
+        print(traceback.format_exc())
+        raise HTTPException(
+            status_code=codes.INTERNAL_ERROR,
+            detail="Internal server error.",
+        )
+    return StreamingResponse(
+        itertools.chain([] if first is None else [first], body),
+        media_type=encoding.NDJSON_CONTENT_TYPE,
+    )
+
+
+def _read_artifact_pages(
+    handle: ArtifactStoreSession,
+    model_id: str,
+    version_id: str,
+    limit: int,
+    offset: int,
+) -> Iterator[ArtifactModel]:
+    """
+    Read artifacts with limit and offset a page at a time, in the same order
+    as reading them all at once.
+    :param handle: The store session
+    :param model_id: The model identifier
+    :param version_id: The version identifier
+    :param limit: The limit on returned artifacts
+    :param offset: The offset on returned artifacts
+    :return: An iterator over the artifacts
+    """
+    end = offset + limit
+    while offset < end:
+        size = min(STREAM_PAGE_SIZE, end - offset)
+        page = handle.read_artifacts(model_id, version_id, size, offset)
+        yield from page
+        if len(page) < size:
+            return
+        offset += len(page)
+
+
+def _invalidate_written(model_id: str, version_id: str, parents: bool) -> None:
+    """
+    Drop the cached responses that writing artifacts to a version may have
+    changed. Called even if the write failed, as a batch may be partly written.
+    :param model_id: The model identifier
+    :param version_id: The version identifier
+    :param parents: Whether the model and version may have been created too
+    """
+    state.responses.invalidate(
+        response_cache.version_scope(model_id, version_id)
+    )
+    if parents:
+        state.responses.invalidate(response_cache.MODELS)
+        state.responses.invalidate(response_cache.model_scope(model_id))
+
+
+def _read_artifact_search(
+    model_id: str,
+    version_id: str,
+    q: str,
+    if_none_match: Optional[str],
+    accept: Optional[str],
+) -> Response:
+    """
+    Search artifacts, with the query encoded in the URL by encode_query(), so
+    that only read permission is needed and results can be cached. Responses
+    carry an ETag, and are 304 Not Modified if the results still match one in
+    If-None-Match. Clients that accept newline delimited JSON get the
+    artifacts streamed as they are read instead, without an ETag.
+    :param model_id: The model identifier
+    :param version_id: The version identifier
+    :param q: The encoded artifact query
+    :param if_none_match: The ETags of the results the client already has, if any
+    :param accept: The media types the client accepts
+    :return: The response
+    """
+    try:
+        query = decode_query(q)
+    except ValueError as e:
+        raise HTTPException(status_code=codes.BAD_REQUEST, detail=f"{e}")
+
+    if encoding.accepts_ndjson(accept):
+        return _stream_artifacts(
+            lambda handle: handle.iter_artifacts(
+                model_id, version_id, query, page_size=STREAM_PAGE_SIZE
+            )
+        )
+
+    def read() -> bytes:
+        with dependencies.artifact_store_session() as handle:
+            return _ARTIFACTS.dump_json(
+                handle.search_artifacts(model_id, version_id, query)
+            )
+
+    try:
+        # Keyed by the canonical encoding, so equal queries share an entry and an ETag.
+        content = state.responses.get_or_create(
+            ("search_artifacts", model_id, version_id, encode_query(query)),
+            response_cache.version_scope(model_id, version_id),
+            read,
+        )
+        return _etag_response(
+            content,
+            if_none_match,
+            headers={"Cache-Control": SEARCH_CACHE_CONTROL},
+        )
+    except errors.ErrorNotFound as e:
+        raise HTTPException(
+            status_code=codes.NOT_FOUND, detail=f"{e} not found."
+        )
+    except Exception:
+        print(traceback.format_exc())
+        raise HTTPException(
+            status_code=codes.INTERNAL_ERROR,
+            detail="Internal server error.",
+        )
+
+
+def _etag_response(
+    content: bytes,
+    if_none_match: Optional[str],
+    headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    """
+    Build the response for a JSON body with a weak ETag, which is 304 Not
+    Modified without the body if the client's copy is still current. The
+    ETag is weak as the body may be sent as is, gzip compressed or as
+    MessagePack, which are equivalent but not byte for byte identical.
+    :param content: The JSON body
+    :param if_none_match: The value of the If-None-Match header, if any
+    :param headers: Additional response headers, sent with both
+    :return: The response
+    """
+    etag = f'W/"{hashlib.sha256(content).hexdigest()}"'
+    headers = {**(headers or {}), "ETag": etag}
+    if if_none_match is not None and _etag_matches(if_none_match, etag):
+        return Response(status_code=codes.NOT_MODIFIED, headers=headers)
+    return response_cache.json_response(content, headers=headers)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Whether an If-None-Match header matches an ETag, using the weak comparison it calls for.
+    :param if_none_match: The value of the If-None-Match header
+    :param etag: The current ETag
+    :return: True if the client's copy is still current
+    """
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or _opaque_tag(etag) in (
+        _opaque_tag(tag) for tag in candidates
+    )
+
+
+def _opaque_tag(etag: str) -> str:
+    """Get the quoted part of an ETag, without the weakness indicator."""
+    return etag[2:] if etag.startswith("W/") else etag
@@ -9,11 +9,13 @@ from __future__ import annotations
 from typing import List
 
 from fastapi import APIRouter, HTTPException
+from pydantic import TypeAdapter
 
 import mlte.backend.api.codes as codes
 import mlte.store.error as errors
-from mlte.backend.api import dependencies
+from mlte.backend.api import dependencies, policies, response_cache
 from mlte.backend.api.auth.authorization import AuthorizedUser
+from mlte.backend.state import state
 from mlte.context.model import Model, ModelCreate, Version, VersionCreate
 from mlte.store.user.policy import Policy
 from mlte.user.model import ResourceType
@@ -21,6 +23,9 @@ from mlte.user.model import ResourceType
 # The router exported by this submodule
 router = APIRouter()
 
+_IDENTIFIERS = TypeAdapter(List[str])
+"""Serializes lists of model and version identifiers."""
+
 
 @router.post("/model")
 def create_model(
@@ -38,6 +43,7 @@ def create_model(
     with dependencies.artifact_store_session() as handle:
         try:
             created_model = handle.create_model(model)
+            state.responses.invalidate(response_cache.MODELS)
         except errors.ErrorNotFound as e:
             raise HTTPException(
                 status_code=codes.NOT_FOUND, detail=f"{e} not found."
@@ -52,7 +58,7 @@ def create_model(
                 detail="Internal server error.",
             )
 
-    with dependencies.user_store_session() as handle:
+    with dependencies.user_store_write_session() as handle:
         # Now create permissions and groups associated to it.
         try:
             Policy.create(
@@ -66,6 +72,7 @@ def create_model(
                 status_code=codes.INTERNAL_ERROR,
                 detail="Internal server error.",
             )
+    policies.remember_model_policy(created_model.identifier)
 
     return created_model
 
@@ -81,11 +88,18 @@ def read_model(
     :param model_id: The model identifier
     :return: The read model
     """
-    try:
+
+    def read() -> bytes:
         with dependencies.artifact_store_session() as handle:
-            model = handle.read_model(model_id)
+            return handle.read_model(model_id).model_dump_json().encode("utf-8")
 
-        return model
+    try:
+        body = state.responses.get_or_create(
+            ("read_model", model_id),
+            response_cache.model_scope(model_id),
+            read,
+        )
+        return response_cache.json_response(body)  # type: ignore[return-value]
     except errors.ErrorNotFound as e:
         raise HTTPException(
             status_code=codes.NOT_FOUND, detail=f"{e} not found."
@@ -105,18 +119,25 @@ def list_models(
     List MLTE models.
     :return: A collection of model identifiers
     """
-    with dependencies.artifact_store_session() as handle:
-        try:
-            return handle.list_models()
-        except errors.ErrorNotFound as e:
-            raise HTTPException(
-                status_code=codes.NOT_FOUND, detail=f"{e} not found."
-            )
-        except Exception:
-            raise HTTPException(
-                status_code=codes.INTERNAL_ERROR,
-                detail="Internal server error.",
-            )
+
+    def read() -> bytes:
+        with dependencies.artifact_store_session() as handle:
+            return _IDENTIFIERS.dump_json(handle.list_models())
+
+    try:
+        body = state.responses.get_or_create(
+            ("list_models",), response_cache.MODELS, read
+        )
+        return response_cache.json_response(body)  # type: ignore[return-value]
+    except errors.ErrorNotFound as e:
+        raise HTTPException(
+            status_code=codes.NOT_FOUND, detail=f"{e} not found."
+        )
+    except Exception:
+        raise HTTPException(
+            status_code=codes.INTERNAL_ERROR,
+            detail="Internal server error.",
+        )
 
 
 @router.delete("/model/{model_id}")
@@ -134,6 +155,8 @@ def delete_model(
     with dependencies.artifact_store_session() as handle:
         try:
             deleted_model = handle.delete_model(model_id)
+            state.responses.invalidate(response_cache.MODELS)
+            state.responses.invalidate_model(model_id)
         except errors.ErrorNotFound as e:
             raise HTTPException(
                 status_code=codes.NOT_FOUND, detail=f"{e} not found."
@@ -144,7 +167,7 @@ def delete_model(
                 detail="Internal server error.",
             )
 
-    with dependencies.user_store_session() as handle:
+    with dependencies.user_store_write_session() as handle:
         # Now delete related permissions and groups.
         try:
             Policy.remove(ResourceType.MODEL, model_id, handle)
@@ -153,6 +176,7 @@ def delete_model(
                 status_code=codes.INTERNAL_ERROR,
                 detail="Internal server error.",
             )
+    policies.forget_model_policy(model_id)
 
     return deleted_model
 
@@ -172,7 +196,9 @@ def create_version(
     """
     with dependencies.artifact_store_session() as handle:
         try:
-            return handle.create_version(model_id, version)
+            created_version = handle.create_version(model_id, version)
+            state.responses.invalidate(response_cache.model_scope(model_id))
+            return created_version
         except errors.ErrorNotFound as e:
             raise HTTPException(
                 status_code=codes.NOT_FOUND, detail=f"{e} not found."
@@ -225,18 +251,27 @@ def list_versions(
     :param model_id: The model identifier
     :return: A collection of version identifiers
     """
-    with dependencies.artifact_store_session() as handle:
-        try:
-            return handle.list_versions(model_id)
-        except errors.ErrorNotFound as e:
-            raise HTTPException(
-                status_code=codes.NOT_FOUND, detail=f"{e} not found."
-            )
-        except Exception:
-            raise HTTPException(
-                status_code=codes.INTERNAL_ERROR,
-                detail="Internal server error.",
-            )
+
+    def read() -> bytes:
+        with dependencies.artifact_store_session() as handle:
+            return _IDENTIFIERS.dump_json(handle.list_versions(model_id))
+
+    try:
+        body = state.responses.get_or_create(
+            ("list_versions", model_id),
+            response_cache.model_scope(model_id),
+            read,
+        )
+        return response_cache.json_response(body)  # type: ignore[return-value]
+    except errors.ErrorNotFound as e:
+        raise HTTPException(
+            status_code=codes.NOT_FOUND, detail=f"{e} not found."
+        )
+    except Exception:
+        raise HTTPException(
+            status_code=codes.INTERNAL_ERROR,
+            detail="Internal server error.",
+        )
 
 
 @router.delete("/model/{model_id}/version/{version_id}")
@@ -254,7 +289,12 @@ def delete_version(
     """
     with dependencies.artifact_store_session() as handle:
         try:
-            return handle.delete_version(model_id, version_id)
+            deleted_version = handle.delete_version(model_id, version_id)
+            state.responses.invalidate(response_cache.model_scope(model_id))
+            state.responses.invalidate(
+                response_cache.version_scope(model_id, version_id)
+            )
+            return deleted_version
         except errors.ErrorNotFound as e:
             raise HTTPException(
                 status_code=codes.NOT_FOUND, detail=f"{e} not found."
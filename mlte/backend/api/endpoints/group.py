@@ -12,9 +12,9 @@ from fastapi import APIRouter, HTTPException
 
 import mlte.backend.api.codes as codes
 import mlte.store.error as errors
-from mlte.backend.api import dependencies
+from mlte.backend.api import dependencies, policies
 from mlte.backend.api.auth.authorization import AuthorizedUser
-from mlte.user.model import Group, Permission
+from mlte.user.model import Group, Permission, RoleType
 
 # The router exported by this submodule
 router = APIRouter()
@@ -31,7 +31,7 @@ def create_group(
     :param group: The group to create
     :return: The created group
     """
-    with dependencies.user_store_session() as user_store:
+    with dependencies.user_store_write_session() as user_store:
         try:
             return user_store.group_mapper.create(group)
         except errors.ErrorAlreadyExists as e:
@@ -58,7 +58,7 @@ def edit_group(
     :param group: The group to edit
     :return: The edited group
     """
-    with dependencies.user_store_session() as user_store:
+    with dependencies.user_store_write_session() as user_store:
         try:
             return user_store.group_mapper.edit(group)
         except errors.ErrorNotFound as e:
@@ -159,7 +159,7 @@ def delete_user(
     :param group name: The group name
     :return: The deleted group
     """
-    with dependencies.user_store_session() as user_store:
+    with dependencies.user_store_write_session() as user_store:
         try:
             return user_store.group_mapper.delete(group_name)
         except errors.ErrorNotFound as e:
@@ -218,3 +218,28 @@ def list_permission_details(
                 status_code=codes.INTERNAL_ERROR,
                 detail="Internal server error.",
             )
+
+
+@router.post("/groups/policies/reconcile")
+def reconcile_policies(
+    current_user: AuthorizedUser,
+) -> List[str]:
+    """
+    Create the missing groups and permissions of all models, e.g. for models
+    created without the API. Only available to admins.
+    :return: The ids of the models whose policies were created or completed
+    """
+    if current_user.role != RoleType.ADMIN:
+        raise HTTPException(
+            status_code=codes.FORBIDDEN,
+            detail="Only admins can reconcile policies.",
+        )
+    try:
+        return policies.reconcile_model_policies()
+    except Exception as e:
+        print(f"Internal server error. {e}")
+        print(tb.format_exc())
+        raise HTTPException(
+            status_code=codes.INTERNAL_ERROR,
+            detail="Internal server error.",
+        )
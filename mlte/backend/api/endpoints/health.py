@@ -4,7 +4,14 @@ mlte/store/api/endpoints/health.py
 Generic health check endpoint.
 """
 
-from fastapi import APIRouter
+from typing import Any, Dict
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import Response
+
+import mlte.backend.api.codes as codes
+from mlte.backend.api import metrics
+from mlte.backend.state import state
 
 # The router exported by this submodule
 router = APIRouter()
@@ -14,3 +21,29 @@ router = APIRouter()
 def healthcheck():
     """Perform a health check on artifact store server."""
     return {"status": "healthy"}
+
+
+@router.get("/healthz/pools")
+def pool_status() -> Dict[str, Any]:
+    """Get connection pool statistics for the backend stores that keep a pool."""
+    status = {}
+    for name, store in [
+        ("artifact_store", state.artifact_store),
+        ("user_store", state.user_store),
+    ]:
+        if hasattr(store, "pool_status"):
+            status[name] = store.pool_status()
+    return status
+
+
+@router.get("/metrics")
+def read_metrics() -> Response:
+    """Get the metrics collected by this backend process, in the Prometheus text format."""
+    if not state.metrics.enabled:
+        raise HTTPException(
+            status_code=codes.NOT_FOUND, detail="Metrics are disabled."
+        )
+    return Response(
+        content=state.metrics.render(pool_status(), state.responses),
+        media_type=metrics.CONTENT_TYPE,
+    )
@@ -4,6 +4,8 @@ mlte/backend/api/endpoints/token.py
 Token endpoint.
 """
 
+from typing import Optional
+
 from fastapi import APIRouter, Depends
 from fastapi.security import OAuth2PasswordRequestForm
 from typing_extensions import Annotated
@@ -13,7 +15,7 @@ from mlte.backend.api.auth import authentication, jwt
 from mlte.backend.api.auth.http_auth_exception import HTTPTokenException
 from mlte.backend.state import state
 from mlte.model.base_model import BaseModel
-from mlte.store.user import policy
+from mlte.user.model import User
 
 GRANT_TYPE_PASSWORD = "password"
 """Grant type name used in token requests."""
@@ -50,6 +52,16 @@ def create_token_response(access_token: jwt.EncodedToken) -> TokenResponse:
     )
 
 
+def _authenticate(username: str, password: str) -> Optional[User]:
+    """Gets the user with the given credentials, or None if they are not valid."""
+    with dependencies.user_store_session() as user_store_session:
+        if not authentication.authenticate_user(
+            username, password, user_store_session
+        ):
+            return None
+        return user_store_session.user_mapper.read(username)
+
+
 @router.post(f"{TOKEN_ENDPOINT_URL}")
 async def login_for_access_token(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()]
@@ -60,17 +72,16 @@ async def login_for_access_token(
     """
     user = None
     if form_data.grant_type == GRANT_TYPE_PASSWORD:
-        # Validate user and password from db.
-        with dependencies.user_store_session() as user_store_session:
-            is_valid_user = authentication.authenticate_user(
-                form_data.username, form_data.password, user_store_session
+        # Validate user and password from db. Password hashing is slow on purpose, so it
+        # runs in the password workers to avoid stalling other requests meanwhile.
+        user = await authentication.run_password_task(
+            _authenticate, form_data.username, form_data.password
+        )
+        if user is None:
+            raise HTTPTokenException(
+                error="invalid_grant",
+                error_decription="Incorrect username or password.",
             )
-            if not is_valid_user:
-                raise HTTPTokenException(
-                    error="invalid_grant",
-                    error_decription="Incorrect username or password.",
-                )
-            user = user_store_session.user_mapper.read(form_data.username)
     else:
         raise HTTPTokenException(
             error="unsupported_grant_type",
@@ -91,12 +102,6 @@ async def login_for_access_token(
             error_decription="User is inactive.",
         )
 
-    # Create policies for models if needed.
-    # TODO: this is terribly not efficient. This is checked every time anybody logins.
-    with dependencies.artifact_store_session() as artifact_store:
-        with dependencies.user_store_session() as user_store:
-            policy.create_model_policies_if_needed(artifact_store, user_store)
-
     # Create and return token using username as data.
     access_token = jwt.create_user_token(user.username, state.token_key)
     return create_token_response(access_token)
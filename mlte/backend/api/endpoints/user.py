@@ -10,11 +10,12 @@ import traceback as tb
 from typing import List, Union
 
 from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
 
 import mlte.backend.api.codes as codes
 import mlte.store.error as errors
 from mlte.backend.api import dependencies
-from mlte.backend.api.auth import authorization
+from mlte.backend.api.auth import authentication, authorization
 from mlte.backend.api.auth.authorization import AuthorizedUser
 from mlte.backend.api.model import USER_ME_ID
 from mlte.store.user.policy import Policy
@@ -22,6 +23,7 @@ from mlte.user.model import (
     BasicUser,
     MethodType,
     Permission,
+    PermissionIndex,
     ResourceType,
     RoleType,
     UserWithPassword,
@@ -69,7 +71,7 @@ def list_user_models_me(
 
 
 @router.post("/user")
-def create_user(
+async def create_user(
     *,
     user: UserWithPassword,
     current_user: AuthorizedUser,
@@ -85,8 +87,15 @@ def create_user(
             detail="'me' is reserved and can't be used as a username.",
         )
 
+    # Storing the user hashes its password, which is slow on purpose, so it
+    # runs in the password workers to avoid stalling other requests meanwhile.
+    return await authentication.run_password_task(_create_user, user)
+
+
+def _create_user(user: UserWithPassword) -> BasicUser:
+    """Store a new user along with its groups and permissions."""
     new_user: BasicUser
-    with dependencies.user_store_session() as user_store:
+    with dependencies.user_store_write_session() as user_store:
         try:
             # Give every new user permissions to create models.
             # Check first if the group was not manually added in the received user data.
@@ -132,7 +141,7 @@ def create_user(
 
 
 @router.put("/user")
-def edit_user(
+async def edit_user(
     *,
     user: Union[UserWithPassword, BasicUser],
     current_user: AuthorizedUser,
@@ -145,7 +154,19 @@ def edit_user(
     if user.username == USER_ME_ID:
         user.username = current_user.username
 
-    with dependencies.user_store_session() as user_store:
+    if isinstance(user, UserWithPassword):
+        # A new password gets hashed, so this runs in the password workers too.
+        return await authentication.run_password_task(
+            _edit_user, user, current_user
+        )
+    return await run_in_threadpool(_edit_user, user, current_user)
+
+
+def _edit_user(
+    user: Union[UserWithPassword, BasicUser], current_user: BasicUser
+) -> BasicUser:
+    """Store the edited user, keeping its groups unless edited by an admin."""
+    with dependencies.user_store_write_session() as user_store:
         try:
             # We only want to allow admins to edit a user's groups.
             if current_user.role != RoleType.ADMIN:
@@ -258,7 +279,7 @@ def delete_user(
     :param username: The username
     :return: The deleted user
     """
-    with dependencies.user_store_session() as user_store:
+    with dependencies.user_store_write_session() as user_store:
         try:
             deleted_user = user_store.user_mapper.delete(username)
 
@@ -301,6 +322,7 @@ def list_user_models(
                 user = BasicUser(
                     **user_store.user_mapper.read(username).model_dump()
                 )
+                permissions = PermissionIndex.from_groups(user.groups)
                 all_models = artifact_store.list_models()
                 for model_id in all_models:
                     permission = Permission(
@@ -308,7 +330,9 @@ def list_user_models(
                         resource_id=model_id,
                         method=MethodType.GET,
                     )
-                    if authorization.is_authorized(user, permission):
+                    if authorization.is_authorized(
+                        user, permission, permissions
+                    ):
                         user_models.append(model_id)
                 return user_models
 
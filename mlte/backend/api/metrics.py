@@ -0,0 +1,471 @@
+"""
+mlte/backend/api/metrics.py
+
+Request, store and authorization metrics of the backend, in the Prometheus text format.
+"""
+
+from __future__ import annotations
+
+import bisect
+import functools
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+import mlte.backend.api.codes as codes
+from mlte.backend.api.response_cache import ResponseCache
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+"""The media type of the Prometheus text exposition format."""
+
+DURATION_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+"""The upper bounds, in seconds, of the buckets of duration histograms."""
+
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+"""The upper bounds, in bytes, of the buckets of size histograms."""
+
+UNMATCHED_ROUTE = "unmatched"
+"""The route label of requests that match no route, to keep the number of labels bounded."""
+
+# -----------------------------------------------------------------------------
+# Metric Types
+# -----------------------------------------------------------------------------
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Format a set of labels for the text format."""
+    if len(names) == 0:
+        return ""
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    return "{" + ",".join(pairs) + "}"
+
+
+def _number(value: float) -> str:
+    """Format a number for the text format."""
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+class Counter:
+    """A count that only goes up, for each combination of label values."""
+
+    def __init__(self, name: str, help: str, labels: Sequence[str]) -> None:
+        """
+        Initialize the counter.
+        :param name: The metric name
+        :param help: The description of the metric
+        :param labels: The label names
+        """
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.values: Dict[Tuple[str, ...], float] = {}
+        """The count for each combination of label values."""
+
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values: str, amount: float = 1) -> None:
+        """
+        Increment the count for a combination of label values.
+        :param label_values: The label values, in the order of the label names
+        :param amount: The amount to add
+        """
+        with self._lock:
+            self.values[label_values] = (
+                self.values.get(label_values, 0) + amount
+            )
+
+    def clear(self) -> None:
+        """Reset all counts."""
+        with self._lock:
+            self.values.clear()
+
+    def render(self) -> List[str]:
+        """
+        Render the counter in the text format.
+        :return: The lines of the metric family
+        """
+        lines = [
+            f"# HELP {self.name} {self.help}",
+            f"# TYPE {self.name} counter",
+        ]
+        with self._lock:
+            for label_values, value in sorted(self.values.items()):
+                lines.append(
+                    f"{self.name}{_labels(self.labels, label_values)} {_number(value)}"
+                )
+        return lines
+
+
+class Histogram:
+    """The distribution of observed values, for each combination of label values."""
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str],
+        buckets: Sequence[float],
+    ) -> None:
+        """
+        Initialize the histogram.
+        :param name: The metric name
+        :param help: The description of the metric
+        :param labels: The label names
+        :param buckets: The upper bounds of the buckets, in increasing order
+        """
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        self.values: Dict[Tuple[str, ...], Tuple[List[int], float]] = {}
+        """The count in each bucket, and the sum of the values, for each combination of label values."""
+
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values: str) -> None:
+        """
+        Record a value for a combination of label values.
+        :param value: The observed value
+        :param label_values: The label values, in the order of the label names
+        """
+        # Values above all bounds only count towards the implicit +Inf bucket.
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self.values.get(
+                label_values, ([0] * (len(self.buckets) + 1), 0.0)
+            )
+            counts[index] += 1
+            self.values[label_values] = (counts, total + value)
+
+    def clear(self) -> None:
+        """Forget all observed values."""
+        with self._lock:
+            self.values.clear()
+
+    def render(self) -> List[str]:
+        """
+        Render the histogram in the text format, with cumulative buckets.
+        :return: The lines of the metric family
+        """
+        lines = [
+            f"# HELP {self.name} {self.help}",
+            f"# TYPE {self.name} histogram",
+        ]
+        names = self.labels + ("le",)
+        with self._lock:
+            for label_values, (counts, total) in sorted(self.values.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets + (None,), counts):
+                    cumulative += count
+                    le = "+Inf" if bound is None else _number(bound)
+                    lines.append(
+                        f"{self.name}_bucket{_labels(names, label_values + (le,))} {cumulative}"
+                    )
+                labels = _labels(self.labels, label_values)
+                lines.append(f"{self.name}_sum{labels} {_number(total)}")
+                lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+# -----------------------------------------------------------------------------
+# Backend Metrics
+# -----------------------------------------------------------------------------
+
+
+class Metrics:
+    """
+    The metrics collected by the backend. Nothing is collected while disabled,
+    so that the only overhead left is checking whether they are enabled.
+    Metrics are kept in memory by each backend process.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        """
+        Initialize the metrics.
+        :param enabled: Whether metrics are collected
+        """
+        self.enabled = enabled
+        """Whether metrics are collected."""
+
+        self.requests = Counter(
+            "mlte_http_requests_total",
+            "Requests served, by method, route and status code.",
+            ["method", "route", "status"],
+        )
+        self.request_duration = Histogram(
+            "mlte_http_request_duration_seconds",
+            "Time taken to serve requests, by method and route.",
+            ["method", "route"],
+            DURATION_BUCKETS,
+        )
+        self.request_size = Histogram(
+            "mlte_http_request_size_bytes",
+            "Size of request bodies as received, by method and route.",
+            ["method", "route"],
+            SIZE_BUCKETS,
+        )
+        self.response_size = Histogram(
+            "mlte_http_response_size_bytes",
+            "Size of response bodies as sent, by method and route.",
+            ["method", "route"],
+            SIZE_BUCKETS,
+        )
+        self.store_duration = Histogram(
+            "mlte_store_operation_duration_seconds",
+            "Time taken by store session operations, by store and operation.",
+            ["store", "operation"],
+            DURATION_BUCKETS,
+        )
+        self.store_errors = Counter(
+            "mlte_store_operation_errors_total",
+            "Store session operations that raised an error, by store and operation.",
+            ["store", "operation"],
+        )
+        self.auth_duration = Histogram(
+            "mlte_auth_duration_seconds",
+            "Time taken to authenticate and authorize requests, by whether the token user was cached.",
+            ["cached"],
+            DURATION_BUCKETS,
+        )
+
+    def _families(self) -> List[Any]:
+        """The metric families, in the order they are rendered."""
+        return [
+            self.requests,
+            self.request_duration,
+            self.request_size,
+            self.response_size,
+            self.store_duration,
+            self.store_errors,
+            self.auth_duration,
+        ]
+
+    def clear(self) -> None:
+        """Forget all collected values."""
+        for family in self._families():
+            family.clear()
+
+    def timed(self, session: Any, store: str) -> Any:
+        """
+        Wrap a store session so that its operations are timed, if enabled.
+        :param session: The store session
+        :param store: The name of the store, used as a label
+        :return: The session itself if disabled, otherwise a timing proxy to it
+        """
+        if not self.enabled:
+            return session
+        return TimedSession(session, store, self)
+
+    def render(
+        self,
+        pools: Dict[str, Dict[str, Any]] = {},
+        responses: Optional[ResponseCache] = None,
+    ) -> str:
+        """
+        Render all metrics in the text format.
+        :param pools: The connection pool statistics of each store that keeps a pool
+        :param responses: The cache of read endpoint responses, if any
+        :return: The exposition text
+        """
+        lines: List[str] = []
+        for family in self._families():
+            lines.extend(family.render())
+        lines.extend(_render_pools(pools))
+        if responses is not None:
+            lines.extend(_render_response_cache(responses))
+        return "\n".join(lines) + "\n"
+
+
+def _render_pools(pools: Dict[str, Dict[str, Any]]) -> List[str]:
+    """
+    Render connection pool statistics as gauges in the text format.
+    :param pools: The statistics of each store, as given by its `pool_status`
+    :return: The lines of the metric families
+    """
+    lines: List[str] = []
+    for stat in ["size", "checked_in", "checked_out", "overflow"]:
+        name = f"mlte_store_pool_{stat}"
+        values = [
+            (store, status[stat])
+            for store, status in sorted(pools.items())
+            if stat in status
+        ]
+        if len(values) == 0:
+            continue
+        lines.append(
+            f"# HELP {name} Connection pool {stat.replace('_', ' ')} count, by store."
+        )
+        lines.append(f"# TYPE {name} gauge")
+        for store, value in values:
+            lines.append(f"{name}{_labels(['store'], [store])} {value}")
+    return lines
+
+
+def _render_response_cache(responses: ResponseCache) -> List[str]:
+    """
+    Render the counters of the response cache in the text format.
+    :param responses: The cache
+    :return: The lines of the metric families
+    """
+    lines: List[str] = []
+    for name, type, help, value in [
+        (
+            "mlte_response_cache_hits_total",
+            "counter",
+            "Read endpoint responses served from the cache.",
+            responses.hits,
+        ),
+        (
+            "mlte_response_cache_misses_total",
+            "counter",
+            "Read endpoint responses read from the store and cached.",
+            responses.misses,
+        ),
+        (
+            "mlte_response_cache_entries",
+            "gauge",
+            "Responses in the cache.",
+            len(responses.entries),
+        ),
+        (
+            "mlte_response_cache_bytes",
+            "gauge",
+            "Total size of the responses in the cache.",
+            responses.size,
+        ),
+    ]:
+        lines.extend(
+            [
+                f"# HELP {name} {help}",
+                f"# TYPE {name} {type}",
+                f"{name} {value}",
+            ]
+        )
+    return lines
+
+
+class TimedSession:
+    """
+    A proxy to a store session that times every call to the methods of the
+    session, and of its mappers in the case of user store sessions.
+    """
+
+    def __init__(
+        self, target: Any, store: str, metrics: Metrics, prefix: str = ""
+    ) -> None:
+        """
+        Initialize the proxy.
+        :param target: The session, or mapper, whose methods are timed
+        :param store: The name of the store, used as a label
+        :param metrics: The metrics the timings are recorded in
+        :param prefix: The prefix of the operation names, for mappers
+        """
+        self._target = target
+        self._store = store
+        self._metrics = metrics
+        self._prefix = prefix
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._target, name)
+        if name.endswith("_mapper"):
+            return TimedSession(
+                attribute, self._store, self._metrics, f"{name}."
+            )
+        if name.startswith("_") or not callable(attribute):
+            return attribute
+
+        operation = f"{self._prefix}{name}"
+        metrics = self._metrics
+        store = self._store
+
+        @functools.wraps(attribute)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return attribute(*args, **kwargs)
+            except Exception:
+                metrics.store_errors.inc(store, operation)
+                raise
+            finally:
+                metrics.store_duration.observe(
+                    time.perf_counter() - start, store, operation
+                )
+
+        return timed
+
+
+# -----------------------------------------------------------------------------
+# Middleware
+# -----------------------------------------------------------------------------
+
+
+class MetricsMiddleware:
+    """
+    Records the count, duration and body sizes of requests by route, while
+    metrics are enabled. Routes are labeled by their path template, e.g.
+    `/api/model/{model_id}`, so that there is one series per endpoint.
+    """
+
+    def __init__(self, app: ASGIApp, metrics: Metrics) -> None:
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope["type"] != "http" or not self.metrics.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        sizes = {"request": 0, "response": 0}
+        # Errors raised before a response starts are turned into one by the server.
+        status = {"code": codes.INTERNAL_ERROR}
+
+        async def counting_receive() -> Message:
+            message = await receive()
+            if message["type"] == "http.request":
+                sizes["request"] += len(message.get("body", b""))
+            return message
+
+        async def counting_send(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            elif message["type"] == "http.response.body":
+                sizes["response"] += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, counting_receive, counting_send)
+        finally:
+            # The router leaves the matched route in the scope.
+            route = scope.get("route")
+            path = getattr(route, "path", UNMATCHED_ROUTE)
+            method = scope["method"]
+            self.metrics.requests.inc(method, path, str(status["code"]))
+            self.metrics.request_duration.observe(
+                time.perf_counter() - start, method, path
+            )
+            self.metrics.request_size.observe(sizes["request"], method, path)
+            self.metrics.response_size.observe(sizes["response"], method, path)
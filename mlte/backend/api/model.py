@@ -8,9 +8,12 @@ for additional meta-models like these. This worked well for write request;
 should the other endpoints be refactored to look more like this one?
 """
 
-from pydantic import BaseModel
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
 
 from mlte.artifact.model import ArtifactModel
+from mlte.store.artifact.query import Query
 
 USER_ME_ID = "me"
 """Special ID used to identify the currently logged in user."""
@@ -34,3 +37,36 @@ class WriteArtifactResponse(BaseModel):
 
     artifact: ArtifactModel
     """The model for the artifact that was written."""
+
+
+class WriteArtifactsRequest(BaseModel):
+    """Defines the data in a POST request to write a batch of artifacts."""
+
+    artifacts: List[ArtifactModel]
+    """The models for the artifacts to write."""
+
+    force: bool = False
+    """Indicates that existing artifacts may be overwritten."""
+
+    parents: bool = False
+    """Indicates whether organizational elements should be created."""
+
+
+class WriteArtifactsResponse(BaseModel):
+    """Defines the data in a response to writing a batch of artifacts."""
+
+    artifacts: List[ArtifactModel]
+    """The models for the artifacts that were written."""
+
+
+class SearchArtifactsPageRequest(BaseModel):
+    """Defines the data in a POST request to search a page of artifacts."""
+
+    query: Query = Query()
+    """The artifact query to apply."""
+
+    limit: int = Field(default=100, gt=0)
+    """The maximum number of artifacts in the page."""
+
+    cursor: Optional[str] = None
+    """The cursor returned with the previous page, if any."""
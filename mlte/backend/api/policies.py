@@ -0,0 +1,68 @@
+"""
+mlte/backend/api/policies.py
+
+Keeps the access policies of models in sync with the models in the artifact store.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import List
+
+from mlte.backend.api import dependencies
+from mlte.backend.core.config import settings
+from mlte.backend.state import state
+from mlte.store.user import policy
+from mlte.store.user.policy import Policy
+from mlte.user.model import ResourceType
+
+
+def reconcile_model_policies() -> List[str]:
+    """
+    Create the missing policies of all models, e.g. for models created without
+    the API, and remember all models as having policies.
+    :return: The ids of the models whose policies were created or completed
+    """
+    with dependencies.artifact_store_session() as artifact_store:
+        with dependencies.user_store_session() as user_store:
+            completed = policy.create_model_policies_if_needed(
+                artifact_store, user_store
+            )
+            models = artifact_store.list_models()
+    if completed:
+        state.authorized_users.clear()
+        logging.info(f"Created missing policies for models: {completed}")
+    state.models_with_policies = set(models)
+    return completed
+
+
+def ensure_model_policy(model_id: str) -> None:
+    """
+    Create the policy of a model if it is missing, e.g. for a model created
+    implicitly by writing an artifact to it. Unless MODEL_POLICY_CACHE is off,
+    only checks the user store the first time each model is seen.
+    :param model_id: The model identifier
+    """
+    if settings.MODEL_POLICY_CACHE and model_id in state.models_with_policies:
+        return
+    with dependencies.user_store_session() as user_store:
+        if not Policy.is_stored(ResourceType.MODEL, model_id, user_store):
+            Policy.complete(ResourceType.MODEL, model_id, user_store)
+            state.authorized_users.clear()
+    state.models_with_policies.add(model_id)
+
+
+def remember_model_policy(model_id: str) -> None:
+    """
+    Remember a model as having a policy, once it is created.
+    :param model_id: The model identifier
+    """
+    state.models_with_policies.add(model_id)
+
+
+def forget_model_policy(model_id: str) -> None:
+    """
+    Stop remembering a model as having a policy, once it is removed.
+    :param model_id: The model identifier
+    """
+    state.models_with_policies.discard(model_id)
@@ -0,0 +1,216 @@
+"""
+mlte/backend/api/response_cache.py
+
+Cache of the serialized responses of read endpoints.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Set, Tuple
+
+from fastapi import Response
+
+DEFAULT_CACHE_ENTRIES = 1024
+"""The default maximum number of responses kept in the cache."""
+
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+"""The default maximum total size, in bytes, of the responses kept in the cache."""
+
+DEFAULT_CACHE_TTL = 10.0
+"""The default number of seconds a cached response is served before it is read again."""
+
+Scope = Tuple[Optional[str], Optional[str]]
+"""The model and version a response was read from; None for responses above that level."""
+
+MODELS: Scope = (None, None)
+"""The scope of responses about the set of models."""
+
+
+def model_scope(model_id: str) -> Scope:
+    """
+    Get the scope of responses about a model, e.g. its versions.
+    :param model_id: The model identifier
+    :return: The scope
+    """
+    return (model_id, None)
+
+
+def version_scope(model_id: str, version_id: str) -> Scope:
+    """
+    Get the scope of responses about a version, e.g. its artifacts.
+    :param model_id: The model identifier
+    :param version_id: The version identifier
+    :return: The scope
+    """
+    return (model_id, version_id)
+
+
+class ResponseCache:
+    """
+    A bounded LRU cache of the JSON bodies of read endpoint responses, keyed
+    by route and parameters. Each response belongs to the scope of the model
+    or version it was read from, so that write endpoints drop exactly the
+    responses they may have changed.
+
+    Endpoints check access before looking up the cache, so cached responses
+    are only served to users allowed to read them. Entries also expire after
+    a TTL, for changes made to the store by other processes, such as other
+    backend workers or scripts writing to the store directly.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_CACHE_ENTRIES,
+        max_bytes: int = DEFAULT_CACHE_BYTES,
+        ttl: float = DEFAULT_CACHE_TTL,
+    ) -> None:
+        """
+        Initialize the cache.
+        :param max_entries: The maximum number of responses kept; 0 disables the cache
+        :param max_bytes: The maximum total size of the responses kept
+        :param ttl: The number of seconds a cached response is served
+        """
+        self.max_entries = max_entries
+        """The maximum number of responses kept in the cache."""
+
+        self.max_bytes = max_bytes
+        """The maximum total size of the responses kept in the cache."""
+
+        self.ttl = ttl
+        """The number of seconds a cached response is served."""
+
+        self.entries: OrderedDict[
+            Hashable, Tuple[float, Scope, bytes]
+        ] = OrderedDict()
+        """The expiration time, scope and body by key, least recently used first."""
+
+        self.scopes: Dict[Scope, Set[Hashable]] = {}
+        """The keys of the cached responses in each scope."""
+
+        self.size = 0
+        """The total size of the cached responses."""
+
+        self.hits = 0
+        """The number of responses served from the cache."""
+
+        self.misses = 0
+        """The number of responses that had to be read and serialized."""
+
+        self.generation = 0
+        """The number of invalidations so far, to tell responses read before one."""
+
+        self._lock = threading.Lock()
+
+    def get_or_create(
+        self, key: Hashable, scope: Scope, create: Callable[[], bytes]
+    ) -> bytes:
+        """
+        Get a cached response body, or create and cache it.
+        :param key: The route and parameters of the response
+        :param scope: The model and version the response is read from
+        :param create: The function that reads and serializes the response
+        :return: The response body
+        """
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] > time.time():
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+            generation = self.generation
+
+        # Read outside the lock; concurrent misses for the same key just both read.
+        body = create()
+        self.put(key, scope, body, generation)
+        return body
+
+    def put(
+        self,
+        key: Hashable,
+        scope: Scope,
+        body: bytes,
+        generation: Optional[int] = None,
+    ) -> None:
+        """
+        Cache a response body, unless it alone is over the size limit.
+        :param key: The route and parameters of the response
+        :param scope: The model and version the response is read from
+        :param body: The response body
+        :param generation: The generation of the cache when the body was read, if not now
+        """
+        if self.max_entries <= 0 or len(body) > self.max_bytes:
+            return
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                # A write may have changed the response while it was being read.
+                return
+            self._remove(key)
+            self.entries[key] = (time.time() + self.ttl, scope, body)
+            self.scopes.setdefault(scope, set()).add(key)
+            self.size += len(body)
+            while (
+                len(self.entries) > self.max_entries
+                or self.size > self.max_bytes
+            ):
+                self._remove(next(iter(self.entries)))
+
+    def invalidate(self, scope: Scope) -> None:
+        """
+        Drop the cached responses of a scope.
+        :param scope: The scope
+        """
+        with self._lock:
+            self.generation += 1
+            for key in list(self.scopes.get(scope, ())):
+                self._remove(key)
+
+    def invalidate_model(self, model_id: str) -> None:
+        """
+        Drop the cached responses of a model and all of its versions.
+        :param model_id: The model identifier
+        """
+        with self._lock:
+            self.generation += 1
+            for scope in [s for s in self.scopes if s[0] == model_id]:
+                for key in list(self.scopes.get(scope, ())):
+                    self._remove(key)
+
+    def clear(self) -> None:
+        """Drop all cached responses, and reset the counters."""
+        with self._lock:
+            self.entries.clear()
+            self.scopes.clear()
+            self.size = 0
+            self.hits = 0
+            self.misses = 0
+            self.generation += 1
+
+    def _remove(self, key: Hashable) -> None:
+        """Drop a cached response, if present. Must hold the lock."""
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return
+        _, scope, body = entry
+        self.size -= len(body)
+        keys = self.scopes[scope]
+        keys.discard(key)
+        if len(keys) == 0:
+            del self.scopes[scope]
+
+
+def json_response(
+    body: bytes, headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """
+    Build the response of an endpoint from a cached, already serialized body.
+    :param body: The JSON body
+    :param headers: Additional response headers
+    :return: The response
+    """
+    return Response(
+        content=body, media_type="application/json", headers=headers
+    )
@@ -5,24 +5,47 @@ Web application factory.
 """
 from __future__ import annotations
 
+import contextlib
+import logging
+from typing import AsyncContextManager, AsyncIterator, Callable, Optional
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
+import mlte.backend.util.origins as util
+from mlte.backend.api import policies
 from mlte.backend.api.api import api_router
 from mlte.backend.api.auth.http_auth_exception import (
     HTTPTokenException,
     json_content_exception_handler,
 )
+from mlte.backend.api.body_encoding import BodyEncodingMiddleware
+from mlte.backend.api.metrics import MetricsMiddleware
 from mlte.backend.core.config import settings
+from mlte.backend.state import state
+from mlte.store.artifact import factory as artifact_store_factory
+from mlte.store.base import StoreType, StoreURI
+from mlte.store.common import encoding, rdbs
+from mlte.store.user import factory as user_store_factory
+from mlte.user import passwords
+
+Lifespan = Callable[[FastAPI], AsyncContextManager[None]]
+"""A handler run by the server around the life of the app."""
 
 
-def create(allowed_origins: list[str] = []) -> FastAPI:
+def create(
+    allowed_origins: list[str] = [], lifespan: Optional[Lifespan] = None
+) -> FastAPI:
     """
     Create an instance of the application.
+    :param allowed_origins: A list of allowed CORS origins
+    :param lifespan: The handler that sets up the app state, if any
     :return: The app
     """
     app = FastAPI(
         title="MLTE Artifact Store",
+        lifespan=lifespan,
         docs_url=f"{settings.API_PREFIX}/docs",
         redoc_url=f"{settings.API_PREFIX}/redoc",
         openapi_url=f"{settings.API_PREFIX}/openapi.json",
@@ -42,9 +65,112 @@ def create(allowed_origins: list[str] = []) -> FastAPI:
             allow_headers=["*"],
         )
 
+    # Accept compressed and MessagePack bodies, and compress large responses
+    app.add_middleware(BodyEncodingMiddleware)
+    app.add_middleware(
+        GZipMiddleware,
+        minimum_size=encoding.GZIP_MINIMUM_SIZE,
+        compresslevel=encoding.GZIP_LEVEL,
+    )
+
+    # Record requests as sent and received, if metrics are enabled
+    app.add_middleware(MetricsMiddleware, metrics=state.metrics)
+
     # Add proper exception handling for Token responses, to be OAuth compliant.
     app.add_exception_handler(
         HTTPTokenException, json_content_exception_handler  # type: ignore
     )
 
     return app
+
+
+def create_from_settings() -> FastAPI:
+    """
+    Create an instance of the application configured from the settings, i.e.
+    from the environment, which opens its stores as the server starts it. This
+    is the factory servers import to run several workers, e.g.:
+
+        uvicorn --factory mlte.backend.app_factory:create_from_settings --workers 4
+
+    :return: The app
+    """
+    return create(
+        util.resolve_hosts(settings.ALLOWED_ORIGINS),
+        lifespan=store_lifespan(settings.STORE_URI, settings.JWT_SECRET_KEY),
+    )
+
+
+def store_lifespan(store_uri: str, jwt_secret: str) -> Lifespan:
+    """
+    Build a lifespan handler that opens the stores when the app starts, and
+    closes them when it stops. Each worker process runs its own.
+    :param store_uri: The store URI string
+    :param jwt_secret: A secret random string key used to sign tokens
+    :return: The lifespan handler
+    """
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        open_stores(store_uri, jwt_secret)
+        try:
+            yield
+        finally:
+            close_stores()
+
+    return lifespan
+
+
+# -----------------------------------------------------------------------------
+# Application State
+# -----------------------------------------------------------------------------
+
+
+def open_stores(store_uri: str, jwt_secret: str) -> None:
+    """
+    Open the artifact and user stores, and set them and the token key as the
+    global state of the backend.
+    :param store_uri: The store URI string
+    :param jwt_secret: A secret random string key used to sign tokens
+    """
+    # Apply connection pool settings not already given in the URI.
+    if StoreURI.from_string(store_uri).type == StoreType.RELATIONAL_DB:
+        store_uri = rdbs.with_pool_options(
+            store_uri,
+            {
+                "pool_size": settings.STORE_POOL_SIZE,
+                "max_overflow": settings.STORE_POOL_MAX_OVERFLOW,
+                "pool_pre_ping": settings.STORE_POOL_PRE_PING,
+                "pool_recycle": settings.STORE_POOL_RECYCLE,
+            },
+        )
+
+    # Initialize the backing artifact store instance
+    store = artifact_store_factory.create_store(store_uri)
+    if store.uri.type == StoreType.REMOTE_HTTP:
+        raise RuntimeError("Cannot run backend with remote HTTP store.")
+    state.set_artifact_store(store)
+
+    # Initialize the backing user store instance. Assume same store as artifact one for now.
+    # TODO: allow for separate config of uri here
+    logging.info(
+        f"Backend using store URI of type: {StoreURI.from_string(store_uri).type}"
+    )
+    user_store = user_store_factory.create_store(store_uri)
+    state.set_user_store(user_store)
+
+    # Set the token signing key.
+    state.set_token_key(jwt_secret)
+
+    # Set the cost of new password hashes; older ones are upgraded as users log in.
+    passwords.set_rounds(settings.PASSWORD_HASH_ROUNDS)
+
+    # Create the policies of models created without the API while the server was down.
+    # Models created later get theirs as they are created.
+    if settings.RECONCILE_POLICIES_ON_START:
+        policies.reconcile_model_policies()
+
+
+def close_stores() -> None:
+    """Close the stores in the global state of the backend."""
+    state.artifact_store.close()
+    state.user_store.close()
@@ -6,7 +6,7 @@ Configuration management for FastAPI application.
 
 from __future__ import annotations
 
-from typing import List
+from typing import List, Optional
 
 from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -53,6 +53,48 @@ class Settings(BaseSettings):
     STORE_URI: str = StoreURIPrefix.LOCAL_MEMORY[0]
     """The store URI string; defaults to in-memory store."""
 
+    STORE_POOL_SIZE: Optional[int] = None
+    """The number of connections kept open by a relational DB store; defaults to the driver default."""
+
+    STORE_POOL_MAX_OVERFLOW: Optional[int] = None
+    """The number of connections a relational DB store may open above the pool size."""
+
+    STORE_POOL_PRE_PING: Optional[bool] = None
+    """Whether pooled connections to a relational DB are tested before being used."""
+
+    STORE_POOL_RECYCLE: Optional[int] = None
+    """The number of seconds after which pooled connections to a relational DB are replaced."""
+
+    AUTH_CACHE_SIZE: int = 1024
+    """The number of access tokens whose authenticated user is cached; 0 disables the cache."""
+
+    AUTH_CACHE_TTL: float = 60.0
+    """The number of seconds a cached authenticated user is trusted before it is read again."""
+
+    MODEL_POLICY_CACHE: bool = True
+    """Whether models known to have their access policy are remembered, rather than checked on each write."""
+
+    RECONCILE_POLICIES_ON_START: bool = True
+    """Whether missing model policies are created as the backend starts, which lists all models, groups and permissions."""
+
+    RESPONSE_CACHE_ENTRIES: int = 1024
+    """The number of read endpoint responses cached by each backend process; 0 disables the cache."""
+
+    RESPONSE_CACHE_BYTES: int = 64 * 1024 * 1024
+    """The total size, in bytes, of the read endpoint responses cached by each backend process."""
+
+    RESPONSE_CACHE_TTL: float = 10.0
+    """The number of seconds a cached response is served, bounding how stale changes made by other processes get."""
+
+    PASSWORD_HASH_ROUNDS: int = 12
+    """The bcrypt cost factor for password hashes; hashes with another one are upgraded on login."""
+
+    PASSWORD_WORKERS: int = 4
+    """The number of threads that hash and verify passwords, off the event loop."""
+
+    METRICS_ENABLED: bool = False
+    """Whether request, store and authorization metrics are collected, and served at /metrics."""
+
     LOG_LEVEL: str = "ERROR"
     """The application log level; defaults to ERROR."""
 
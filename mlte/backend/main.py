@@ -4,7 +4,9 @@ mlte/backend/main.py
 Entry point for MLTE artifact store server.
 """
 
+import json
 import logging
+import os
 import sys
 from typing import Any, List
 
@@ -13,6 +15,7 @@ from pydantic.networks import HttpUrl
 
 import mlte.backend.app_factory as app_factory
 import mlte.backend.util.origins as util
+from mlte.backend.api import policies
 from mlte.backend.core.config import settings
 from mlte.backend.state import state
 from mlte.store.artifact import factory as artifact_store_factory
@@ -26,6 +29,13 @@ EXIT_FAILURE = 1
 # Wildcard for any URL.
 ANY_URL = "*"
 
+# The settings that turn off the caches each worker keeps, when there are several.
+WORKER_DISABLED_CACHES = {
+    "AUTH_CACHE_SIZE": "0",
+    "MODEL_POLICY_CACHE": "false",
+    "RESPONSE_CACHE_ENTRIES": "0",
+}
+
 
 def _validate_origins(allowed_origins: List[str]) -> List[Any]:
     """
@@ -43,6 +53,7 @@ def run(
     store_uri: str,
     allowed_origins: List[str],
     jwt_secret: str,
+    workers: int = 1,
 ) -> int:
     """
     Run the artifact store application.
@@ -51,40 +62,105 @@ def run(
     :param store_uri: The store URI string
     :param allowed_origins: A list of allowed CORS origins
     :param jwt_secret: A secret random string key used to sign tokens
+    :param workers: The number of worker processes serving requests
     :return: Return code
     """
     # TODO(Kyle): use log level from arguments.
     logging.basicConfig(level=logging.INFO)
 
-    # Resolve hosts and validate resolved origins.
-    allowed_origins = util.resolve_hosts(allowed_origins)
-    _ = _validate_origins(allowed_origins)
-
-    # The global FastAPI application
-    app = app_factory.create(allowed_origins)
+    # Validate resolved origins.
+    _ = _validate_origins(util.resolve_hosts(allowed_origins))
 
-    # Initialize the backing artifact store instance
-    store = artifact_store_factory.create_store(store_uri)
-    if store.uri.type == StoreType.REMOTE_HTTP:
-        raise RuntimeError("Cannot run backend with remote HTTP store.")
-    state.set_artifact_store(store)
+    if workers > 1:
+        return _run_workers(
+            host, port, store_uri, allowed_origins, jwt_secret, workers
+        )
 
-    # Initialize the backing user store instance. Assume same store as artifact one for now.
-    # TODO: allow for separate config of uri here
-    logging.info(
-        f"Backend using store URI of type: {StoreURI.from_string(store_uri).type}"
+    # The global FastAPI application, which opens the stores as it starts.
+    app = app_factory.create(
+        util.resolve_hosts(allowed_origins),
+        lifespan=app_factory.store_lifespan(store_uri, jwt_secret),
     )
-    user_store = user_store_factory.create_store(store_uri)
-    state.set_user_store(user_store)
-
-    # Set the token signing key.
-    state.set_token_key(jwt_secret)
 
     # Run the server
     uvicorn.run(app, host=host, port=port)
     return EXIT_SUCCESS
 
 
+def _run_workers(
+    host: str,
+    port: int,
+    store_uri: str,
+    allowed_origins: List[str],
+    jwt_secret: str,
+    workers: int,
+) -> int:
+    """
+    Run the artifact store application in several worker processes sharing a store.
+    :param host: The application host
+    :param port: The application port
+    :param store_uri: The store URI string
+    :param allowed_origins: A list of allowed CORS origins
+    :param jwt_secret: A secret random string key used to sign tokens
+    :param workers: The number of worker processes serving requests
+    :return: Return code
+    """
+    if StoreURI.from_string(store_uri).type == StoreType.LOCAL_MEMORY:
+        raise RuntimeError(
+            "Cannot run several backend workers with an in-memory store, as they would not share it."
+        )
+
+    # Create the tables, default user and model policies once, so workers
+    # starting at the same time do not race to create them.
+    app_factory.open_stores(store_uri, jwt_secret)
+    app_factory.close_stores()
+
+    # Workers are separate processes that build the app from the environment,
+    # resolving the origins themselves.
+    os.environ["STORE_URI"] = store_uri
+    os.environ["ALLOWED_ORIGINS"] = json.dumps(allowed_origins)
+    os.environ["JWT_SECRET_KEY"] = jwt_secret
+    # The policies were just reconciled, so workers need not list the whole store again.
+    os.environ["RECONCILE_POLICIES_ON_START"] = "false"
+    # Changes only invalidate the caches of the worker that made them, so the
+    # others would keep serving from theirs; unless explicitly enabled, they are off.
+    for name, disabled in WORKER_DISABLED_CACHES.items():
+        os.environ.setdefault(name, disabled)
+    uvicorn.run(
+        "mlte.backend.app_factory:create_from_settings",
+        factory=True,
+        host=host,
+        port=port,
+        workers=workers,
+    )
+    return EXIT_SUCCESS
+
+
+def reconcile(store_uri: str) -> int:
+    """
+    Create the missing policies of all models in a store, without running the server.
+    :param store_uri: The store URI string
+    :return: Return code
+    """
+    logging.basicConfig(level=logging.INFO)
+
+    store = artifact_store_factory.create_store(store_uri)
+    if store.uri.type == StoreType.REMOTE_HTTP:
+        raise RuntimeError(
+            "Cannot reconcile policies of a remote HTTP store; use its reconcile endpoint."
+        )
+    user_store = user_store_factory.create_store(store_uri)
+    state.set_artifact_store(store)
+    state.set_user_store(user_store)
+    try:
+        completed = policies.reconcile_model_policies()
+    finally:
+        store.close()
+        user_store.close()
+    logging.info(f"Created missing policies for {len(completed)} models.")
+    return EXIT_SUCCESS
+
+
 def main() -> int:
     return run(
         settings.BACKEND_HOST,
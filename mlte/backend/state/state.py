@@ -4,8 +4,12 @@ mlte/backend/state/state.py
 Globally-accessible application state.
 """
 
-from typing import Optional
+from typing import Optional, Set
 
+from mlte.backend.api.auth.user_cache import AuthorizedUserCache
+from mlte.backend.api.metrics import Metrics
+from mlte.backend.api.response_cache import ResponseCache
+from mlte.backend.core.config import settings
 from mlte.store.artifact.store import ArtifactStore
 from mlte.store.user.store import UserStore
 
@@ -23,17 +27,40 @@ class State:
         self._jwt_secret_key: str = ""
         """Secret key used to sign authentication tokens."""
 
+        self.authorized_users = AuthorizedUserCache(
+            settings.AUTH_CACHE_SIZE, settings.AUTH_CACHE_TTL
+        )
+        """The users authenticated by recently seen tokens."""
+
+        self.models_with_policies: Set[str] = set()
+        """The models known to have their access policy stored."""
+
+        self.responses = ResponseCache(
+            settings.RESPONSE_CACHE_ENTRIES,
+            settings.RESPONSE_CACHE_BYTES,
+            settings.RESPONSE_CACHE_TTL,
+        )
+        """The serialized responses of read endpoints."""
+
+        self.metrics = Metrics(settings.METRICS_ENABLED)
+        """The metrics collected by the backend, if enabled."""
+
     def set_artifact_store(self, store: ArtifactStore):
         """Set the globally-configured backend artifact store."""
         self._artifact_store = store
+        self.models_with_policies.clear()
+        self.responses.clear()
 
     def set_user_store(self, store: UserStore):
         """Set the globally-configured backend artifact store."""
         self._user_store = store
+        self.authorized_users.clear()
+        self.models_with_policies.clear()
 
     def set_token_key(self, token_key: str):
         """Sets the globally used token secret key."""
         self._jwt_secret_key = token_key
+        self.authorized_users.clear()
 
     @property
     def artifact_store(self) -> ArtifactStore:
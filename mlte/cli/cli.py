@@ -54,7 +54,11 @@ def _prepare_parser():
 
     # Attach subparsers
     subparser = base_parser.add_subparsers(help="Subcommands:")
-    for attach_to in [_attach_backend_parser, _attach_frontend_parser]:
+    for attach_to in [
+        _attach_backend_parser,
+        _attach_reconcile_parser,
+        _attach_frontend_parser,
+    ]:
         attach_to(subparser)
     return base_parser
 
@@ -99,6 +103,31 @@ def _attach_backend_parser(
         default=backend_settings.JWT_SECRET_KEY,
         help="A secret random string key used to sign tokens",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="The number of worker processes serving requests; requires a store they can share (default: 1)",
+    )
+
+
+def _attach_reconcile_parser(
+    subparser: argparse._SubParsersAction[argparse.ArgumentParser],
+):
+    """Attach the policy reconciliation subparser to the base parser."""
+    parser: argparse.ArgumentParser = subparser.add_parser(
+        "reconcile",
+        help="Create the missing access policies of all models in a backend store.",
+    )
+    parser.set_defaults(func=backend.reconcile)
+
+    # Additional arguments.
+    parser.add_argument(
+        "--store-uri",
+        type=str,
+        default=backend_settings.STORE_URI,
+        help=f"The URI for the backend store (default: {backend_settings.STORE_URI}).",
+    )
 
 
 def _attach_frontend_parser(
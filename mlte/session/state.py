@@ -51,7 +51,9 @@ class Session:
         self._context = context
 
     def _set_store(self, store: ArtifactStore) -> None:
-        """Set the session store."""
+        """Set the session store, closing the connections of the one it replaces."""
+        if self._store is not None and self._store is not store:
+            self._store.close()
         self._store = store
 
     def create_context(self):
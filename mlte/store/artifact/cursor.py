@@ -0,0 +1,72 @@
+"""
+mlte/store/artifact/cursor.py
+
+Continuation cursors for paged artifact listings.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from typing import List, Optional
+
+from pydantic import ValidationError
+
+import mlte.store.error as errors
+from mlte.artifact.model import ArtifactModel
+from mlte.model import BaseModel
+
+
+class ArtifactCursor(BaseModel):
+    """
+    The position in a listing after which the next page of artifacts starts.
+
+    Cursors are handed to clients as opaque strings; stores that order artifacts
+    by identifier only use the identifier, while stores that order them by
+    creation time use the timestamp as well.
+    """
+
+    identifier: str
+    """The identifier of the last artifact in the previous page."""
+
+    timestamp: Optional[int] = None
+    """The timestamp of the last artifact in the previous page, if used for ordering."""
+
+    def encode(self) -> str:
+        """
+        Encode the cursor as an opaque, URL-safe string.
+        :return: The encoded cursor
+        """
+        data = json.dumps(self.to_json(), separators=(",", ":"))
+        return base64.urlsafe_b64encode(data.encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def decode(cursor: str) -> ArtifactCursor:
+        """
+        Decode a cursor produced by encode().
+        :param cursor: The encoded cursor
+        :raises ErrorBadRequest: If the cursor is malformed
+        :return: The decoded cursor
+        """
+        try:
+            data = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+            return ArtifactCursor(**data)
+        except (
+            binascii.Error,
+            UnicodeError,
+            ValueError,
+            TypeError,
+            ValidationError,
+        ):
+            raise errors.ErrorBadRequest(f"Invalid cursor '{cursor}'")
+
+
+class ArtifactPage(BaseModel):
+    """A page of artifacts in a listing, with the cursor to continue it."""
+
+    artifacts: List[ArtifactModel]
+    """The artifacts in the page."""
+
+    next: Optional[str] = None
+    """The cursor for the next page, or None if this is the last one."""
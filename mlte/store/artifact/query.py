@@ -6,14 +6,19 @@ Query and filtering functionality for store operations.
 
 from __future__ import annotations
 
+import base64
+import binascii
 from enum import Enum
 from typing import List, Literal, Union
 
-from mlte.artifact.model import ArtifactModel
+from mlte.artifact.model import ArtifactHeaderModel, ArtifactModel
 from mlte.artifact.type import ArtifactType
 from mlte.model import BaseModel
 
 # A type alias
+# NOTE: All filters can be evaluated against an artifact header alone through
+# match_header(), which allows stores to answer queries from their indexes
+# without loading the artifact bodies.
 Filter = Union[
     "ArtifactIdentifierFilter",
     "ArtifactTypeFilter",
@@ -60,7 +65,10 @@ class ArtifactIdentifierFilter(BaseModel):
     """The artifact identifier to match."""
 
     def match(self, artifact: ArtifactModel) -> bool:
-        return artifact.header.identifier == self.artifact_id
+        return self.match_header(artifact.header)
+
+    def match_header(self, header: ArtifactHeaderModel) -> bool:
+        return header.identifier == self.artifact_id
 
 
 class ArtifactTypeFilter(BaseModel):
@@ -73,7 +81,10 @@ class ArtifactTypeFilter(BaseModel):
     """The artifact type to match."""
 
     def match(self, artifact: ArtifactModel) -> bool:
-        return artifact.header.type == self.artifact_type
+        return self.match_header(artifact.header)
+
+    def match_header(self, header: ArtifactHeaderModel) -> bool:
+        return header.type == self.artifact_type
 
 
 class AllFilter(BaseModel):
@@ -85,6 +96,9 @@ class AllFilter(BaseModel):
     def match(self, _: ArtifactModel) -> bool:
         return True
 
+    def match_header(self, _: ArtifactHeaderModel) -> bool:
+        return True
+
 
 class NoneFilter(BaseModel):
     """A filter that matches no artifacts."""
@@ -95,6 +109,9 @@ class NoneFilter(BaseModel):
     def match(self, _: ArtifactModel) -> bool:
         return False
 
+    def match_header(self, _: ArtifactHeaderModel) -> bool:
+        return False
+
 
 class AndFilter(BaseModel):
     """A generic filter that implements a logical AND of filters."""
@@ -108,6 +125,9 @@ class AndFilter(BaseModel):
     def match(self, artifact: ArtifactModel) -> bool:
         return all(filter.match(artifact) for filter in self.filters)
 
+    def match_header(self, header: ArtifactHeaderModel) -> bool:
+        return all(filter.match_header(header) for filter in self.filters)
+
 
 class OrFilter(BaseModel):
     """A generic filter that implements a logical OR of filters."""
@@ -121,6 +141,9 @@ class OrFilter(BaseModel):
     def match(self, artifact: ArtifactModel) -> bool:
         return any(filter.match(artifact) for filter in self.filters)
 
+    def match_header(self, header: ArtifactHeaderModel) -> bool:
+        return any(filter.match_header(header) for filter in self.filters)
+
 
 class Query(BaseModel):
     """A Query object represents a query over MLTE artifacts."""
@@ -132,3 +155,33 @@ class Query(BaseModel):
 # Necessary for pydantic to resolve forward references
 AndFilter.model_rebuild()
 OrFilter.model_rebuild()
+
+# -----------------------------------------------------------------------------
+# Query Encoding
+# -----------------------------------------------------------------------------
+
+
+def encode_query(query: Query) -> str:
+    """
+    Encode a query as a URL-safe string, e.g. for a query parameter. Equal
+    queries always have the same encoding, so it can key caches.
+    :param query: The query
+    :return: The unpadded base64url encoding of the query's compact JSON
+    """
+    data = query.model_dump_json(exclude_none=True).encode("utf-8")
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def decode_query(encoded: str) -> Query:
+    """
+    Decode a query encoded by encode_query().
+    :param encoded: The encoded query
+    :return: The query
+    :raises ValueError: If the encoding is not that of a valid query
+    """
+    try:
+        data = base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4))
+    except (binascii.Error, ValueError) as e:
+        raise ValueError(f"Invalid query encoding: {e}") from e
+    # Pydantic's ValidationError is a ValueError.
+    return Query.model_validate_json(data)
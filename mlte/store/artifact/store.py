@@ -7,10 +7,12 @@ MLTE artifact store interface implementation.
 from __future__ import annotations
 
 import time
-from typing import List, Optional, cast
+from typing import Iterator, List, Optional, cast
 
-from mlte.artifact.model import ArtifactModel
+import mlte.store.error as errors
+from mlte.artifact.model import ArtifactHeaderModel, ArtifactModel
 from mlte.context.model import Model, ModelCreate, Version, VersionCreate
+from mlte.store.artifact.cursor import ArtifactPage
 from mlte.store.artifact.query import Query
 from mlte.store.base import ManagedSession, Store, StoreSession
 
@@ -184,6 +186,75 @@ class ArtifactStoreSession(StoreSession):
             "Cannot invoke method on abstract ArtifactStoreSession."
         )
 
+    def write_artifacts_with_header(
+        self,
+        model_id: str,
+        version_id: str,
+        artifacts: List[ArtifactModel],
+        *,
+        force: bool = False,
+        parents: bool = False,
+        user: Optional[str] = None,
+    ) -> List[ArtifactModel]:
+        """
+        Write a batch of artifacts, generating the timestamp and adding creator. Internally calls the actual write_artifacts implementation.
+        :param model_id: The identifier for the model
+        :param version_id: The identifier for the model version
+        :param artifacts: The artifacts
+        :param force: Overwrite artifacts if they already exist
+        :param parents: Indicates whether organizational elements
+        for artifacts should be implictly created (default: False)
+        """
+        timestamp = int(time.time())
+        for artifact in artifacts:
+            artifact.header.timestamp = timestamp
+            artifact.header.creator = user
+        return self.write_artifacts(
+            model_id,
+            version_id,
+            artifacts,
+            force=force,
+            parents=parents,
+        )
+
+    def write_artifacts(
+        self,
+        model_id: str,
+        version_id: str,
+        artifacts: List[ArtifactModel],
+        *,
+        force: bool = False,
+        parents: bool = False,
+    ) -> List[ArtifactModel]:
+        """
+        Write a batch of artifacts. If any of them already exists and force is not set, none are written.
+        Stores should override this with a native batch implementation; the default writes them one by one.
+        :param model_id: The identifier for the model
+        :param version_id: The identifier for the model version
+        :param artifacts: The artifacts
+        :param force: Overwrite artifacts if they already exist
+        :param parents: Indicates whether organizational elements
+        for artifacts should be implictly created (default: False)
+        :return: The written artifacts
+        """
+        if not force:
+            for artifact in artifacts:
+                try:
+                    self.read_artifact(
+                        model_id, version_id, artifact.header.identifier
+                    )
+                except errors.ErrorNotFound:
+                    continue
+                raise errors.ErrorAlreadyExists(
+                    f"Artifact '{artifact.header.identifier}'"
+                )
+        return [
+            self.write_artifact(
+                model_id, version_id, artifact, force=force, parents=parents
+            )
+            for artifact in artifacts
+        ]
+
     def read_artifact(
         self,
         model_id: str,
@@ -237,6 +308,70 @@ class ArtifactStoreSession(StoreSession):
             "Cannot invoke method on abstract ArtifactStoreSession."
         )
 
+    def list_artifact_headers(
+        self,
+        model_id: str,
+        version_id: str,
+        query: Query = Query(),
+    ) -> List[ArtifactHeaderModel]:
+        """
+        Read the headers of a collection of artifacts, optionally filtered, without loading their bodies.
+        :param model_id: The identifier for the model
+        :param version_id: The identifier for the model version
+        :param query: The artifact query to apply; filters are matched against the headers
+        :return: The headers of the artifacts that satisfy the filter
+        """
+        raise NotImplementedError(
+            "Cannot invoke method on abstract ArtifactStoreSession."
+        )
+
+    def search_artifacts_page(
+        self,
+        model_id: str,
+        version_id: str,
+        query: Query = Query(),
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> ArtifactPage:
+        """
+        Read a page of the artifacts that satisfy a query, in an order that is stable across pages.
+        The file system and memory stores page by identifier, the relational store by timestamp and then identifier.
+        :param model_id: The identifier for the model
+        :param version_id: The identifier for the model version
+        :param query: The artifact query to apply
+        :param limit: The maximum number of artifacts in the page
+        :param cursor: The cursor returned with the previous page, if any
+        :return: The page of artifacts, along with the cursor for the next one
+        """
+        raise NotImplementedError(
+            "Cannot invoke method on abstract ArtifactStoreSession."
+        )
+
+    def iter_artifacts(
+        self,
+        model_id: str,
+        version_id: str,
+        query: Query = Query(),
+        page_size: int = 100,
+    ) -> Iterator[ArtifactModel]:
+        """
+        Lazily iterate over all the artifacts that satisfy a query, loading one page at a time.
+        :param model_id: The identifier for the model
+        :param version_id: The identifier for the model version
+        :param query: The artifact query to apply
+        :param page_size: The number of artifacts loaded per page
+        :return: An iterator over the artifacts that satisfy the filter
+        """
+        cursor: Optional[str] = None
+        while True:
+            page = self.search_artifacts_page(
+                model_id, version_id, query, limit=page_size, cursor=cursor
+            )
+            yield from page.artifacts
+            if page.next is None:
+                return
+            cursor = page.next
+
     def delete_artifact(
         self,
         model_id: str,
@@ -5,15 +5,21 @@ Implementation of local file system artifact store.
 """
 from __future__ import annotations
 
+import bisect
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 import mlte.store.artifact.util as storeutil
 import mlte.store.error as errors
-from mlte.artifact.model import ArtifactModel
+from mlte.artifact.model import ArtifactHeaderModel, ArtifactModel
 from mlte.context.model import Model, ModelCreate, Version, VersionCreate
+from mlte.store.artifact.cursor import ArtifactCursor, ArtifactPage
 from mlte.store.artifact.query import Query
 from mlte.store.artifact.store import ArtifactStore, ArtifactStoreSession
+from mlte.store.artifact.underlying.manifest import (
+    ArtifactManifest,
+    ManifestEntry,
+)
 from mlte.store.base import StoreURI
 from mlte.store.common.fs import FileSystemStorage
 
@@ -36,12 +42,17 @@ class LocalFileSystemStore(ArtifactStore):
         )
         """The underlying storage for the store."""
 
+        self.manifest = ArtifactManifest(self.storage)
+        """The manifest of artifacts in each version, shared by all sessions."""
+
     def session(self) -> LocalFileSystemStoreSession:
         """
         Return a session handle for the store instance.
         :return: The session handle
         """
-        return LocalFileSystemStoreSession(storage=self.storage)
+        return LocalFileSystemStoreSession(
+            storage=self.storage, manifest=self.manifest
+        )
 
 
 # -----------------------------------------------------------------------------
@@ -52,10 +63,19 @@ class LocalFileSystemStore(ArtifactStore):
 class LocalFileSystemStoreSession(ArtifactStoreSession):
     """A local file-system implementation of the MLTE artifact store."""
 
-    def __init__(self, storage: FileSystemStorage) -> None:
+    def __init__(
+        self,
+        storage: FileSystemStorage,
+        manifest: Optional[ArtifactManifest] = None,
+    ) -> None:
         self.storage = storage
         """A reference to underlying storage."""
 
+        self.manifest = (
+            manifest if manifest is not None else ArtifactManifest(storage)
+        )
+        """The manifest of artifacts in each version."""
+
     def close(self) -> None:
         """Close the session."""
         # Closing a local FS session is a no-op.
@@ -185,34 +205,75 @@ class LocalFileSystemStoreSession(ArtifactStoreSession):
         if parents:
             storeutil.create_parents(self, model_id, version_id)
 
-        artifacts = self._get_version_artifacts(model_id, version_id)
-        if artifact.header.identifier in artifacts and not force:
+        self._ensure_model_exists(model_id)
+        self._ensure_version_exists(model_id, version_id)
+
+        artifact_path = self._artifact_path(
+            model_id, version_id, artifact.header.identifier
+        )
+        if artifact_path.exists() and not force:
             raise errors.ErrorAlreadyExists(
                 f"Artifact '{artifact.header.identifier}'"
             )
 
-        self.storage.write_json_to_file(
-            self._artifact_path(
-                model_id, version_id, artifact.header.identifier
-            ),
-            artifact.model_dump(),
+        self.storage.write_json_to_file(artifact_path, artifact.model_dump())
+        self.manifest.add(
+            self._base_artifact_path(model_id, version_id),
+            ManifestEntry.from_artifact(artifact, artifact_path.stat().st_size),
         )
         return artifact
 
+    def write_artifacts(
+        self,
+        model_id: str,
+        version_id: str,
+        artifacts: List[ArtifactModel],
+        *,
+        force: bool = False,
+        parents: bool = False,
+    ) -> List[ArtifactModel]:
+        identifiers = storeutil.get_batch_identifiers(artifacts)
+        if parents:
+            storeutil.create_parents(self, model_id, version_id)
+
+        self._ensure_model_exists(model_id)
+        self._ensure_version_exists(model_id, version_id)
+
+        artifact_paths = [
+            self._artifact_path(model_id, version_id, identifier)
+            for identifier in identifiers
+        ]
+        if not force:
+            for identifier, artifact_path in zip(identifiers, artifact_paths):
+                if artifact_path.exists():
+                    raise errors.ErrorAlreadyExists(f"Artifact '{identifier}'")
+
+        entries = []
+        for artifact, artifact_path in zip(artifacts, artifact_paths):
+            self.storage.write_json_to_file(
+                artifact_path, artifact.model_dump()
+            )
+            entries.append(
+                ManifestEntry.from_artifact(
+                    artifact, artifact_path.stat().st_size
+                )
+            )
+        self.manifest.add_all(
+            self._base_artifact_path(model_id, version_id), entries
+        )
+        return artifacts
+
     def read_artifact(
         self,
         model_id: str,
         version_id: str,
         artifact_id: str,
     ) -> ArtifactModel:
-        artifacts = self._get_version_artifacts(model_id, version_id)
+        self._ensure_model_exists(model_id)
+        self._ensure_version_exists(model_id, version_id)
 
-        self._ensure_artifact_exists(artifact_id, artifacts)
-        return ArtifactModel(
-            **self.storage.read_json_file(
-                self._artifact_path(model_id, version_id, artifact_id)
-            )
-        )
+        self._ensure_artifact_exists(model_id, version_id, artifact_id)
+        return self._read_artifact(model_id, version_id, artifact_id)
 
     def read_artifacts(
         self,
@@ -221,15 +282,11 @@ class LocalFileSystemStoreSession(ArtifactStoreSession):
         limit: int = 100,
         offset: int = 0,
     ) -> List[ArtifactModel]:
-        artifacts = self._get_version_artifacts(model_id, version_id)
+        entries = self._get_version_entries(model_id, version_id)
         return [
-            ArtifactModel(
-                **self.storage.read_json_file(
-                    self._artifact_path(model_id, version_id, artifact_id)
-                )
-            )
-            for artifact_id in artifacts
-        ][offset : offset + limit]
+            self._read_artifact(model_id, version_id, entry.identifier)
+            for entry in entries[offset : offset + limit]
+        ]
 
     def search_artifacts(
         self,
@@ -237,11 +294,65 @@ class LocalFileSystemStoreSession(ArtifactStoreSession):
         version_id: str,
         query: Query = Query(),
     ) -> List[ArtifactModel]:
-        artifacts = self.read_artifacts(model_id, version_id)
+        entries = self._get_version_entries(model_id, version_id)
+        return [
+            self._read_artifact(model_id, version_id, entry.identifier)
+            for entry in entries
+            if query.filter.match_header(entry.to_header())
+        ]
+
+    def list_artifact_headers(
+        self,
+        model_id: str,
+        version_id: str,
+        query: Query = Query(),
+    ) -> List[ArtifactHeaderModel]:
+        # Served from the manifest alone; no artifact file is opened.
+        headers = [
+            entry.to_header()
+            for entry in self._get_version_entries(model_id, version_id)
+        ]
         return [
-            artifact for artifact in artifacts if query.filter.match(artifact)
+            header for header in headers if query.filter.match_header(header)
         ]
 
+    def search_artifacts_page(
+        self,
+        model_id: str,
+        version_id: str,
+        query: Query = Query(),
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> ArtifactPage:
+        storeutil.check_page_limit(limit)
+        entries = self._get_version_entries(model_id, version_id)
+
+        # Entries are sorted by identifier, so the cursor stays valid if the artifact it points to is deleted.
+        start = 0
+        if cursor is not None:
+            start = bisect.bisect_right(
+                [entry.identifier for entry in entries],
+                ArtifactCursor.decode(cursor).identifier,
+            )
+
+        # Only the files of the artifacts in the page are read.
+        matches: List[ManifestEntry] = []
+        for entry in entries[start:]:
+            if query.filter.match_header(entry.to_header()):
+                matches.append(entry)
+                if len(matches) > limit:
+                    break
+        page = matches[:limit]
+        return ArtifactPage(
+            artifacts=[
+                self._read_artifact(model_id, version_id, entry.identifier)
+                for entry in page
+            ],
+            next=ArtifactCursor(identifier=page[-1].identifier).encode()
+            if len(matches) > limit
+            else None,
+        )
+
     def delete_artifact(
         self,
         model_id: str,
@@ -254,38 +365,58 @@ class LocalFileSystemStoreSession(ArtifactStoreSession):
                 model_id, version_id, artifact.header.identifier
             )
         )
+        self.manifest.remove(
+            self._base_artifact_path(model_id, version_id), artifact_id
+        )
         return artifact
 
+    def rebuild_manifest(self, model_id: str, version_id: str) -> None:
+        """
+        Rebuild the artifact manifest of a version from the stored artifacts.
+        :param model_id: The identifier for the model
+        :param version_id: The identifier for the version
+        """
+        self._ensure_model_exists(model_id)
+        self._ensure_version_exists(model_id, version_id)
+        self.manifest.rebuild(self._base_artifact_path(model_id, version_id))
+
     # -------------------------------------------------------------------------
     # Internal helpers.
     # -------------------------------------------------------------------------
 
     def _ensure_artifact_exists(
-        self, artifact_id: str, artifacts: List[str]
+        self, model_id: str, version_id: str, artifact_id: str
     ) -> None:
         """Throws an ErrorNotFound if the given artifact does not exist."""
-        if artifact_id not in artifacts:
+        if not self._artifact_path(model_id, version_id, artifact_id).exists():
             raise errors.ErrorNotFound(f"Artifact {artifact_id}")
 
-    def _get_version_artifacts(
+    def _read_artifact(
+        self, model_id: str, version_id: str, artifact_id: str
+    ) -> ArtifactModel:
+        """Parse a stored artifact."""
+        return ArtifactModel(
+            **self.storage.read_json_file(
+                self._artifact_path(model_id, version_id, artifact_id)
+            )
+        )
+
+    def _get_version_entries(
         self, model_id: str, version_id: str
-    ) -> List[str]:
+    ) -> List[ManifestEntry]:
         """
-        Get artifacts for a version from storage.
-         :param model_id: The identifier for the model
+        Get the manifest entries of the artifacts of a version.
+        :param model_id: The identifier for the model
         :param version_id: The identifier for the version
         :raises ErrorNotFound: If the required structural elements are not present
-        :return: The associated artifacts
+        :return: The entries, sorted by artifact identifier
         """
         self._ensure_model_exists(model_id)
         self._ensure_version_exists(model_id, version_id)
 
-        return [
-            a.stem
-            for a in self.storage.list_json_files(
-                self._base_artifact_path(model_id, version_id)
-            )
-        ]
+        return self.manifest.entries(
+            self._base_artifact_path(model_id, version_id)
+        )
 
     def _base_artifact_path(self, model_id: str, version_id: str) -> Path:
         """
@@ -7,44 +7,149 @@ Implementation of HTTP artifact store.
 from __future__ import annotations
 
 import typing
-from typing import List
-
-from mlte.artifact.model import ArtifactModel
-from mlte.backend.api.model import WriteArtifactRequest
+from typing import Any, Iterator, List, Optional
+
+import mlte.backend.api.codes as codes
+import mlte.store.artifact.util as storeutil
+from mlte.artifact.model import ArtifactHeaderModel, ArtifactModel
+from mlte.backend.api.model import (
+    SearchArtifactsPageRequest,
+    WriteArtifactRequest,
+    WriteArtifactsRequest,
+)
 from mlte.backend.core.config import settings
 from mlte.context.model import Model, ModelCreate, Version, VersionCreate
-from mlte.store.artifact.query import Query
+from mlte.store.artifact.cursor import ArtifactPage
+from mlte.store.artifact.query import Query, encode_query
 from mlte.store.artifact.store import ArtifactStore, ArtifactStoreSession
+from mlte.store.artifact.underlying.http_buffer import (
+    PendingWrite,
+    WriteBuffer,
+    parse_buffer_options,
+)
+from mlte.store.artifact.underlying.http_cache import (
+    DEFAULT_CACHE_SIZE,
+    ArtifactCache,
+    parse_cache_options,
+)
 from mlte.store.base import StoreURI
-from mlte.store.common.http_clients import OAuthHttpClient, RequestsClient
+from mlte.store.common import encoding
+from mlte.store.common.http_clients import (
+    OAuthHttpClient,
+    RequestsClient,
+    parse_client_options,
+)
 
 API_PREFIX = settings.API_PREFIX
 """API URL prefix."""
 
+WRITE_BATCH_SIZE = 1000
+"""Maximum number of buffered writes sent in a single batch write request."""
+
+MAX_ENCODED_QUERY_LENGTH = 2048
+"""Maximum length of a query encoded in a search URL; larger queries are sent in a POST body."""
+
 # -----------------------------------------------------------------------------
 # HttpArtifactStore
 # -----------------------------------------------------------------------------
 
 
 class HttpArtifactStore(ArtifactStore):
-    """A HTTP implementation of the MLTE artifact store."""
+    """
+    A HTTP implementation of the MLTE artifact store.
+
+    With buffered=true in the URI, artifact writes are queued and sent in batches
+    by a background thread; call flush() to wait for them, and close() when done.
+    Every other operation first waits until the buffered writes to the model and
+    version it targets are sent, so it can take as long as sending those writes;
+    listing models waits for all of them.
+    """
 
     def __init__(
-        self, uri: StoreURI, client: OAuthHttpClient = RequestsClient()
+        self, uri: StoreURI, client: Optional[OAuthHttpClient] = None
     ) -> None:
+        # Connection options in the URI configure the default client.
+        uri.uri, options = parse_client_options(uri.uri)
+        if client is None:
+            client = RequestsClient(**options)
+
         self.client = client
-        """The client for requests."""
+        """The client for requests, shared by all sessions so they reuse its connections."""
+
+        uri.uri, cache_options = parse_cache_options(uri.uri)
+        self.cache: Optional[ArtifactCache] = (
+            ArtifactCache(**cache_options)
+            if cache_options.get("cache_size", DEFAULT_CACHE_SIZE) > 0
+            else None
+        )
+        """The cache of read artifacts, shared by all sessions; None if disabled with cache_size=0."""
+
+        uri.uri, buffer_options = parse_buffer_options(uri.uri)
+        buffered = buffer_options.pop("buffered", False)
+        if buffer_options and not buffered:
+            raise RuntimeError(
+                f"Write buffer options require buffered=true: {', '.join(buffer_options)}"
+            )
 
         # Get credentials, if any, from the uri and into the client.
         uri.uri = self.client.process_credentials(uri.uri)
         super().__init__(uri=uri)
 
+        self.buffer: Optional[WriteBuffer] = (
+            WriteBuffer(
+                self._send_writes, batch_size=WRITE_BATCH_SIZE, **buffer_options
+            )
+            if buffered
+            else None
+        )
+        """The queue of artifact writes waiting to be sent, shared by all sessions; None if writes are not buffered."""
+
     def session(self) -> HttpArtifactStoreSession:  # type: ignore[override]
         """
         Return a session handle for the store instance.
         :return: The session handle
         """
-        return HttpArtifactStoreSession(url=self.uri.uri, client=self.client)
+        return HttpArtifactStoreSession(
+            url=self.uri.uri,
+            client=self.client,
+            cache=self.cache,
+            buffer=self.buffer,
+        )
+
+    def flush(self) -> None:
+        """
+        Send all buffered writes, if any, and wait until they are done.
+        :raises: The error of a failed buffered write, if any
+        """
+        if self.buffer is not None:
+            self.buffer.flush()
+
+    def close(self) -> None:
+        """
+        Send all buffered writes, if any, and close the connections to the remote store.
+        :raises: The error of a failed buffered write, if any
+        """
+        try:
+            if self.buffer is not None:
+                self.buffer.close()
+        finally:
+            self.client.close()
+
+    def _send_writes(
+        self,
+        model_id: str,
+        version_id: str,
+        artifacts: List[ArtifactModel],
+        force: bool,
+        parents: bool,
+    ) -> None:
+        """Send a batch of buffered writes, through a session that does not buffer them."""
+        session = HttpArtifactStoreSession(
+            url=self.uri.uri, client=self.client, cache=self.cache
+        )
+        session.write_artifacts(
+            model_id, version_id, artifacts, force=force, parents=parents
+        )
 
 
 # -----------------------------------------------------------------------------
@@ -55,17 +160,28 @@ class HttpArtifactStore(ArtifactStore):
 class HttpArtifactStoreSession(ArtifactStoreSession):
     """An HTTP implementation of the MLTE artifact store session."""
 
-    def __init__(self, *, url: str, client: OAuthHttpClient) -> None:
+    def __init__(
+        self,
+        *,
+        url: str,
+        client: OAuthHttpClient,
+        cache: Optional[ArtifactCache] = None,
+        buffer: Optional[WriteBuffer] = None,
+    ) -> None:
         self.url = url
         """The remote artifact store URL."""
 
         self.client = client
         """The client for HTTP requests."""
 
-        # Authenticate.
-        self.client.authenticate(
-            f"{self.url}{API_PREFIX}",
-        )
+        self.cache = cache
+        """The cache of read artifacts, if any."""
+
+        self.buffer = buffer
+        """The queue artifact writes are sent through, if they are buffered."""
+
+        # Authenticate, unless the client already holds a valid token from a previous session.
+        self.client.ensure_authenticated(f"{self.url}{API_PREFIX}")
 
     def close(self) -> None:
         """Close the session."""
@@ -77,60 +193,72 @@ class HttpArtifactStoreSession(ArtifactStoreSession):
     # -------------------------------------------------------------------------
 
     def create_model(self, model: ModelCreate) -> Model:
+        self._flush_writes(model.identifier)
         url = f"{self.url}{API_PREFIX}/model"
-        res = self.client.post(url, json=model.model_dump())
+        res = self.client.post(
+            url, **self.client.encode_json(model.model_dump())
+        )
         self.client.raise_for_response(res)
 
-        return Model(**res.json())
+        return Model(**self.client.decode_json(res))
 
     def read_model(self, model_id: str) -> Model:
+        self._flush_writes(model_id)
         url = f"{self.url}{API_PREFIX}/model/{model_id}"
         res = self.client.get(url)
         self.client.raise_for_response(res)
 
-        return Model(**res.json())
+        return Model(**self.client.decode_json(res))
 
     def list_models(self) -> List[str]:
+        self._flush_writes()
         url = f"{self.url}{API_PREFIX}/model"
         res = self.client.get(url)
         self.client.raise_for_response(res)
 
-        return typing.cast(List[str], res.json())
+        return typing.cast(List[str], self.client.decode_json(res))
 
     def delete_model(self, model_id: str) -> Model:
+        self._flush_writes(model_id)
         url = f"{self.url}{API_PREFIX}/model/{model_id}"
         res = self.client.delete(url)
         self.client.raise_for_response(res)
 
-        return Model(**res.json())
+        return Model(**self.client.decode_json(res))
 
     def create_version(self, model_id: str, version: VersionCreate) -> Version:
+        self._flush_writes(model_id, version.identifier)
         url = f"{self.url}{API_PREFIX}/model/{model_id}/version"
-        res = self.client.post(url, json=version.model_dump())
+        res = self.client.post(
+            url, **self.client.encode_json(version.model_dump())
+        )
         self.client.raise_for_response(res)
 
-        return Version(**res.json())
+        return Version(**self.client.decode_json(res))
 
     def read_version(self, model_id: str, version_id: str) -> Version:
+        self._flush_writes(model_id, version_id)
         url = f"{self.url}{API_PREFIX}/model/{model_id}/version/{version_id}"
         res = self.client.get(url)
         self.client.raise_for_response(res)
 
-        return Version(**res.json())
+        return Version(**self.client.decode_json(res))
 
     def list_versions(self, model_id: str) -> List[str]:
+        self._flush_writes(model_id)
         url = f"{self.url}{API_PREFIX}/model/{model_id}/version"
         res = self.client.get(url)
         self.client.raise_for_response(res)
 
-        return typing.cast(List[str], res.json())
+        return typing.cast(List[str], self.client.decode_json(res))
 
     def delete_version(self, model_id: str, version_id: str) -> Version:
+        self._flush_writes(model_id, version_id)
         url = f"{self.url}{API_PREFIX}/model/{model_id}/version/{version_id}"
         res = self.client.delete(url)
         self.client.raise_for_response(res)
 
-        return Version(**res.json())
+        return Version(**self.client.decode_json(res))
 
     # -------------------------------------------------------------------------
     # Artifacts
@@ -145,16 +273,67 @@ class HttpArtifactStoreSession(ArtifactStoreSession):
         force: bool = False,
         parents: bool = False,
     ) -> ArtifactModel:
+        if self.buffer is not None:
+            self._invalidate(model_id, version_id, artifact.header.identifier)
+            self.buffer.put(
+                PendingWrite(
+                    model=model_id,
+                    version=version_id,
+                    artifact=artifact,
+                    force=force,
+                    parents=parents,
+                )
+            )
+            return artifact
+
         url = f"{_url(self.url, model_id, version_id)}/artifact"
         res = self.client.post(
             url,
-            json=WriteArtifactRequest(
-                artifact=artifact, force=force, parents=parents
-            ).model_dump(),
+            **self.client.encode_json(
+                WriteArtifactRequest(
+                    artifact=artifact, force=force, parents=parents
+                ).model_dump()
+            ),
         )
         self.client.raise_for_response(res)
+        self._invalidate(model_id, version_id, artifact.header.identifier)
+
+        return ArtifactModel(**(self.client.decode_json(res)["artifact"]))
 
-        return ArtifactModel(**(res.json()["artifact"]))
+    def write_artifacts(
+        self,
+        model_id: str,
+        version_id: str,
+        artifacts: List[ArtifactModel],
+        *,
+        force: bool = False,
+        parents: bool = False,
+    ) -> List[ArtifactModel]:
+        if self.buffer is not None:
+            return [
+                self.write_artifact(
+                    model_id, version_id, artifact, force=force, parents=parents
+                )
+                for artifact in artifacts
+            ]
+
+        # Sent in a single request, so that the backend writes all of them or none.
+        url = f"{_url(self.url, model_id, version_id)}/artifact/batch"
+        res = self.client.post(
+            url,
+            **self.client.encode_json(
+                WriteArtifactsRequest(
+                    artifacts=artifacts, force=force, parents=parents
+                ).model_dump()
+            ),
+        )
+        self.client.raise_for_response(res)
+        for artifact in artifacts:
+            self._invalidate(model_id, version_id, artifact.header.identifier)
+        return [
+            ArtifactModel(**object)
+            for object in self.client.decode_json(res)["artifacts"]
+        ]
 
     def read_artifact(
         self,
@@ -162,11 +341,28 @@ class HttpArtifactStoreSession(ArtifactStoreSession):
         version_id: str,
         artifact_id: str,
     ) -> ArtifactModel:
+        self._flush_writes(model_id, version_id)
         url = f"{_url(self.url, model_id, version_id)}/artifact/{artifact_id}"
-        res = self.client.get(url)
+        if self.cache is None:
+            res = self.client.get(url)
+            self.client.raise_for_response(res)
+            return ArtifactModel(**self.client.decode_json(res))
+
+        # Revalidate the cached copy, if any; the server replies 304 without a body if it is current.
+        cached = self.cache.get(url)
+        headers = {} if cached is None else {"If-None-Match": cached[0]}
+        res = self.client.get(url, headers=headers)
+        if cached is not None and res.status_code == codes.NOT_MODIFIED:
+            return cached[1]
+        if res.status_code != codes.OK:
+            self.cache.invalidate(url)
         self.client.raise_for_response(res)
 
-        return ArtifactModel(**res.json())
+        artifact = ArtifactModel(**self.client.decode_json(res))
+        etag = res.headers.get("ETag")
+        if etag is not None:
+            self.cache.put(url, etag, artifact)
+        return artifact
 
     def read_artifacts(
         self,
@@ -175,11 +371,9 @@ class HttpArtifactStoreSession(ArtifactStoreSession):
         limit: int = 100,
         offset: int = 0,
     ) -> List[ArtifactModel]:
+        self._flush_writes(model_id, version_id)
         url = f"{_url(self.url, model_id, version_id)}/artifact?limit={limit}&offset={offset}"
-        res = self.client.get(url)
-        self.client.raise_for_response(res)
-
-        return [ArtifactModel(**object) for object in res.json()]
+        return list(self._stream_artifacts("GET", url))
 
     def search_artifacts(
         self,
@@ -187,12 +381,94 @@ class HttpArtifactStoreSession(ArtifactStoreSession):
         version_id: str,
         query: Query = Query(),
     ) -> List[ArtifactModel]:
-        # NOTE(Kyle): This operation always uses the "advanced search" functionality
-        url = f"{_url(self.url, model_id, version_id)}/artifact/search"
-        res = self.client.post(url, json=query.model_dump())
+        url = self._search_url(model_id, version_id, query)
+        if url is None or self.cache is None:
+            return list(self.iter_artifacts(model_id, version_id, query))
+
+        # Revalidate the cached results, if any, like read_artifact().
+        self._flush_writes(model_id, version_id)
+        cached = self.cache.get_results(url)
+        headers = {} if cached is None else {"If-None-Match": cached[0]}
+        res = self.client.get(url, headers=headers)
+        if cached is not None and res.status_code == codes.NOT_MODIFIED:
+            return cached[1]
+        if res.status_code != codes.OK:
+            self.cache.invalidate(url)
         self.client.raise_for_response(res)
 
-        return [ArtifactModel(**object) for object in res.json()]
+        artifacts = [
+            ArtifactModel(**object) for object in self.client.decode_json(res)
+        ]
+        etag = res.headers.get("ETag")
+        if etag is not None:
+            self.cache.put_results(url, etag, artifacts)
+        return artifacts
+
+    def list_artifact_headers(
+        self,
+        model_id: str,
+        version_id: str,
+        query: Query = Query(),
+    ) -> List[ArtifactHeaderModel]:
+        self._flush_writes(model_id, version_id)
+        url = f"{_url(self.url, model_id, version_id)}/artifact/search/headers"
+        res = self.client.post(
+            url, **self.client.encode_json(query.model_dump())
+        )
+        self.client.raise_for_response(res)
+
+        return [
+            ArtifactHeaderModel(**object)
+            for object in self.client.decode_json(res)
+        ]
+
+    def search_artifacts_page(
+        self,
+        model_id: str,
+        version_id: str,
+        query: Query = Query(),
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> ArtifactPage:
+        self._flush_writes(model_id, version_id)
+        # Cursors are opaque to the client; iter_artifacts() passes back the one the server returned
+        storeutil.check_page_limit(limit)
+        url = f"{_url(self.url, model_id, version_id)}/artifact/search/page"
+        res = self.client.post(
+            url,
+            **self.client.encode_json(
+                SearchArtifactsPageRequest(
+                    query=query, limit=limit, cursor=cursor
+                ).model_dump()
+            ),
+        )
+        self.client.raise_for_response(res)
+
+        return ArtifactPage(**self.client.decode_json(res))
+
+    def iter_artifacts(
+        self,
+        model_id: str,
+        version_id: str,
+        query: Query = Query(),
+        page_size: int = 100,
+    ) -> Iterator[ArtifactModel]:
+        """
+        Lazily iterate over all the artifacts that satisfy a query, parsing
+        each one as it arrives in a single streamed response. The server reads
+        them from its store a page at a time, so page_size is only validated.
+        """
+        storeutil.check_page_limit(page_size)
+        self._flush_writes(model_id, version_id)
+        url = self._search_url(model_id, version_id, query)
+        if url is not None:
+            yield from self._stream_artifacts("GET", url)
+            return
+        # NOTE(Kyle): This operation always uses the "advanced search" functionality
+        url = f"{_url(self.url, model_id, version_id)}/artifact/search"
+        yield from self._stream_artifacts(
+            "POST", url, **self.client.encode_json(query.model_dump())
+        )
 
     def delete_artifact(
         self,
@@ -200,11 +476,77 @@ class HttpArtifactStoreSession(ArtifactStoreSession):
         version_id: str,
         artifact_id: str,
     ) -> ArtifactModel:
+        self._flush_writes(model_id, version_id)
         url = f"{_url(self.url, model_id, version_id)}/artifact/{artifact_id}"
         res = self.client.delete(url)
         self.client.raise_for_response(res)
+        self._invalidate(model_id, version_id, artifact_id)
+
+        return ArtifactModel(**self.client.decode_json(res))
+
+    def _stream_artifacts(
+        self, method: str, url: str, **kwargs: Any
+    ) -> Iterator[ArtifactModel]:
+        """
+        Request artifacts as newline delimited JSON, and parse them one line
+        at a time as the response arrives.
+        :param method: The request method
+        :param url: The request URL
+        :return: An iterator over the artifacts
+        """
+        kwargs["headers"] = {
+            **kwargs.get("headers", {}),
+            "Accept": encoding.NDJSON_CONTENT_TYPE,
+        }
+        with self.client.stream(method, url, **kwargs) as res:
+            self.client.raise_for_response(res)
+            content_type = res.headers.get("content-type")
+            if (
+                encoding.media_type(content_type)
+                != encoding.NDJSON_CONTENT_TYPE
+            ):
+                # Servers that do not stream send the whole list at once.
+                for object in self.client.decode_json(res):
+                    yield ArtifactModel(**object)
+                return
+            for line in res.iter_lines():
+                if line:
+                    yield ArtifactModel.model_validate_json(line)
+
+    def _search_url(
+        self, model_id: str, version_id: str, query: Query
+    ) -> Optional[str]:
+        """
+        Get the URL of a search with the query encoded in it.
+        :param model_id: The model identifier
+        :param version_id: The version identifier
+        :param query: The artifact query
+        :return: The URL, or None if the query is too large to encode in it
+        """
+        encoded = encode_query(query)
+        if len(encoded) > MAX_ENCODED_QUERY_LENGTH:
+            return None
+        return f"{_url(self.url, model_id, version_id)}/artifact?q={encoded}"
+
+    def _flush_writes(
+        self, model_id: Optional[str] = None, version_id: Optional[str] = None
+    ) -> None:
+        """
+        Send the buffered writes, if any, so that other operations see their effects.
+        :param model_id: The model to only send the writes to, if given
+        :param version_id: The version to only send the writes to, if given
+        """
+        if self.buffer is not None:
+            self.buffer.flush(model_id, version_id)
 
-        return ArtifactModel(**res.json())
+    def _invalidate(
+        self, model_id: str, version_id: str, artifact_id: str
+    ) -> None:
+        """Drop the cached copy of an artifact this session changed, if any."""
+        if self.cache is not None:
+            self.cache.invalidate(
+                f"{_url(self.url, model_id, version_id)}/artifact/{artifact_id}"
+            )
 
 
 def _url(base: str, model_id: str, version_id: str) -> str:
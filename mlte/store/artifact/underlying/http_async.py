@@ -0,0 +1,346 @@
+"""
+mlte/store/artifact/underlying/http_async.py
+
+Implementation of the asyncio HTTP artifact store.
+"""
+
+from __future__ import annotations
+
+import time
+import typing
+from typing import Any, AsyncIterator, List, Optional
+
+import mlte.store.artifact.util as storeutil
+from mlte.artifact.model import ArtifactHeaderModel, ArtifactModel
+from mlte.backend.api.model import (
+    SearchArtifactsPageRequest,
+    WriteArtifactRequest,
+    WriteArtifactsRequest,
+)
+from mlte.context.model import Model, ModelCreate, Version, VersionCreate
+from mlte.store.artifact.cursor import ArtifactPage
+from mlte.store.artifact.query import Query
+from mlte.store.artifact.underlying.http import (
+    API_PREFIX,
+    HttpArtifactStore,
+    _url,
+)
+from mlte.store.base import Store, StoreURI
+from mlte.store.common.http_clients import (
+    AsyncHttpxClient,
+    RequestsClient,
+    parse_client_options,
+)
+
+# -----------------------------------------------------------------------------
+# AsyncHttpArtifactStore
+# -----------------------------------------------------------------------------
+
+
+class AsyncHttpArtifactStore(Store):
+    """
+    An asyncio HTTP implementation of the MLTE artifact store.
+
+    Its sessions expose awaitable versions of the ArtifactStoreSession methods,
+    so many artifacts can be written or read concurrently; the pool size of the
+    client bounds the number of requests in flight.
+    """
+
+    def __init__(
+        self, uri: StoreURI, client: Optional[AsyncHttpxClient] = None
+    ) -> None:
+        # Connection options in the URI configure the default client.
+        uri.uri, options = parse_client_options(uri.uri)
+        if client is None:
+            client = AsyncHttpxClient(**options)
+
+        self.client = client
+        """The client for requests, shared by all sessions so they reuse its connections and token."""
+
+        # Get credentials, if any, from the uri and into the client.
+        uri.uri = self.client.process_credentials(uri.uri)
+        super().__init__(uri=uri)
+
+        self._options = options
+        self._sync_store: Optional[HttpArtifactStore] = None
+
+    def session(self) -> AsyncHttpArtifactStoreSession:  # type: ignore[override]
+        """
+        Return a session handle for the store instance.
+        :return: The session handle
+        """
+        return AsyncHttpArtifactStoreSession(
+            url=self.uri.uri, client=self.client
+        )
+
+    @property
+    def sync_store(self) -> HttpArtifactStore:
+        """
+        A synchronous store for the same server, for code that needs an ArtifactStore,
+        such as artifact save and load hooks. It is created on first use.
+        """
+        if self._sync_store is None:
+            self._sync_store = HttpArtifactStore(
+                StoreURI.from_string(self.uri.uri),
+                RequestsClient(
+                    self.client.username, self.client.password, **self._options
+                ),
+            )
+        return self._sync_store
+
+    async def aclose(self) -> None:
+        """Close the connections to the remote store."""
+        await self.client.aclose()
+        if self._sync_store is not None:
+            self._sync_store.close()
+
+
+# -----------------------------------------------------------------------------
+# AsyncHttpArtifactStoreSession
+# -----------------------------------------------------------------------------
+
+
+class AsyncHttpArtifactStoreSession:
+    """
+    An asyncio HTTP implementation of the MLTE artifact store session,
+    with an awaitable version of each ArtifactStoreSession method.
+    """
+
+    def __init__(self, *, url: str, client: AsyncHttpxClient) -> None:
+        self.url = url
+        """The remote artifact store URL."""
+
+        self.client = client
+        """The client for HTTP requests."""
+
+    async def __aenter__(self) -> AsyncHttpArtifactStoreSession:
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, exc_tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the session."""
+        # Closing a remote HTTP session is a no-op.
+        pass
+
+    async def _send(self, method: str, url: str, **kwargs) -> Any:
+        """
+        Send a request, authenticating first unless the client already holds a valid token.
+        :param method: The HTTP method
+        :param url: The URL
+        :return: The decoded JSON response
+        :raises: Error in the event the request failed
+        """
+        await self.client.ensure_authenticated_async(f"{self.url}{API_PREFIX}")
+        res = await self.client.request(method, url, **kwargs)
+        self.client.raise_for_response(res)
+        return self.client.decode_json(res)
+
+    # -------------------------------------------------------------------------
+    # Structural Elements
+    # -------------------------------------------------------------------------
+
+    async def create_model(self, model: ModelCreate) -> Model:
+        url = f"{self.url}{API_PREFIX}/model"
+        return Model(
+            **await self._send(
+                "POST", url, **self.client.encode_json(model.model_dump())
+            )
+        )
+
+    async def read_model(self, model_id: str) -> Model:
+        url = f"{self.url}{API_PREFIX}/model/{model_id}"
+        return Model(**await self._send("GET", url))
+
+    async def list_models(self) -> List[str]:
+        url = f"{self.url}{API_PREFIX}/model"
+        return typing.cast(List[str], await self._send("GET", url))
+
+    async def delete_model(self, model_id: str) -> Model:
+        url = f"{self.url}{API_PREFIX}/model/{model_id}"
+        return Model(**await self._send("DELETE", url))
+
+    async def create_version(
+        self, model_id: str, version: VersionCreate
+    ) -> Version:
+        url = f"{self.url}{API_PREFIX}/model/{model_id}/version"
+        return Version(
+            **await self._send(
+                "POST", url, **self.client.encode_json(version.model_dump())
+            )
+        )
+
+    async def read_version(self, model_id: str, version_id: str) -> Version:
+        url = f"{self.url}{API_PREFIX}/model/{model_id}/version/{version_id}"
+        return Version(**await self._send("GET", url))
+
+    async def list_versions(self, model_id: str) -> List[str]:
+        url = f"{self.url}{API_PREFIX}/model/{model_id}/version"
+        return typing.cast(List[str], await self._send("GET", url))
+
+    async def delete_version(self, model_id: str, version_id: str) -> Version:
+        url = f"{self.url}{API_PREFIX}/model/{model_id}/version/{version_id}"
+        return Version(**await self._send("DELETE", url))
+
+    # -------------------------------------------------------------------------
+    # Artifacts
+    # -------------------------------------------------------------------------
+
+    async def write_artifact_with_header(
+        self,
+        model_id: str,
+        version_id: str,
+        artifact: ArtifactModel,
+        *,
+        force: bool = False,
+        parents: bool = False,
+        user: Optional[str] = None,
+    ) -> ArtifactModel:
+        """See ArtifactStoreSession.write_artifact_with_header()."""
+        artifact.header.timestamp = int(time.time())
+        artifact.header.creator = user
+        return await self.write_artifact(
+            model_id, version_id, artifact, force=force, parents=parents
+        )
+
+    async def write_artifact(
+        self,
+        model_id: str,
+        version_id: str,
+        artifact: ArtifactModel,
+        *,
+        force: bool = False,
+        parents: bool = False,
+    ) -> ArtifactModel:
+        url = f"{_url(self.url, model_id, version_id)}/artifact"
+        reply = await self._send(
+            "POST",
+            url,
+            **self.client.encode_json(
+                WriteArtifactRequest(
+                    artifact=artifact, force=force, parents=parents
+                ).model_dump()
+            ),
+        )
+        return ArtifactModel(**reply["artifact"])
+
+    async def write_artifacts(
+        self,
+        model_id: str,
+        version_id: str,
+        artifacts: List[ArtifactModel],
+        *,
+        force: bool = False,
+        parents: bool = False,
+    ) -> List[ArtifactModel]:
+        # Sent in a single request, so that the backend writes all of them or none.
+        url = f"{_url(self.url, model_id, version_id)}/artifact/batch"
+        reply = await self._send(
+            "POST",
+            url,
+            **self.client.encode_json(
+                WriteArtifactsRequest(
+                    artifacts=artifacts, force=force, parents=parents
+                ).model_dump()
+            ),
+        )
+        return [ArtifactModel(**object) for object in reply["artifacts"]]
+
+    async def read_artifact(
+        self,
+        model_id: str,
+        version_id: str,
+        artifact_id: str,
+    ) -> ArtifactModel:
+        url = f"{_url(self.url, model_id, version_id)}/artifact/{artifact_id}"
+        return ArtifactModel(**await self._send("GET", url))
+
+    async def read_artifacts(
+        self,
+        model_id: str,
+        version_id: str,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> List[ArtifactModel]:
+        url = f"{_url(self.url, model_id, version_id)}/artifact?limit={limit}&offset={offset}"
+        return [
+            ArtifactModel(**object) for object in await self._send("GET", url)
+        ]
+
+    async def search_artifacts(
+        self,
+        model_id: str,
+        version_id: str,
+        query: Query = Query(),
+    ) -> List[ArtifactModel]:
+        url = f"{_url(self.url, model_id, version_id)}/artifact/search"
+        return [
+            ArtifactModel(**object)
+            for object in await self._send(
+                "POST", url, **self.client.encode_json(query.model_dump())
+            )
+        ]
+
+    async def list_artifact_headers(
+        self,
+        model_id: str,
+        version_id: str,
+        query: Query = Query(),
+    ) -> List[ArtifactHeaderModel]:
+        url = f"{_url(self.url, model_id, version_id)}/artifact/search/headers"
+        return [
+            ArtifactHeaderModel(**object)
+            for object in await self._send(
+                "POST", url, **self.client.encode_json(query.model_dump())
+            )
+        ]
+
+    async def search_artifacts_page(
+        self,
+        model_id: str,
+        version_id: str,
+        query: Query = Query(),
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> ArtifactPage:
+        storeutil.check_page_limit(limit)
+        url = f"{_url(self.url, model_id, version_id)}/artifact/search/page"
+        reply = await self._send(
+            "POST",
+            url,
+            **self.client.encode_json(
+                SearchArtifactsPageRequest(
+                    query=query, limit=limit, cursor=cursor
+                ).model_dump()
+            ),
+        )
+        return ArtifactPage(**reply)
+
+    async def iter_artifacts(
+        self,
+        model_id: str,
+        version_id: str,
+        query: Query = Query(),
+        page_size: int = 100,
+    ) -> AsyncIterator[ArtifactModel]:
+        """See ArtifactStoreSession.iter_artifacts()."""
+        cursor: Optional[str] = None
+        while True:
+            page = await self.search_artifacts_page(
+                model_id, version_id, query, limit=page_size, cursor=cursor
+            )
+            for artifact in page.artifacts:
+                yield artifact
+            if page.next is None:
+                return
+            cursor = page.next
+
+    async def delete_artifact(
+        self,
+        model_id: str,
+        version_id: str,
+        artifact_id: str,
+    ) -> ArtifactModel:
+        url = f"{_url(self.url, model_id, version_id)}/artifact/{artifact_id}"
+        return ArtifactModel(**await self._send("DELETE", url))
@@ -0,0 +1,246 @@
+"""
+mlte/store/artifact/underlying/manifest.py
+
+Per-version artifact manifest used by the local file system artifact store.
+"""
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import ConfigDict, ValidationError
+
+from mlte.artifact.model import ArtifactHeaderModel, ArtifactModel
+from mlte.artifact.type import ArtifactType
+from mlte.model import BaseModel
+from mlte.store.common.fs import JsonFileStorage
+from mlte.value.model import ValueModel
+
+# -----------------------------------------------------------------------------
+# ManifestEntry
+# -----------------------------------------------------------------------------
+
+
+class ManifestEntry(BaseModel):
+    """The indexed metadata for a single stored artifact."""
+
+    identifier: str
+    """The unique identifier for the artifact."""
+
+    type: ArtifactType
+    """The type identfier for the artifact."""
+
+    timestamp: Optional[int] = -1
+    """The timestamp of creation of this artifact, as Unix time."""
+
+    creator: Optional[str] = None
+    """The user that created this artifact."""
+
+    measurement_type: Optional[str] = None
+    """The measurement type that produced the artifact, for values."""
+
+    size: int = 0
+    """The size in bytes of the stored artifact file."""
+
+    model_config = ConfigDict(use_enum_values=True)
+
+    @staticmethod
+    def from_artifact(artifact: ArtifactModel, size: int) -> ManifestEntry:
+        """
+        Build the manifest entry for an artifact.
+        :param artifact: The artifact being stored
+        :param size: The size in bytes of the file the artifact was stored in
+        :return: The manifest entry
+        """
+        return ManifestEntry(
+            identifier=artifact.header.identifier,
+            type=artifact.header.type,
+            timestamp=artifact.header.timestamp,
+            creator=artifact.header.creator,
+            measurement_type=artifact.body.metadata.measurement_type
+            if isinstance(artifact.body, ValueModel)
+            else None,
+            size=size,
+        )
+
+    def to_header(self) -> ArtifactHeaderModel:
+        """Get the artifact header described by this entry."""
+        return ArtifactHeaderModel(
+            identifier=self.identifier,
+            type=self.type,
+            timestamp=self.timestamp,
+            creator=self.creator,
+        )
+
+
+# -----------------------------------------------------------------------------
+# ArtifactManifest
+# -----------------------------------------------------------------------------
+
+
+class ArtifactManifest:
+    """
+    Maintains an index file inside each version folder with the header
+    information of every artifact in it, so that listings and header-based
+    queries do not need to open and parse every artifact file.
+
+    The manifest is reconciled against the artifact files in the folder every
+    time it is read, which rebuilds it for folders written by older versions
+    (or other processes) without it, and drops entries for removed files.
+    """
+
+    FILENAME = ".manifest"
+    """The name of the manifest file inside a version folder."""
+
+    FORMAT_VERSION = 1
+    """The version of the manifest file format."""
+
+    def __init__(self, storage: JsonFileStorage) -> None:
+        self.storage = storage
+        """The underlying storage the artifacts are kept in."""
+
+        self.lock = threading.RLock()
+        """Serializes read-modify-write cycles on manifests."""
+
+        self._cache: Dict[
+            Path, Tuple[Tuple[int, int], Dict[str, ManifestEntry]]
+        ] = {}
+        """Parsed manifests, keyed by path, along with the file stats they were loaded with."""
+
+    def entries(self, version_path: Path) -> List[ManifestEntry]:
+        """
+        Get the entries for all artifacts in a version folder.
+        :param version_path: The path to the version folder
+        :return: The entries, sorted by artifact identifier
+        """
+        with self.lock:
+            entries = self._load(version_path)
+            if self._reconcile(version_path, entries):
+                self._save(version_path, entries)
+            return [entries[key] for key in sorted(entries.keys())]
+
+    def add(self, version_path: Path, entry: ManifestEntry) -> None:
+        """
+        Add or replace the entry for an artifact.
+        :param version_path: The path to the version folder
+        :param entry: The entry to add
+        """
+        with self.lock:
+            entries = self._load(version_path)
+            entries[entry.identifier] = entry
+            self._save(version_path, entries)
+
+    def add_all(self, version_path: Path, entries: List[ManifestEntry]) -> None:
+        """
+        Add or replace the entries for several artifacts, saving the manifest once.
+        :param version_path: The path to the version folder
+        :param entries: The entries to add
+        """
+        with self.lock:
+            current = self._load(version_path)
+            current.update((entry.identifier, entry) for entry in entries)
+            self._save(version_path, current)
+
+    def remove(self, version_path: Path, artifact_id: str) -> None:
+        """
+        Remove the entry for an artifact, if present.
+        :param version_path: The path to the version folder
+        :param artifact_id: The identifier of the artifact
+        """
+        with self.lock:
+            entries = self._load(version_path)
+            if entries.pop(artifact_id, None) is not None:
+                self._save(version_path, entries)
+
+    def rebuild(self, version_path: Path) -> List[ManifestEntry]:
+        """
+        Discard the manifest of a version folder and build it again from the artifact files.
+        :param version_path: The path to the version folder
+        :return: The entries, sorted by artifact identifier
+        """
+        with self.lock:
+            entries: Dict[str, ManifestEntry] = {}
+            self._reconcile(version_path, entries)
+            self._save(version_path, entries)
+            return [entries[key] for key in sorted(entries.keys())]
+
+    # -------------------------------------------------------------------------
+    # Internal helpers.
+    # -------------------------------------------------------------------------
+
+    def _manifest_path(self, version_path: Path) -> Path:
+        """Get the path to the manifest file of a version folder."""
+        return Path(version_path, self.FILENAME)
+
+    def _load(self, version_path: Path) -> Dict[str, ManifestEntry]:
+        """Load the manifest of a version folder; a missing or unreadable manifest is loaded as empty."""
+        path = self._manifest_path(version_path)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            self._cache.pop(path, None)
+            return {}
+
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._cache.get(path)
+        if cached is not None and cached[0] == signature:
+            return dict(cached[1])
+
+        try:
+            data = self.storage.read_json_file(path)
+            if data.get("format") != self.FORMAT_VERSION:
+                return {}
+            entries = {
+                key: ManifestEntry(**value)
+                for key, value in data["entries"].items()
+            }
+        except (ValueError, KeyError, ValidationError):
+            # A corrupt manifest is rebuilt on reconciliation.
+            return {}
+
+        self._cache[path] = (signature, entries)
+        return dict(entries)
+
+    def _save(
+        self, version_path: Path, entries: Dict[str, ManifestEntry]
+    ) -> None:
+        """Write the manifest of a version folder."""
+        path = self._manifest_path(version_path)
+        self.storage.replace_json_file(
+            path,
+            {
+                "format": self.FORMAT_VERSION,
+                "entries": {
+                    key: entry.model_dump() for key, entry in entries.items()
+                },
+            },
+        )
+        stat = path.stat()
+        self._cache[path] = ((stat.st_mtime_ns, stat.st_size), dict(entries))
+
+    def _reconcile(
+        self, version_path: Path, entries: Dict[str, ManifestEntry]
+    ) -> bool:
+        """
+        Update the entries in place to match the artifact files in the folder.
+        Only files missing from the manifest are parsed.
+        :return: True if the entries were changed
+        """
+        files = {
+            self.storage.get_just_filename(path): path
+            for path in self.storage.list_json_files(version_path)
+        }
+
+        changed = False
+        for artifact_id in [key for key in entries if key not in files]:
+            del entries[artifact_id]
+            changed = True
+        for artifact_id, path in files.items():
+            if artifact_id not in entries:
+                artifact = ArtifactModel(**self.storage.read_json_file(path))
+                entries[artifact_id] = ManifestEntry.from_artifact(
+                    artifact, path.stat().st_size
+                )
+                changed = True
+        return changed
@@ -6,13 +6,15 @@ Implementation of in-memory artifact store.
 
 from __future__ import annotations
 
+import bisect
 from collections import OrderedDict
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import mlte.store.artifact.util as storeutil
 import mlte.store.error as errors
-from mlte.artifact.model import ArtifactModel
+from mlte.artifact.model import ArtifactHeaderModel, ArtifactModel
 from mlte.context.model import Model, ModelCreate, Version, VersionCreate
+from mlte.store.artifact.cursor import ArtifactCursor, ArtifactPage
 from mlte.store.artifact.query import Query
 from mlte.store.artifact.store import ArtifactStore, ArtifactStoreSession
 from mlte.store.base import StoreURI
@@ -195,6 +197,28 @@ class InMemoryStoreSession(ArtifactStoreSession):
         version.artifacts[artifact.header.identifier] = artifact
         return artifact
 
+    def write_artifacts(
+        self,
+        model_id: str,
+        version_id: str,
+        artifacts: List[ArtifactModel],
+        *,
+        force: bool = False,
+        parents: bool = False,
+    ) -> List[ArtifactModel]:
+        identifiers = storeutil.get_batch_identifiers(artifacts)
+        if parents:
+            storeutil.create_parents(self, model_id, version_id)
+
+        version = self._get_version_with_artifacts(model_id, version_id)
+
+        if not force:
+            for identifier in identifiers:
+                if identifier in version.artifacts:
+                    raise errors.ErrorAlreadyExists(f"Artifact '{identifier}'")
+        version.artifacts.update(zip(identifiers, artifacts))
+        return artifacts
+
     def read_artifact(
         self,
         model_id: str,
@@ -232,6 +256,47 @@ class InMemoryStoreSession(ArtifactStoreSession):
             if query.filter.match(artifact)
         ]
 
+    def list_artifact_headers(
+        self,
+        model_id: str,
+        version_id: str,
+        query: Query = Query(),
+    ) -> List[ArtifactHeaderModel]:
+        version = self._get_version_with_artifacts(model_id, version_id)
+        return [
+            artifact.header
+            for artifact in version.artifacts.values()
+            if query.filter.match_header(artifact.header)
+        ]
+
+    def search_artifacts_page(
+        self,
+        model_id: str,
+        version_id: str,
+        query: Query = Query(),
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> ArtifactPage:
+        storeutil.check_page_limit(limit)
+        version = self._get_version_with_artifacts(model_id, version_id)
+
+        # Pages are ordered by identifier, so the cursor stays valid if the artifact it points to is deleted.
+        identifiers = sorted(version.artifacts.keys())
+        start = 0
+        if cursor is not None:
+            start = bisect.bisect_right(
+                identifiers, ArtifactCursor.decode(cursor).identifier
+            )
+
+        matches: List[ArtifactModel] = []
+        for identifier in identifiers[start:]:
+            artifact = version.artifacts[identifier]
+            if query.filter.match(artifact):
+                matches.append(artifact)
+                if len(matches) > limit:
+                    break
+        return storeutil.make_page(matches, limit)
+
     def delete_artifact(
         self,
         model_id: str,
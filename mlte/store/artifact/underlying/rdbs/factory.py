@@ -42,6 +42,7 @@ from mlte.store.artifact.underlying.rdbs.metadata_spec import (
     DBValidatedSpec,
 )
 from mlte.store.artifact.underlying.rdbs.metadata_value import DBValue
+from mlte.store.common.compression import NO_COMPRESSION, Compression
 from mlte.validation.model import ValidatedSpecModel
 from mlte.value.model import ValueModel
 
@@ -55,10 +56,11 @@ def create_db_artifact(
     artifact_type_obj: DBArtifactType,
     version_id: int,
     session: Session,
+    compression: Compression = NO_COMPRESSION,
 ) -> typing.Union[
     DBSpec, DBValidatedSpec, DBNegotiationCard, DBReport, DBValue
 ]:
-    """Converts an internal model to its corresponding DB object for artifacts."""
+    """Converts an internal model to its corresponding DB object for artifacts; large payloads are compressed as configured."""
     artifact_header = DBArtifactHeader(
         identifier=artifact.header.identifier,
         type=artifact_type_obj,
@@ -90,7 +92,7 @@ def create_db_artifact(
     elif artifact.header.type == ArtifactType.VALUE:
         # Create a DBValue object and all its subpieces.
         value = typing.cast(ValueModel, artifact.body)
-        return create_value_db_from_model(value, artifact_header)
+        return create_value_db_from_model(value, artifact_header, compression)
     else:
         raise Exception(
             f"Unsupported artifact type for conversion: {artifact.header.type}"
@@ -102,6 +104,23 @@ def create_db_artifact(
 # -------------------------------------------------------------------------
 
 
+def create_header_from_db(
+    artifact_header_obj: DBArtifactHeader,
+) -> ArtifactHeaderModel:
+    """
+    Creates an artifact header model from the corresponding DB header, without touching the artifact body.
+
+    :param artifact_header_obj: A DBArtifactHeader object from the DB with header info.
+    :return: the DB data converted into an ArtifactHeaderModel.
+    """
+    return ArtifactHeaderModel(
+        identifier=artifact_header_obj.identifier,
+        type=ArtifactType(artifact_header_obj.type.name),
+        timestamp=artifact_header_obj.timestamp,
+        creator=artifact_header_obj.username,
+    )
+
+
 def create_artifact_from_db(
     artifact_header_obj: DBArtifactHeader, session: Session
 ) -> ArtifactModel:
@@ -112,12 +131,7 @@ def create_artifact_from_db(
     :param session: The DB session to use.
     :return: the DB data converted into an ArtifactModel.
     """
-    artifact_header = ArtifactHeaderModel(
-        identifier=artifact_header_obj.identifier,
-        type=ArtifactType(artifact_header_obj.type.name),
-        timestamp=artifact_header_obj.timestamp,
-        creator=artifact_header_obj.username,
-    )
+    artifact_header = create_header_from_db(artifact_header_obj)
 
     body: typing.Union[
         SpecModel,
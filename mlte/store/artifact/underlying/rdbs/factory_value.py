@@ -11,6 +11,11 @@ from mlte.evidence.metadata import EvidenceMetadata, Identifier
 from mlte.store.artifact.underlying.rdbs.metadata import DBArtifactHeader
 from mlte.store.artifact.underlying.rdbs.metadata_spec import DBEvidenceMetadata
 from mlte.store.artifact.underlying.rdbs.metadata_value import DBValue
+from mlte.store.common.compression import (
+    NO_COMPRESSION,
+    Compression,
+    decompress_text,
+)
 from mlte.value.model import ValueModel, ValueType, get_model_class
 
 # -------------------------------------------------------------------------
@@ -19,9 +24,11 @@ from mlte.value.model import ValueModel, ValueType, get_model_class
 
 
 def create_value_db_from_model(
-    value: ValueModel, artifact_header: DBArtifactHeader
+    value: ValueModel,
+    artifact_header: DBArtifactHeader,
+    compression: Compression = NO_COMPRESSION,
 ) -> DBValue:
-    """Creates the DB object from the corresponding internal model."""
+    """Creates the DB object from the corresponding internal model, compressing the value data if configured."""
     value_obj = DBValue(
         artifact_header=artifact_header,
         evidence_metadata=DBEvidenceMetadata(
@@ -31,7 +38,7 @@ def create_value_db_from_model(
         ),
         value_class=value.value_class,
         value_type=value.value.value_type.value,
-        data_json=json.dumps(value.value.to_json()),
+        data_json=compression.compress_text(json.dumps(value.value.to_json())),
     )
     return value_obj
 
@@ -45,7 +52,7 @@ def create_value_model_from_db(value_obj: DBValue) -> ValueModel:
         ),
         value_class=value_obj.value_class,
         value=get_model_class(ValueType(value_obj.value_type)).from_json(
-            json.loads(value_obj.data_json)
+            json.loads(decompress_text(value_obj.data_json))
         ),
     )
     return body
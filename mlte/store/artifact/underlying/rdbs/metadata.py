@@ -5,9 +5,19 @@ Definition of the metadata (DB schema) for the artifact store.
 """
 from __future__ import annotations
 
+import logging
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import BigInteger, ForeignKey, UniqueConstraint, select
+from sqlalchemy import (
+    BigInteger,
+    Engine,
+    ForeignKey,
+    Index,
+    UniqueConstraint,
+    exc,
+    inspect,
+    select,
+)
 from sqlalchemy.orm import (
     DeclarativeBase,
     Mapped,
@@ -123,10 +133,53 @@ class DBArtifactHeader(DBBase):
         back_populates="artifact_header", cascade="all, delete-orphan"
     )
 
+    __table_args__ = (
+        Index(
+            "ix_artifact_header_version_identifier",
+            "version_id",
+            "identifier",
+            unique=True,
+        ),
+        Index(
+            "ix_artifact_header_version_type_timestamp",
+            "version_id",
+            "type_id",
+            "timestamp",
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"ArtifactHeader(id={self.id!r}, identifier={self.identifier!r}, timestamp={self.timestamp!r}, type={self.type!r})"
 
 
+# -------------------------------------------------------------------------
+# Schema upgrades.
+# -------------------------------------------------------------------------
+
+
+def create_missing_indexes(engine: Engine):
+    """
+    Creates the indexes defined in the schema that are missing from existing tables, for DBs created
+    by earlier versions. Tables that don't exist yet are skipped, since they get all their indexes when
+    created. Safe to run on every startup.
+    """
+    inspector = inspect(engine)
+    for table in DBBase.metadata.tables.values():
+        if not inspector.has_table(table.name):
+            continue
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in existing:
+                continue
+            try:
+                index.create(engine, checkfirst=True)
+            except exc.IntegrityError:
+                # Data written by earlier versions may violate a new unique index; keep working without it.
+                logging.warning(
+                    f"Could not create unique index {index.name} on table {table.name}, due to duplicate rows."
+                )
+
+
 # -------------------------------------------------------------------------
 # Pre-filled table functions.
 # -------------------------------------------------------------------------
@@ -28,7 +28,7 @@ class DBNegotiationCard(DBBase):
     # General
     id: Mapped[int] = mapped_column(primary_key=True)
     artifact_header_id: Mapped[DBArtifactHeader] = mapped_column(
-        ForeignKey("artifact_header.id")
+        ForeignKey("artifact_header.id"), index=True
     )
     artifact_header: Mapped[DBArtifactHeader] = relationship(
         back_populates="body_negotiation_card",
@@ -117,7 +117,7 @@ class DBReport(DBBase):
     # General
     id: Mapped[int] = mapped_column(primary_key=True)
     artifact_header_id: Mapped[DBArtifactHeader] = mapped_column(
-        ForeignKey("artifact_header.id")
+        ForeignKey("artifact_header.id"), index=True
     )
     artifact_header: Mapped[DBArtifactHeader] = relationship(
         back_populates="body_report",
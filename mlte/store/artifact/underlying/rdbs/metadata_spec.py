@@ -27,7 +27,7 @@ class DBSpec(DBBase):
 
     id: Mapped[int] = mapped_column(primary_key=True)
     artifact_header_id: Mapped[DBArtifactHeader] = mapped_column(
-        ForeignKey("artifact_header.id")
+        ForeignKey("artifact_header.id"), index=True
     )
 
     artifact_header: Mapped[DBArtifactHeader] = relationship(
@@ -88,7 +88,7 @@ class DBValidatedSpec(DBBase):
 
     id: Mapped[int] = mapped_column(primary_key=True)
     artifact_header_id: Mapped[DBArtifactHeader] = mapped_column(
-        ForeignKey("artifact_header.id")
+        ForeignKey("artifact_header.id"), index=True
     )
     spec_id: Mapped[Optional[int]] = mapped_column(ForeignKey("spec.id"))
 
@@ -45,7 +45,7 @@ class DBValue(DBBase):
 
     id: Mapped[int] = mapped_column(primary_key=True)
     artifact_header_id: Mapped[DBArtifactHeader] = mapped_column(
-        ForeignKey("artifact_header.id")
+        ForeignKey("artifact_header.id"), index=True
     )
     value_class: Mapped[str]
     value_type: Mapped[str]
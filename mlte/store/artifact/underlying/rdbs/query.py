@@ -0,0 +1,61 @@
+"""
+mlte/store/artifact/underlying/rdbs/query.py
+
+Translation of artifact store queries into SQL expressions.
+"""
+from __future__ import annotations
+
+from typing import List, Optional
+
+from sqlalchemy import ColumnElement, and_, false, or_, true
+
+from mlte.store.artifact.query import (
+    AllFilter,
+    AndFilter,
+    ArtifactIdentifierFilter,
+    ArtifactTypeFilter,
+    Filter,
+    NoneFilter,
+    OrFilter,
+)
+from mlte.store.artifact.underlying.rdbs.metadata import (
+    DBArtifactHeader,
+    DBArtifactType,
+)
+
+
+def compile_filter(filter: Filter) -> Optional[ColumnElement[bool]]:
+    """
+    Translate a query filter into an SQL expression over artifact headers.
+    :param filter: The filter to translate
+    :return: The expression, or None if the filter (or any filter it is composed of) can't be translated
+    """
+    if isinstance(filter, AllFilter):
+        return true()
+    if isinstance(filter, NoneFilter):
+        return false()
+    if isinstance(filter, ArtifactIdentifierFilter):
+        return DBArtifactHeader.identifier == filter.artifact_id
+    if isinstance(filter, ArtifactTypeFilter):
+        return DBArtifactHeader.type.has(
+            DBArtifactType.name == filter.artifact_type
+        )
+    if isinstance(filter, AndFilter):
+        clauses = _compile_all(filter.filters)
+        return and_(true(), *clauses) if clauses is not None else None
+    if isinstance(filter, OrFilter):
+        clauses = _compile_all(filter.filters)
+        return or_(false(), *clauses) if clauses is not None else None
+    # Filters with no SQL translation are evaluated in Python by the store.
+    return None  # type: ignore[unreachable]
+
+
+def _compile_all(filters: List[Filter]) -> Optional[List[ColumnElement[bool]]]:
+    """Translate all filters in a composition, or return None if any of them can't be translated."""
+    clauses = []
+    for filter in filters:
+        clause = compile_filter(filter)
+        if clause is None:
+            return None
+        clauses.append(clause)
+    return clauses
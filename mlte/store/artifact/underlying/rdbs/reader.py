@@ -5,10 +5,12 @@ DB utils for getting artifact related data from the DB.
 """
 from __future__ import annotations
 
-from typing import List, Tuple, Union
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple, Union
 
-from sqlalchemy import ScalarResult, select
-from sqlalchemy.orm import Session
+from sqlalchemy import ColumnElement, and_, or_, select
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.sql.base import ExecutableOption
 
 import mlte.store.error as errors
 from mlte.artifact.model import ArtifactModel
@@ -24,12 +26,15 @@ from mlte.store.artifact.underlying.rdbs.metadata import (
 )
 from mlte.store.artifact.underlying.rdbs.metadata_nc import (
     DBDataClassification,
+    DBDataDescriptor,
+    DBGoalDescriptor,
     DBNegotiationCard,
     DBProblemType,
     DBReport,
 )
 from mlte.store.artifact.underlying.rdbs.metadata_spec import (
     DBProperty,
+    DBResult,
     DBSpec,
     DBValidatedSpec,
 )
@@ -57,6 +62,9 @@ class DBReader:
         ArtifactType.VALUE: DBValue,
     }
 
+    MAX_IN_CLAUSE_ITEMS = 500
+    """Maximum number of values sent in a single IN clause, to stay under DB parameter limits."""
+
     @staticmethod
     def get_model(model_id: str, session: Session) -> Tuple[Model, DBModel]:
         """Reads the model with the given identifier using the provided session, and returns a Model and DBModel object."""
@@ -125,22 +133,19 @@ class DBReader:
         Union[DBSpec, DBValidatedSpec, DBNegotiationCard, DBReport, DBValue],
     ]:
         """Reads the artifact with the given identifier using the provided session, and returns an internal object."""
-        # First get the class of the artifact we are trying to read, so we can use the ORM by passing the DB object type.
-        artifact_header_obj = DBReader.get_artifact_header(artifact_id, session)
+        artifact_header_obj = DBReader.get_artifact_header(
+            model_id, version_id, artifact_id, session
+        )
         artifact_type = ArtifactType(artifact_header_obj.type.name)
 
-        # Get artifact.
+        # Get artifact, using the ORM by passing the DB object type.
         artifact_class = DBReader.get_artifact_class(artifact_type)
         artifact_obj: Union[
             DBSpec, DBValidatedSpec, DBNegotiationCard, DBReport, DBValue
         ] = session.scalar(
             select(artifact_class)
-            .where(DBVersion.model_id == DBModel.id)
-            .where(DBVersion.name == version_id)
-            .where(DBModel.name == model_id)
             .where(DBArtifactHeader.id == artifact_class.artifact_header_id)
-            .where(DBArtifactHeader.identifier == artifact_id)
-            .where(DBArtifactHeader.version_id == DBVersion.id)
+            .where(DBArtifactHeader.id == artifact_header_obj.id)
         )
 
         if artifact_obj is None:
@@ -148,6 +153,7 @@ class DBReader:
                 f"Artifact with identifier {artifact_id}  and associated to model {model_id}, and version {version_id} was not found in the artifact store."
             )
         else:
+            DBReader.load_artifact_bodies([artifact_header_obj], session)
             return (
                 factory.create_artifact_from_db(artifact_header_obj, session),
                 artifact_obj,
@@ -161,44 +167,172 @@ class DBReader:
         session: Session,
     ) -> List[ArtifactModel]:
         """Loads and returns a list with all the artifacts of the given type, for the given model/version."""
-        artifact_class = DBReader.get_artifact_class(artifact_type)
-        artifact_objs: ScalarResult[
-            Union[DBSpec, DBValidatedSpec, DBNegotiationCard, DBReport, DBValue]
-        ] = session.scalars(
-            (
-                select(artifact_class)
-                .where(DBVersion.model_id == DBModel.id)
-                .where(DBVersion.name == version_id)
-                .where(DBModel.name == model_id)
-                .where(DBArtifactHeader.id == artifact_class.artifact_header_id)
-                .where(DBArtifactHeader.version_id == DBVersion.id)
-            )
+        header_objs = DBReader.get_artifact_headers(
+            model_id,
+            version_id,
+            session,
+            where=DBArtifactHeader.type.has(
+                DBArtifactType.name == artifact_type
+            ),
+        )
+        DBReader.load_artifact_bodies(header_objs, session)
+        return [
+            factory.create_artifact_from_db(header_obj, session)
+            for header_obj in header_objs
+        ]
+
+    @staticmethod
+    def get_artifacts(
+        model_id: str,
+        version_id: str,
+        session: Session,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        after: Optional[str] = None,
+        where: Optional[ColumnElement[bool]] = None,
+        after_timestamp: Optional[int] = None,
+    ) -> List[ArtifactModel]:
+        """
+        Loads and returns the artifacts in the given model/version, ordered by timestamp and then identifier.
+        The arguments are the same as for get_artifact_headers().
+        """
+        header_objs = DBReader.get_artifact_headers(
+            model_id,
+            version_id,
+            session,
+            limit=limit,
+            offset=offset,
+            after=after,
+            where=where,
+            after_timestamp=after_timestamp,
         )
-        artifacts = []
-        for artifact_obj in artifact_objs:
-            artifact = factory.create_artifact_from_db(
-                artifact_obj.artifact_header, session
+        DBReader.load_artifact_bodies(header_objs, session)
+        return [
+            factory.create_artifact_from_db(header_obj, session)
+            for header_obj in header_objs
+        ]
+
+    @staticmethod
+    def load_artifact_bodies(
+        header_objs: List[DBArtifactHeader], session: Session
+    ) -> None:
+        """
+        Eagerly loads the full bodies of the given artifact headers into the session, with one batch of
+        queries per artifact type present instead of one query per related row.
+        """
+        header_ids: Dict[str, List[int]] = defaultdict(list)
+        for header_obj in header_objs:
+            header_ids[header_obj.type.name].append(header_obj.id)
+
+        for type_name, ids in header_ids.items():
+            session.scalars(
+                select(DBArtifactHeader)
+                .where(DBArtifactHeader.id.in_(ids))
+                .options(*_get_load_options(ArtifactType(type_name)))
+            ).all()
+
+    @staticmethod
+    def get_artifact_headers(
+        model_id: str,
+        version_id: str,
+        session: Session,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        after: Optional[str] = None,
+        where: Optional[ColumnElement[bool]] = None,
+        after_timestamp: Optional[int] = None,
+    ) -> List[DBArtifactHeader]:
+        """
+        Loads the headers of the artifacts in the given model/version, ordered by timestamp and then identifier.
+
+        :param limit: The maximum number of headers to load, if any.
+        :param offset: The number of headers to skip.
+        :param after: An artifact identifier; only headers sorted after that artifact are loaded.
+        :param where: An additional condition over the headers, if any.
+        :param after_timestamp: The timestamp of the `after` artifact, if known; the position is then used
+        as is, without looking the artifact up, so it remains valid if the artifact was deleted.
+        :return: The list of headers in the requested page.
+        """
+        statement = (
+            select(DBArtifactHeader)
+            .options(joinedload(DBArtifactHeader.type))
+            .join(DBVersion, DBArtifactHeader.version_id == DBVersion.id)
+            .join(DBModel, DBVersion.model_id == DBModel.id)
+            .where(DBVersion.name == version_id)
+            .where(DBModel.name == model_id)
+        )
+        if after is not None and after_timestamp is None:
+            after_timestamp = session.scalar(
+                statement.with_only_columns(DBArtifactHeader.timestamp).where(
+                    DBArtifactHeader.identifier == after
+                )
+            )
+            if after_timestamp is None:
+                raise errors.ErrorNotFound(
+                    f"Artifact with identifier {after} and associated to model {model_id}, and version {version_id} was not found in the artifact store."
+                )
+        if after is not None:
+            statement = statement.where(
+                or_(
+                    DBArtifactHeader.timestamp > after_timestamp,
+                    and_(
+                        DBArtifactHeader.timestamp == after_timestamp,
+                        DBArtifactHeader.identifier > after,
+                    ),
+                )
             )
-            artifacts.append(artifact)
-        return artifacts
+        if where is not None:
+            statement = statement.where(where)
+        statement = statement.order_by(
+            DBArtifactHeader.timestamp, DBArtifactHeader.identifier
+        ).offset(offset)
+        if limit is not None:
+            statement = statement.limit(limit)
+        return list(session.scalars(statement))
 
     @staticmethod
     def get_artifact_header(
-        artifact_id: str, session: Session
+        model_id: str, version_id: str, artifact_id: str, session: Session
     ) -> DBArtifactHeader:
-        """Gets the artifact header object of the artifact identifier provided."""
+        """Gets the artifact header object of the artifact identifier provided, in the given model/version."""
         artifact_header_obj = session.scalar(
-            select(DBArtifactHeader).where(
-                DBArtifactHeader.identifier == artifact_id
-            )
+            select(DBArtifactHeader)
+            .options(joinedload(DBArtifactHeader.type))
+            .join(DBVersion, DBArtifactHeader.version_id == DBVersion.id)
+            .join(DBModel, DBVersion.model_id == DBModel.id)
+            .where(DBModel.name == model_id)
+            .where(DBVersion.name == version_id)
+            .where(DBArtifactHeader.identifier == artifact_id)
         )
         if artifact_header_obj is None:
             raise errors.ErrorNotFound(
-                f"Artifact with identifier {artifact_id} was not found in the artifact store."
+                f"Artifact with identifier {artifact_id} and associated to model {model_id}, and version {version_id} was not found in the artifact store."
             )
         else:
             return artifact_header_obj
 
+    @staticmethod
+    def get_artifact_headers_in(
+        version_id: int, artifact_ids: List[str], session: Session
+    ) -> List[DBArtifactHeader]:
+        """Gets the artifact header objects, out of the given artifact identifiers, that exist in the version with the given DB id."""
+        header_objs: List[DBArtifactHeader] = []
+        for start in range(0, len(artifact_ids), DBReader.MAX_IN_CLAUSE_ITEMS):
+            header_objs.extend(
+                session.scalars(
+                    select(DBArtifactHeader)
+                    .where(DBArtifactHeader.version_id == version_id)
+                    .where(
+                        DBArtifactHeader.identifier.in_(
+                            artifact_ids[
+                                start : start + DBReader.MAX_IN_CLAUSE_ITEMS
+                            ]
+                        )
+                    )
+                )
+            )
+        return header_objs
+
     @staticmethod
     def get_artifact_class(
         artifact_type: ArtifactType,
@@ -301,3 +435,94 @@ class DBReader:
         if artifact_type_obj is None:
             raise Exception(f"Unknown data classification requested: {type}")
         return artifact_type_obj
+
+
+# -------------------------------------------------------------------------
+# Eager loading strategies.
+# -------------------------------------------------------------------------
+
+
+def _get_load_options(artifact_type: ArtifactType) -> List[ExecutableOption]:
+    """
+    Gets the loader options that hydrate a full artifact of the given type from its header.
+    Collections are loaded with selectinload (one query per level, for any number of artifacts), and
+    many-to-one references with joinedload.
+    """
+    if artifact_type == ArtifactType.SPEC:
+        return [_spec_options(selectinload(DBArtifactHeader.body_spec))]
+    elif artifact_type == ArtifactType.VALIDATED_SPEC:
+        validated_spec = selectinload(DBArtifactHeader.body_validated_spec)
+        return [
+            validated_spec.selectinload(DBValidatedSpec.results).options(
+                joinedload(DBResult.evidence_metadata),
+                joinedload(DBResult.property),
+            ),
+            _spec_options(
+                validated_spec.joinedload(DBValidatedSpec.spec).options(
+                    joinedload(DBSpec.artifact_header)
+                )
+            ),
+        ]
+    elif artifact_type == ArtifactType.NEGOTIATION_CARD:
+        card = selectinload(DBArtifactHeader.body_negotiation_card)
+        return [
+            card.options(
+                joinedload(DBNegotiationCard.sys_problem_type),
+                joinedload(DBNegotiationCard.model_dev_resources),
+                joinedload(DBNegotiationCard.model_prod_interface_input_desc),
+                joinedload(DBNegotiationCard.model_prod_interface_output_desc),
+                joinedload(DBNegotiationCard.model_prod_resources),
+                selectinload(DBNegotiationCard.system_requirements),
+                _goal_options(selectinload(DBNegotiationCard.sys_goals)),
+                _data_options(selectinload(DBNegotiationCard.data_descriptors)),
+            )
+        ]
+    elif artifact_type == ArtifactType.REPORT:
+        report = selectinload(DBArtifactHeader.body_report)
+        return [
+            report.options(
+                joinedload(DBReport.summary_problem_type),
+                joinedload(DBReport.validated_spec).joinedload(
+                    DBValidatedSpec.artifact_header
+                ),
+                joinedload(
+                    DBReport.intended_reqs_model_prod_interface_input_desc
+                ),
+                joinedload(
+                    DBReport.intended_reqs_model_prod_interface_output_desc
+                ),
+                joinedload(DBReport.intended_reqs_model_prod_resources),
+                selectinload(DBReport.comments),
+                _goal_options(selectinload(DBReport.performance_goals)),
+                _data_options(selectinload(DBReport.data_descriptors)),
+            )
+        ]
+    elif artifact_type == ArtifactType.VALUE:
+        return [
+            selectinload(DBArtifactHeader.body_value).joinedload(
+                DBValue.evidence_metadata
+            )
+        ]
+    else:
+        raise Exception(f"Unsupported artifact type: {artifact_type}")
+
+
+def _spec_options(spec_load):
+    """Adds the loaders for the contents of a spec."""
+    return spec_load.selectinload(DBSpec.properties).selectinload(
+        DBProperty.conditions
+    )
+
+
+def _goal_options(goals_load):
+    """Adds the loaders for the contents of goal descriptors."""
+    return goals_load.selectinload(DBGoalDescriptor.metrics)
+
+
+def _data_options(data_load):
+    """Adds the loaders for the contents of data descriptors."""
+    return data_load.options(
+        joinedload(DBDataDescriptor.classification),
+        selectinload(DBDataDescriptor.labels),
+        selectinload(DBDataDescriptor.fields),
+    )
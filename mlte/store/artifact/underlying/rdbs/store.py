@@ -5,25 +5,25 @@ Implementation of relational database system artifact store.
 """
 from __future__ import annotations
 
-from typing import List
+from typing import Any, Dict, List, Optional
 
-import sqlalchemy
-import sqlalchemy.orm
-import sqlalchemy_utils
 from sqlalchemy import Engine, select
 from sqlalchemy.orm import Session
 
 import mlte.store.artifact.util as storeutil
 import mlte.store.error as errors
-from mlte.artifact.model import ArtifactModel
+from mlte.artifact.model import ArtifactHeaderModel, ArtifactModel
 from mlte.context.model import Model, ModelCreate, Version, VersionCreate
+from mlte.store.artifact.cursor import ArtifactCursor, ArtifactPage
 from mlte.store.artifact.query import Query
 from mlte.store.artifact.store import ArtifactStore, ArtifactStoreSession
 from mlte.store.artifact.underlying.rdbs import factory
 from mlte.store.artifact.underlying.rdbs.metadata import (
+    DBArtifactType,
     DBBase,
     DBModel,
     DBVersion,
+    create_missing_indexes,
     init_artifact_types,
 )
 from mlte.store.artifact.underlying.rdbs.metadata_nc import (
@@ -31,8 +31,15 @@ from mlte.store.artifact.underlying.rdbs.metadata_nc import (
     init_problem_types,
 )
 from mlte.store.artifact.underlying.rdbs.metadata_value import init_value_types
+from mlte.store.artifact.underlying.rdbs.query import compile_filter
 from mlte.store.artifact.underlying.rdbs.reader import DBReader
 from mlte.store.base import StoreURI
+from mlte.store.common import rdbs
+from mlte.store.common.compression import (
+    NO_COMPRESSION,
+    Compression,
+    parse_compression_options,
+)
 
 # -----------------------------------------------------------------------------
 # RelationalDBStore
@@ -45,12 +52,13 @@ class RelationalDBStore(ArtifactStore):
     def __init__(self, uri: StoreURI, **kwargs) -> None:
         super().__init__(uri=uri)
 
-        self.engine = sqlalchemy.create_engine(uri.uri, **kwargs)
-        """The underlying storage for the store."""
+        db_uri, compression = parse_compression_options(uri.uri)
+
+        self.compression = compression
+        """The compression applied to large text columns on write."""
 
-        # Create the DB if it doesn't exist already.
-        if not sqlalchemy_utils.database_exists(self.engine.url):
-            sqlalchemy_utils.create_database(self.engine.url)
+        self.engine = rdbs.create_engine(db_uri, **kwargs)
+        """The underlying storage for the store; owns the connection pool for the life of the store."""
 
         # Creates the DB items if they don't exist already.
         self._create_tables()
@@ -61,11 +69,25 @@ class RelationalDBStore(ArtifactStore):
         Return a session handle for the store instance.
         :return: The session handle
         """
-        return RelationalDBStoreSession(engine=self.engine)
+        return RelationalDBStoreSession(
+            engine=self.engine, compression=self.compression
+        )
+
+    def close(self) -> None:
+        """Close all pooled connections to the DB."""
+        self.engine.dispose()
+
+    def pool_status(self) -> Dict[str, Any]:
+        """
+        Get statistics about the connection pool of the store.
+        :return: The pool statistics
+        """
+        return rdbs.pool_status(self.engine)
 
     def _create_tables(self):
-        """Creates all items, if they don't exist already."""
+        """Creates all items, if they don't exist already, and upgrades the indexes of existing tables."""
         DBBase.metadata.create_all(self.engine)
+        create_missing_indexes(self.engine)
 
     def _init_tables(self):
         """Pre-populate tables."""
@@ -84,13 +106,20 @@ class RelationalDBStore(ArtifactStore):
 class RelationalDBStoreSession(ArtifactStoreSession):
     """A relational DB implementation of the MLTE artifact store session."""
 
-    def __init__(self, engine: Engine) -> None:
+    def __init__(
+        self, engine: Engine, compression: Compression = NO_COMPRESSION
+    ) -> None:
         self.engine = engine
         """A reference to underlying storage."""
 
+        self.compression = compression
+        """The compression applied to large text columns on write."""
+
     def close(self) -> None:
         """Close the session."""
-        self.engine.dispose()
+        # Each operation releases its connection back to the store's pool, so
+        # there is nothing to tear down here; the pool is kept for later sessions.
+        pass
 
     # -------------------------------------------------------------------------
     # Structural Elements
@@ -230,7 +259,11 @@ class RelationalDBStoreSession(ArtifactStoreSession):
 
             # Create the actual object.
             new_artifact_obj = factory.create_db_artifact(
-                artifact, artifact_type_obj, version_obj.id, session
+                artifact,
+                artifact_type_obj,
+                version_obj.id,
+                session,
+                compression=self.compression,
             )
 
             # Use session to add object.
@@ -238,6 +271,59 @@ class RelationalDBStoreSession(ArtifactStoreSession):
             session.commit()
             return artifact
 
+    def write_artifacts(
+        self,
+        model_id: str,
+        version_id: str,
+        artifacts: List[ArtifactModel],
+        *,
+        force: bool = False,
+        parents: bool = False,
+    ) -> List[ArtifactModel]:
+        identifiers = storeutil.get_batch_identifiers(artifacts)
+        if parents:
+            storeutil.create_parents(self, model_id, version_id)
+
+        with Session(self.engine) as session:
+            _, version_obj = DBReader.get_version(model_id, version_id, session)
+
+            # Check which artifacts already exist, with one query for the whole batch.
+            existing_objs = DBReader.get_artifact_headers_in(
+                version_obj.id, identifiers, session
+            )
+            if len(existing_objs) > 0:
+                if not force:
+                    raise errors.ErrorAlreadyExists(
+                        f"Artifact '{existing_objs[0].identifier}' already exists."
+                    )
+                # Remove the previous versions before inserting the new ones.
+                for header_obj in existing_objs:
+                    session.delete(header_obj)
+                session.flush()
+
+            # Create all objects, and insert them in a single transaction.
+            artifact_type_objs: Dict[str, DBArtifactType] = {}
+            new_artifact_objs = []
+            for artifact in artifacts:
+                if artifact.header.type not in artifact_type_objs:
+                    artifact_type_objs[
+                        artifact.header.type
+                    ] = DBReader.get_artifact_type(
+                        artifact.header.type, session
+                    )
+                new_artifact_objs.append(
+                    factory.create_db_artifact(
+                        artifact,
+                        artifact_type_objs[artifact.header.type],
+                        version_obj.id,
+                        session,
+                        compression=self.compression,
+                    )
+                )
+            session.add_all(new_artifact_objs)
+            session.commit()
+            return artifacts
+
     def read_artifact(
         self,
         model_id: str,
@@ -256,16 +342,22 @@ class RelationalDBStoreSession(ArtifactStoreSession):
         version_id: str,
         limit: int = 100,
         offset: int = 0,
+        *,
+        after: Optional[str] = None,
     ) -> List[ArtifactModel]:
-        # TODO: not the best support of offset and limit, still loading everything from DB.
+        """
+        Read artifacts with limit and offset, ordered by timestamp and then identifier.
+        :param after: If provided, only artifacts sorted after the artifact with this identifier are read
+        """
         with Session(self.engine) as session:
-            all_artifacts = []
-            for artifact_type in DBReader.SUPPORTED_ARTIFACT_DB_CLASSES.keys():
-                artifacts = DBReader.get_artifacts_for_type(
-                    model_id, version_id, artifact_type, session
-                )
-                all_artifacts.extend(artifacts)
-            return all_artifacts[offset : offset + limit]
+            return DBReader.get_artifacts(
+                model_id,
+                version_id,
+                session,
+                limit=limit,
+                offset=offset,
+                after=after,
+            )
 
     def search_artifacts(
         self,
@@ -273,12 +365,108 @@ class RelationalDBStoreSession(ArtifactStoreSession):
         version_id: str,
         query: Query = Query(),
     ) -> List[ArtifactModel]:
-        # TODO: not the most efficient way, since it loads all artifacts first, before filtering.
-        artifacts = self.read_artifacts(model_id, version_id)
+        # Filters that can be expressed in SQL are applied by the DB, so only matching artifacts are loaded.
+        where = compile_filter(query.filter)
+        with Session(self.engine) as session:
+            artifacts = DBReader.get_artifacts(
+                model_id, version_id, session, where=where
+            )
+        if where is not None:
+            return artifacts
         return [
             artifact for artifact in artifacts if query.filter.match(artifact)
         ]
 
+    def list_artifact_headers(
+        self,
+        model_id: str,
+        version_id: str,
+        query: Query = Query(),
+    ) -> List[ArtifactHeaderModel]:
+        """
+        Read artifact headers, ordered by timestamp and then identifier, from the artifact_header table alone.
+        """
+        where = compile_filter(query.filter)
+        with Session(self.engine) as session:
+            headers = [
+                factory.create_header_from_db(header_obj)
+                for header_obj in DBReader.get_artifact_headers(
+                    model_id, version_id, session, where=where
+                )
+            ]
+        if where is not None:
+            return headers
+        return [
+            header for header in headers if query.filter.match_header(header)
+        ]
+
+    def search_artifacts_page(
+        self,
+        model_id: str,
+        version_id: str,
+        query: Query = Query(),
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> ArtifactPage:
+        """
+        Read a page of the artifacts that satisfy a query, ordered by timestamp and then identifier.
+        Cursors carry both, so each page is a single keyset query on the version/type/timestamp index.
+        """
+        storeutil.check_page_limit(limit)
+        position = ArtifactCursor.decode(cursor) if cursor is not None else None
+        after = position.identifier if position is not None else None
+        after_timestamp = position.timestamp if position is not None else None
+
+        where = compile_filter(query.filter)
+        with Session(self.engine) as session:
+            if where is not None:
+                # One header beyond the page tells whether there is a next one, without loading its body.
+                header_objs = DBReader.get_artifact_headers(
+                    model_id,
+                    version_id,
+                    session,
+                    limit=limit + 1,
+                    after=after,
+                    after_timestamp=after_timestamp,
+                    where=where,
+                )
+                page_objs = header_objs[:limit]
+                DBReader.load_artifact_bodies(page_objs, session)
+                return ArtifactPage(
+                    artifacts=[
+                        factory.create_artifact_from_db(header_obj, session)
+                        for header_obj in page_objs
+                    ],
+                    next=ArtifactCursor(
+                        identifier=page_objs[-1].identifier,
+                        timestamp=page_objs[-1].timestamp,
+                    ).encode()
+                    if len(header_objs) > limit
+                    else None,
+                )
+
+            # Filters that cannot be expressed in SQL are matched on the loaded artifacts, a batch at a time.
+            matches: List[ArtifactModel] = []
+            while len(matches) <= limit:
+                batch = DBReader.get_artifacts(
+                    model_id,
+                    version_id,
+                    session,
+                    limit=limit + 1,
+                    after=after,
+                    after_timestamp=after_timestamp,
+                )
+                matches.extend(
+                    artifact
+                    for artifact in batch
+                    if query.filter.match(artifact)
+                )
+                if len(batch) <= limit:
+                    break
+                after = batch[-1].header.identifier
+                after_timestamp = batch[-1].header.timestamp
+            return storeutil.make_page(matches, limit, with_timestamp=True)
+
     def delete_artifact(
         self,
         model_id: str,
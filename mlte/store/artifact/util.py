@@ -4,8 +4,13 @@ mlte/store/artifact/util.py
 Common utilities for store implementations.
 """
 
+from collections import Counter
+from typing import List
+
 import mlte.store.error as errors
+from mlte.artifact.model import ArtifactModel
 from mlte.context.model import ModelCreate, VersionCreate
+from mlte.store.artifact.cursor import ArtifactCursor, ArtifactPage
 from mlte.store.artifact.store import ArtifactStoreSession
 
 
@@ -29,3 +34,56 @@ def create_parents(
         session.create_version(model_id, VersionCreate(identifier=version_id))
     except errors.ErrorAlreadyExists:
         pass
+
+
+def get_batch_identifiers(artifacts: List[ArtifactModel]) -> List[str]:
+    """
+    Get the identifiers of a batch of artifacts to write, checking they are unique.
+    :param artifacts: The artifacts in the batch
+    :raises ErrorAlreadyExists: If an identifier appears more than once in the batch
+    :return: The artifact identifiers, in order
+    """
+    identifiers = [artifact.header.identifier for artifact in artifacts]
+    if len(set(identifiers)) != len(identifiers):
+        counts = Counter(identifiers)
+        duplicates = sorted(i for i, count in counts.items() if count > 1)
+        raise errors.ErrorAlreadyExists(
+            f"Artifacts {duplicates} appear more than once in the batch"
+        )
+    return identifiers
+
+
+def check_page_limit(limit: int) -> None:
+    """
+    Check the size requested for a page of artifacts.
+    :param limit: The maximum number of artifacts in the page
+    :raises ErrorBadRequest: If the limit is not positive
+    """
+    if limit < 1:
+        raise errors.ErrorBadRequest(
+            f"Page limit must be positive, got {limit}"
+        )
+
+
+def make_page(
+    matches: List[ArtifactModel], limit: int, *, with_timestamp: bool = False
+) -> ArtifactPage:
+    """
+    Build a page from the artifacts matching a paged query, in page order.
+    :param matches: The matching artifacts; fetching one more than the limit tells whether there is a next page
+    :param limit: The maximum number of artifacts in the page
+    :param with_timestamp: Whether the store orders pages by timestamp, so the cursor must include it
+    :return: The page, with the cursor for the next one if there are more matches
+    """
+    page = matches[:limit]
+    if len(matches) <= limit:
+        return ArtifactPage(artifacts=page)
+
+    last = page[-1].header
+    return ArtifactPage(
+        artifacts=page,
+        next=ArtifactCursor(
+            identifier=last.identifier,
+            timestamp=last.timestamp if with_timestamp else None,
+        ).encode(),
+    )
@@ -119,6 +119,10 @@ class Store:
         """
         raise NotImplementedError("Cannot get handle to abstract Store.")
 
+    def close(self) -> None:
+        """Release any resources held by the store, such as connection pools."""
+        pass
+
 
 # -----------------------------------------------------------------------------
 # StoreSession
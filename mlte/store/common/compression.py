@@ -0,0 +1,221 @@
+"""
+mlte/store/common/compression.py
+
+Optional compression of stored artifact payloads.
+"""
+from __future__ import annotations
+
+import base64
+import gzip
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from strenum import StrEnum
+
+import mlte._private.url as url_utils
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # type: ignore[assignment]
+
+# -----------------------------------------------------------------------------
+# CompressionAlgorithm
+# -----------------------------------------------------------------------------
+
+
+class CompressionAlgorithm(StrEnum):
+    """The algorithms payloads can be compressed with."""
+
+    GZIP = "gzip"
+    """gzip, from the standard library."""
+
+    ZSTD = "zstd"
+    """Zstandard, available if the zstandard package is installed."""
+
+
+MAGIC: Dict[CompressionAlgorithm, bytes] = {
+    CompressionAlgorithm.GZIP: b"\x1f\x8b",
+    CompressionAlgorithm.ZSTD: b"\x28\xb5\x2f\xfd",
+}
+"""The leading bytes that identify the data compressed with each algorithm."""
+
+TEXT_PREFIX = ":"
+"""The separator after the algorithm name in compressed text; JSON text can never start with an algorithm name."""
+
+ZSTD_LEVEL = 3
+"""The Zstandard compression level."""
+
+GZIP_LEVEL = 1
+"""The gzip compression level; higher levels save little on artifact JSON and are several times slower."""
+
+DEFAULT_THRESHOLD = 1024
+"""The default size in bytes under which payloads are stored uncompressed."""
+
+URI_OPTION = "compression"
+"""The URI query option that enables compression: an algorithm name, or 'auto'."""
+
+URI_THRESHOLD_OPTION = "compression_threshold"
+"""The URI query option that sets the compression threshold, in bytes."""
+
+
+def zstd_available() -> bool:
+    """Whether Zstandard compression is available."""
+    return zstandard is not None
+
+
+def default_algorithm() -> CompressionAlgorithm:
+    """Get the best algorithm available: Zstandard if installed, gzip otherwise."""
+    return (
+        CompressionAlgorithm.ZSTD
+        if zstd_available()
+        else CompressionAlgorithm.GZIP
+    )
+
+
+# -----------------------------------------------------------------------------
+# Compression
+# -----------------------------------------------------------------------------
+
+
+class Compression:
+    """
+    The compression settings of a store. Payloads are compressed when written
+    if they reach the threshold; reads detect compressed payloads on their own,
+    so compressed and uncompressed payloads can coexist in a store.
+    """
+
+    def __init__(
+        self,
+        algorithm: Optional[CompressionAlgorithm] = None,
+        threshold: int = DEFAULT_THRESHOLD,
+    ) -> None:
+        if algorithm == CompressionAlgorithm.ZSTD and not zstd_available():
+            raise RuntimeError(
+                "Zstandard compression requires the zstandard package."
+            )
+
+        self.algorithm = algorithm
+        """The algorithm used to compress payloads, or None to store them uncompressed."""
+
+        self.threshold = threshold
+        """The size in bytes under which payloads are stored uncompressed."""
+
+    @property
+    def enabled(self) -> bool:
+        """Whether payloads are compressed on write."""
+        return self.algorithm is not None
+
+    def compress(self, data: bytes) -> bytes:
+        """
+        Compress a payload, if compression is enabled, the payload reaches the threshold
+        and compressing it actually saves space.
+        :param data: The payload
+        :return: The stored bytes
+        """
+        if not self._applies(len(data)):
+            return data
+        compressed = self._compress(data)
+        return compressed if len(compressed) < len(data) else data
+
+    def compress_text(self, text: str) -> str:
+        """
+        Compress a text payload for a text column, encoding the result as 'algorithm:base64'.
+        Payloads that do not shrink once encoded, such as already compressed media, are kept as they are.
+        :param text: The payload
+        :return: The stored text
+        """
+        data = text.encode("utf-8")
+        if not self._applies(len(data)):
+            return text
+        encoded = base64.b64encode(self._compress(data)).decode("ascii")
+        stored = f"{self.algorithm}{TEXT_PREFIX}{encoded}"
+        return stored if len(stored) < len(text) else text
+
+    def _applies(self, size: int) -> bool:
+        """Whether a payload of the given size is compressed on write."""
+        return self.algorithm is not None and size >= self.threshold
+
+    def _compress(self, data: bytes) -> bytes:
+        """Compress a payload with the configured algorithm."""
+        if self.algorithm == CompressionAlgorithm.ZSTD:
+            return bytes(
+                zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+            )
+        return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+NO_COMPRESSION = Compression()
+"""The settings of stores that do not compress payloads."""
+
+
+def decompress(data: bytes) -> bytes:
+    """
+    Get the original payload from stored bytes, which may or may not be compressed.
+    :param data: The stored bytes
+    :return: The payload
+    """
+    if data.startswith(MAGIC[CompressionAlgorithm.GZIP]):
+        return gzip.decompress(data)
+    if data.startswith(MAGIC[CompressionAlgorithm.ZSTD]):
+        if not zstd_available():
+            raise RuntimeError(
+                "Reading Zstandard compressed data requires the zstandard package."
+            )
+        # The frame size may be missing from streamed frames, so decompress as a stream.
+        return bytes(
+            zstandard.ZstdDecompressor().decompressobj().decompress(data)
+        )
+    return data
+
+
+def decompress_text(text: str) -> str:
+    """
+    Get the original payload from stored text, which may or may not be compressed.
+    :param text: The stored text
+    :return: The payload
+    """
+    for algorithm in CompressionAlgorithm:
+        prefix = f"{algorithm}{TEXT_PREFIX}"
+        if text.startswith(prefix):
+            return decompress(base64.b64decode(text[len(prefix) :])).decode(
+                "utf-8"
+            )
+    return text
+
+
+def _parse_algorithm(name: str) -> Optional[CompressionAlgorithm]:
+    """
+    Parse the value of the compression option.
+    :param name: An algorithm name, 'auto' for the best available, or 'none'
+    :return: The algorithm, or None to store payloads uncompressed
+    """
+    name = name.lower()
+    if name in ("", "none", "off", "false"):
+        return None
+    if name in ("auto", "on", "true"):
+        return default_algorithm()
+    return CompressionAlgorithm(name)
+
+
+COMPRESSION_OPTIONS: Dict[str, Callable[[str], Any]] = {
+    URI_OPTION: _parse_algorithm,
+    URI_THRESHOLD_OPTION: int,
+}
+"""The compression options that can be set through the store URI query string, with their parsers."""
+
+
+def parse_compression_options(uri: str) -> Tuple[str, Compression]:
+    """
+    Extract compression options from the query string of a store URI.
+    :param uri: The store URI, e.g. fs://store?compression=auto&compression_threshold=4096
+    :return: The URI without the compression options, and the compression settings
+    """
+    base, options = url_utils.extract_query_options(
+        uri, COMPRESSION_OPTIONS, "compression"
+    )
+    if not options:
+        return uri, NO_COMPRESSION
+    return base, Compression(
+        options.get(URI_OPTION, default_algorithm()),
+        options.get(URI_THRESHOLD_OPTION, DEFAULT_THRESHOLD),
+    )
@@ -0,0 +1,128 @@
+"""
+mlte/store/common/encoding.py
+
+Encodings of the bodies exchanged between HTTP stores and the backend.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+from typing import Any, Dict, Optional
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+JSON_CONTENT_TYPE = "application/json"
+"""The content type of JSON bodies."""
+
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+"""The content type of MessagePack bodies."""
+
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+"""The content type of newline delimited JSON bodies, streamed one object per line."""
+
+GZIP_ENCODING = "gzip"
+"""The content encoding of gzip compressed bodies."""
+
+GZIP_LEVEL = 1
+"""The gzip compression level; higher levels are several times slower for little gain on artifact JSON."""
+
+GZIP_MINIMUM_SIZE = 1024
+"""The size in bytes under which bodies are sent uncompressed."""
+
+
+def msgpack_available() -> bool:
+    """Whether MessagePack encoding is available."""
+    return msgpack is not None
+
+
+def media_type(content_type: Optional[str]) -> str:
+    """
+    Get the media type of a Content-Type header, without its parameters.
+    :param content_type: The header value, if any
+    :return: The lower case media type, or an empty string
+    """
+    if content_type is None:
+        return ""
+    return content_type.split(";")[0].strip().lower()
+
+
+def accepts_msgpack(accept: Optional[str]) -> bool:
+    """
+    Whether an Accept header asks for MessagePack.
+    :param accept: The header value, if any
+    :return: True if MessagePack is one of the accepted media types
+    """
+    return _accepts(accept, MSGPACK_CONTENT_TYPE)
+
+
+def accepts_ndjson(accept: Optional[str]) -> bool:
+    """
+    Whether an Accept header asks for newline delimited JSON.
+    :param accept: The header value, if any
+    :return: True if newline delimited JSON is one of the accepted media types
+    """
+    return _accepts(accept, NDJSON_CONTENT_TYPE)
+
+
+def _accepts(accept: Optional[str], type: str) -> bool:
+    """
+    Whether an Accept header explicitly lists a media type.
+    :param accept: The header value, if any
+    :param type: The media type
+    :return: True if the media type is one of the accepted ones
+    """
+    if accept is None:
+        return False
+    return any(media_type(option) == type for option in accept.split(","))
+
+
+def encode_body(
+    payload: Any, *, use_msgpack: bool = False, compress: bool = False
+) -> Dict[str, Any]:
+    """
+    Encode a request body.
+    :param payload: The JSON compatible payload
+    :param use_msgpack: Whether to encode it as MessagePack rather than JSON
+    :param compress: Whether to gzip compress it, if it reaches GZIP_MINIMUM_SIZE
+    :return: The body bytes, as 'data', and the headers that describe them, as 'headers'
+    """
+    if use_msgpack:
+        data = msgpack_dumps(payload)
+        headers = {"Content-Type": MSGPACK_CONTENT_TYPE}
+    else:
+        data = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        headers = {"Content-Type": JSON_CONTENT_TYPE}
+    if compress and len(data) >= GZIP_MINIMUM_SIZE:
+        data = gzip.compress(data, compresslevel=GZIP_LEVEL)
+        headers["Content-Encoding"] = GZIP_ENCODING
+    return {"data": data, "headers": headers}
+
+
+def decode_body(content: bytes, content_type: Optional[str]) -> Any:
+    """
+    Decode a JSON or MessagePack body. Compressed bodies must be decompressed first.
+    :param content: The body bytes
+    :param content_type: The value of the Content-Type header, if any
+    :return: The decoded payload
+    """
+    if media_type(content_type) == MSGPACK_CONTENT_TYPE:
+        return msgpack_loads(content)
+    return json.loads(content)
+
+
+def msgpack_dumps(payload: Any) -> bytes:
+    """Encode a payload as MessagePack."""
+    if msgpack is None:
+        raise RuntimeError("MessagePack encoding requires the msgpack package.")
+    return bytes(msgpack.packb(payload, use_bin_type=True))
+
+
+def msgpack_loads(data: bytes) -> Any:
+    """Decode a MessagePack payload."""
+    if msgpack is None:
+        raise RuntimeError("MessagePack decoding requires the msgpack package.")
+    return msgpack.unpackb(data, raw=False)
@@ -6,12 +6,20 @@ Common functions for file-based stores.
 from __future__ import annotations
 
 import json
+import os
 import shutil
+import threading
 from pathlib import Path
 from typing import Any, Dict, List
 
 import mlte.store.error as errors
 from mlte.store.base import StoreURI, StoreURIPrefix
+from mlte.store.common.compression import (
+    NO_COMPRESSION,
+    Compression,
+    decompress,
+    parse_compression_options,
+)
 
 
 def parse_root_path(uristr: str) -> Path:
@@ -36,6 +44,9 @@ class JsonFileStorage:
 
     JSON_EXT = ".json"
 
+    compression: Compression = NO_COMPRESSION
+    """The compression applied to written files; compressed files are detected on read."""
+
     def create_folder(self, path: Path) -> None:
         Path.mkdir(path, parents=True)
 
@@ -53,13 +64,29 @@ class JsonFileStorage:
         ]
 
     def read_json_file(self, path: Path) -> Dict[str, Any]:
-        with path.open("r") as f:
-            data: Dict[str, Any] = json.load(f)
+        with path.open("rb") as f:
+            data: Dict[str, Any] = json.loads(decompress(f.read()))
         return data
 
     def write_json_to_file(self, path: Path, data: Dict[str, Any]) -> None:
-        with path.open("w") as f:
-            json.dump(data, f, indent=4)
+        if not self.compression.enabled:
+            with path.open("w") as f:
+                json.dump(data, f, indent=4)
+            return
+
+        # Files are kept compact when compression is on, whether or not they reach the threshold.
+        payload = json.dumps(data, separators=(",", ":")).encode("utf-8")
+        with path.open("wb") as f:
+            f.write(self.compression.compress(payload))
+
+    def replace_json_file(self, path: Path, data: Dict[str, Any]) -> None:
+        """Atomically replaces the contents of a JSON file, so concurrent readers never see a partial write."""
+        temp_path = path.with_name(
+            f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        with temp_path.open("w") as f:
+            json.dump(data, f)
+        os.replace(temp_path, path)
 
     def delete_file(self, path: Path) -> None:
         if not path.exists():
@@ -80,7 +107,9 @@ class FileSystemStorage(JsonFileStorage):
         self.uri = uri
         """The base URI"""
 
-        self.root = parse_root_path(uri.uri)
+        root_uri, self.compression = parse_compression_options(uri.uri)
+
+        self.root = parse_root_path(root_uri)
         """Root folder, that exists, where the storage will be located."""
 
         if not self.root.exists():
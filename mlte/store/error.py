@@ -33,3 +33,9 @@ class ForbiddenError(RuntimeError):
     """User without permissions for the operation."""
 
     pass
+
+
+class ErrorBadRequest(RuntimeError):
+    """An error raised when the arguments of a request are invalid."""
+
+    pass
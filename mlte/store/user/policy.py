@@ -19,15 +19,23 @@ from mlte.user.model import (
 )
 
 
-def create_model_policies_if_needed(artifact_store: ArtifactStoreSession, user_store: UserStoreSession):
+def create_model_policies_if_needed(artifact_store: ArtifactStoreSession, user_store: UserStoreSession) -> List[str]:
     """
-    Function that checks, for all models, if policies have not been created.
+    Function that checks, for all models, if policies have not been created, and creates the missing parts.
     This is for cases where the model may have been created without the API.
+    Stored groups and permissions are listed once, rather than read for each model.
+    :return: The ids of the models whose policies were created or completed
     """
-    models = artifact_store.list_models()
-    for model_id in models:
-        if not Policy.is_stored(ResourceType.MODEL, model_id, user_store):
-            Policy.create(ResourceType.MODEL, model_id, user_store)
+    stored_groups = set(user_store.group_mapper.list())
+    stored_permissions = set(user_store.permission_mapper.list())
+    completed: List[str] = []
+    for model_id in artifact_store.list_models():
+        groups = [group.name for group in Policy.build_groups(ResourceType.MODEL, model_id)]
+        permissions = [permission.to_str() for permission in Policy.build_permissions(ResourceType.MODEL, model_id)]
+        if not stored_groups.issuperset(groups) or not stored_permissions.issuperset(permissions):
+            Policy.complete(ResourceType.MODEL, model_id, user_store)
+            completed.append(model_id)
+    return completed
 
 
 class Policy:
@@ -120,6 +128,18 @@ class Policy:
 
         return groups
 
+    @staticmethod
+    def build_permissions(resource_type: ResourceType, resource_id: Any = None) -> List[Permission]:
+        """Generates in memory representations of the permissions for each method on the given resource."""
+        return [
+            Permission(
+                resource_type=resource_type,
+                resource_id=resource_id,
+                method=method,
+            )
+            for method in MethodType
+        ]
+
     @staticmethod
     def is_stored(
         resource_type: ResourceType,
@@ -178,6 +198,25 @@ class Policy:
                 user.groups.append(group)
             user_store.user_mapper.edit(user)
 
+    @staticmethod
+    def complete(
+        resource_type: ResourceType,
+        resource_id: Any,
+        user_store: UserStoreSession,
+    ):
+        """Creates the groups and permissions for a given resource type and id that are missing, e.g. from a partially created policy."""
+        for permission in Policy.build_permissions(resource_type, resource_id):
+            try:
+                user_store.permission_mapper.create(permission)
+            except errors.ErrorAlreadyExists:
+                pass
+
+        for group in Policy.build_groups(resource_type, resource_id):
+            try:
+                user_store.group_mapper.create(group)
+            except errors.ErrorAlreadyExists:
+                pass
+
     @staticmethod
     def remove(
         resource_type: ResourceType,
@@ -5,16 +5,15 @@ Implementation of relational database system user store.
 """
 from __future__ import annotations
 
-from typing import List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
-import sqlalchemy
-import sqlalchemy.orm
-import sqlalchemy_utils
 from sqlalchemy import Engine, select
 from sqlalchemy.orm import Session
 
 import mlte.store.error as errors
 from mlte.store.base import StoreURI
+from mlte.store.common import rdbs
+from mlte.store.common.compression import parse_compression_options
 from mlte.store.user.store import UserStore
 from mlte.store.user.store_session import (
     GroupMapper,
@@ -49,12 +48,11 @@ class RelationalDBUserStore(UserStore):
     """A DB implementation of the MLTE user store."""
 
     def __init__(self, uri: StoreURI, **kwargs) -> None:
-        self.engine = sqlalchemy.create_engine(uri.uri, **kwargs)
-        """The underlying storage for the store."""
+        # The store URI may be shared with the artifact store; its compression options do not apply here.
+        db_uri, _ = parse_compression_options(uri.uri)
 
-        # Create the DB if it doesn't exist already.
-        if not sqlalchemy_utils.database_exists(self.engine.url):
-            sqlalchemy_utils.create_database(self.engine.url)
+        self.engine = rdbs.create_engine(db_uri, **kwargs)
+        """The underlying storage for the store; owns the connection pool for the life of the store."""
 
         # Creates the DB items if they don't exist already.
         self._create_tables()
@@ -70,6 +68,17 @@ class RelationalDBUserStore(UserStore):
         """
         return RelationalDBUserStoreSession(engine=self.engine)
 
+    def close(self) -> None:
+        """Close all pooled connections to the DB."""
+        self.engine.dispose()
+
+    def pool_status(self) -> Dict[str, Any]:
+        """
+        Get statistics about the connection pool of the store.
+        :return: The pool statistics
+        """
+        return rdbs.pool_status(self.engine)
+
     def _create_tables(self):
         """Creates all items, if they don't exist already."""
         DBBase.metadata.create_all(self.engine)
@@ -104,7 +113,9 @@ class RelationalDBUserStoreSession(UserStoreSession):
 
     def close(self) -> None:
         """Close the session."""
-        self.engine.dispose()
+        # Each operation releases its connection back to the store's pool, so
+        # there is nothing to tear down here; the pool is kept for later sessions.
+        pass
 
 
 # -----------------------------------------------------------------------------
@@ -5,7 +5,7 @@ Model implementation for a User.
 """
 from __future__ import annotations
 
-from typing import List, Optional, Union
+from typing import Iterable, List, Optional, Set, Tuple, Union
 
 from strenum import StrEnum
 
@@ -244,3 +244,59 @@ class Permission(BaseModel):
             else:
                 # The methods don't match in some way.
                 return False
+
+
+class PermissionIndex:
+    """
+    The permissions of a set of groups, indexed to check access in constant
+    time with the same rules as Permission.grants_access(): a permission
+    without a resource id applies to all the resources of its type, and the
+    ANY method matches all methods, both in permissions and requests.
+    """
+
+    def __init__(self, permissions: Iterable[Permission] = ()) -> None:
+        """
+        Index the given permissions.
+        :param permissions: The permissions
+        """
+        self.keys: Set[Tuple[ResourceType, Optional[str], MethodType]] = set()
+        """The resource type, resource id and method of each permission."""
+
+        self.resources: Set[Tuple[ResourceType, Optional[str]]] = set()
+        """The resource type and resource id of each permission, for requests with any method."""
+
+        for permission in permissions:
+            self.keys.add(
+                (
+                    permission.resource_type,
+                    permission.resource_id,
+                    permission.method,
+                )
+            )
+            self.resources.add(
+                (permission.resource_type, permission.resource_id)
+            )
+
+    @staticmethod
+    def from_groups(groups: Iterable[Group]) -> PermissionIndex:
+        """Index the permissions of all the given groups."""
+        return PermissionIndex(
+            permission for group in groups for permission in group.permissions
+        )
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def grants_access(self, request: Permission) -> bool:
+        """Checks if any of the indexed permissions grants access to the received request."""
+        resource_ids = {None, request.resource_id}
+        if request.method == MethodType.ANY:
+            return any(
+                (request.resource_type, resource_id) in self.resources
+                for resource_id in resource_ids
+            )
+        return any(
+            (request.resource_type, resource_id, method) in self.keys
+            for resource_id in resource_ids
+            for method in (request.method, MethodType.ANY)
+        )
@@ -5,6 +5,25 @@ Handling of passwords.
 """
 import bcrypt
 
+DEFAULT_ROUNDS = 12
+"""The default bcrypt cost factor, the base 2 logarithm of the number of hashing rounds."""
+
+_rounds = DEFAULT_ROUNDS
+"""The cost factor used for new hashes."""
+
+
+def set_rounds(rounds: int) -> None:
+    """Sets the bcrypt cost factor used for new hashes."""
+    if not 4 <= rounds <= 31:
+        raise ValueError(f"Invalid bcrypt cost factor: {rounds}.")
+    global _rounds
+    _rounds = rounds
+
+
+def get_rounds() -> int:
+    """Gets the bcrypt cost factor used for new hashes."""
+    return _rounds
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verifies that a plain password matches a hashed one."""
@@ -18,6 +37,16 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 def hash_password(password: str) -> str:
     """Gets the hash of a given plain password."""
     pwd_bytes = password.encode("utf-8")
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=_rounds)
     hashed_password = bcrypt.hashpw(password=pwd_bytes, salt=salt)
     return hashed_password.decode("utf-8")
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """Checks if a hash was made with a cost factor other than the current one."""
+    # Hashes look like $2b$<rounds>$<salt and hash>.
+    parts = hashed_password.split("$")
+    try:
+        return int(parts[2]) != _rounds
+    except (IndexError, ValueError):
+        return False
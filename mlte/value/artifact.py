@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import abc
 import typing
+from typing import Sequence
 
 from mlte._private.meta import get_class_path
 from mlte._private.reflection import load_class
@@ -64,6 +65,27 @@ class Value(Artifact, metaclass=abc.ABCMeta):
         """
         raise NotImplementedError("Value.from_model()")
 
+    @staticmethod
+    def save_all(
+        values: Sequence[Value], *, force: bool = False, parents: bool = False
+    ) -> None:
+        """Saves all the given values, in a single batch, for the current session."""
+        Artifact.save_many(values, force=force, parents=parents)
+
+    @staticmethod
+    def save_all_with(
+        values: Sequence[Value],
+        context: Context,
+        store: ArtifactStore,
+        *,
+        force: bool = False,
+        parents: bool = False,
+    ) -> None:
+        """Saves all the given values, in a single batch, for the given context and store."""
+        Artifact.save_many_with(
+            values, context, store, force=force, parents=parents
+        )
+
     @staticmethod
     def load_all() -> list[Value]:
         """Loads all artifact models of the given type for the current session."""
@@ -0,0 +1,161 @@
+"""
+test/backend/api/auth/test_user_cache.py
+
+Test the cache of authenticated users.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from typing import Generator
+
+import pytest
+
+from mlte.backend.api import codes, dependencies
+from mlte.backend.api.auth.user_cache import AuthorizedUserCache
+from mlte.backend.state import state
+from mlte.context.model import ModelCreate
+from mlte.store.user.policy import Policy
+from mlte.store.user.store_session import UserStoreSession
+from mlte.user.model import BasicUser, Group, ResourceType
+from test.backend.api.endpoints.artifact.test_model import MODEL_URI
+from test.backend.api.endpoints.test_user import USER_URI
+from test.backend.fixture import user_generator
+from test.backend.fixture.http import (  # noqa
+    mem_store_test_api as test_api_fixture,
+)
+from test.backend.fixture.test_api import TestAPI
+
+
+def _user(name: str = "user1") -> BasicUser:
+    return BasicUser(username=name, groups=[Group(name="group1")])
+
+
+def test_lru_eviction() -> None:
+    """The least recently used tokens are evicted beyond the cache size."""
+    cache = AuthorizedUserCache(cache_size=2)
+    expiration = time.time() + 60
+    cache.put("a", _user("a"), expiration)
+    cache.put("b", _user("b"), expiration)
+    assert cache.get("a") == (_user("a"), cache.entries["a"][2])
+    cache.put("c", _user("c"), expiration)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+    cache.clear()
+    assert cache.get("a") is None
+
+
+def test_expiration() -> None:
+    """Users expire after the TTL, or with their token if it expires first."""
+    cache = AuthorizedUserCache(ttl=0)
+    cache.put("a", _user(), time.time() + 60)
+    assert cache.get("a") is None
+
+    cache = AuthorizedUserCache(ttl=60)
+    cache.put("a", _user(), time.time() - 1)
+    assert cache.get("a") is None
+
+
+def test_copies() -> None:
+    """Changes to the users read from the cache do not affect it."""
+    cache = AuthorizedUserCache()
+    cache.put("a", _user(), time.time() + 60)
+
+    cached = cache.get("a")
+    assert cached is not None
+    cached[0].groups.append(Group(name="group2"))
+    assert cache.get("a") == (_user(), cache.entries["a"][2])
+
+
+def test_disabled() -> None:
+    """A cache of size 0 keeps nothing."""
+    cache = AuthorizedUserCache(cache_size=0)
+    cache.put("a", _user(), time.time() + 60)
+    assert cache.get("a") is None
+
+
+def test_stale_put_skipped() -> None:
+    """Users read before the cache was cleared are not cached."""
+    cache = AuthorizedUserCache()
+    generation = cache.generation
+    cache.clear()
+    cache.put("a", _user(), time.time() + 60, generation)
+    assert cache.get("a") is None
+
+    cache.put("a", _user(), time.time() + 60, cache.generation)
+    assert cache.get("a") is not None
+
+
+def test_invalidated_by_changes(test_api_fixture) -> None:  # noqa
+    """Changes to a user through the API apply to the requests that follow."""
+    api_user = user_generator.build_test_user()
+    test_api: TestAPI = test_api_fixture(api_user)
+    test_client = test_api.get_test_client()
+    model = ModelCreate(identifier="model1")
+
+    # The user starts without permission to create models.
+    res = test_client.post(MODEL_URI, json=model.model_dump())
+    assert res.status_code == codes.FORBIDDEN
+    assert len(state.authorized_users.entries) == 1
+
+    # Grant it, and use the same token again.
+    admin_client = test_api.get_test_client_for_admin()
+    res = admin_client.get(f"{USER_URI}/{api_user.username}")
+    user = BasicUser(**res.json())
+    user.groups += Policy.build_groups(
+        ResourceType.MODEL, build_read_group=False, build_edit_group=False
+    )
+    res = admin_client.put(USER_URI, json=user.model_dump())
+    assert res.status_code == codes.OK
+
+    res = test_client.post(MODEL_URI, json=model.model_dump())
+    assert res.status_code == codes.OK
+
+
+def test_change_during_read(
+    test_api_fixture, monkeypatch: pytest.MonkeyPatch  # noqa
+) -> None:
+    """A user read while its groups change is not kept in the cache."""
+    api_user = user_generator.build_test_user()
+    test_api: TestAPI = test_api_fixture(api_user)
+    test_client = test_api.get_test_client()
+
+    # The user starts with permission to read models.
+    groups = Policy.build_groups(
+        ResourceType.MODEL, build_edit_group=False, build_create_group=False
+    )
+    admin_client = test_api.get_test_client_for_admin()
+    res = admin_client.get(f"{USER_URI}/{api_user.username}")
+    user = BasicUser(**res.json())
+    user.groups += groups
+    res = admin_client.put(USER_URI, json=user.model_dump())
+    assert res.status_code == codes.OK
+
+    # The permission is revoked right after the next request reads the user.
+    read_session = dependencies.user_store_session
+    revoked = False
+
+    @contextmanager
+    def read_then_revoke() -> Generator[UserStoreSession, None, None]:
+        nonlocal revoked
+        with read_session() as session:
+            yield session
+        if not revoked:
+            revoked = True
+            with dependencies.user_store_write_session() as write_session:
+                for group in groups:
+                    write_session.group_mapper.edit(
+                        group.model_copy(update={"permissions": []})
+                    )
+
+    monkeypatch.setattr(dependencies, "user_store_session", read_then_revoke)
+
+    res = test_client.get(MODEL_URI)
+    assert res.status_code == codes.OK
+    assert revoked
+
+    res = test_client.get(MODEL_URI)
+    assert res.status_code == codes.FORBIDDEN
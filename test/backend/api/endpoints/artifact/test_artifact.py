@@ -10,14 +10,23 @@ from typing import Any
 
 import pytest
 
-from mlte.artifact.model import ArtifactModel
+from mlte.artifact.model import ArtifactHeaderModel, ArtifactModel
 from mlte.artifact.type import ArtifactType
 from mlte.backend.api import codes
 from mlte.backend.api.model import WriteArtifactRequest
+from mlte.backend.state import state
 from mlte.model.base_model import BaseModel
-from mlte.store.artifact.query import Query
+from mlte.store.artifact.query import (
+    ArtifactIdentifierFilter,
+    FilterType,
+    Query,
+    encode_query,
+)
+from mlte.store.user.policy import Policy
+from mlte.store.user.store_session import ManagedUserSession
 from mlte.user.model import ResourceType, UserWithPassword
 from test.backend.api.endpoints.artifact.test_model import (
+    create_fake_model_using_admin,
     create_sample_model_using_admin,
     get_sample_model,
 )
@@ -94,6 +103,19 @@ def test_write(
     assert res.status_code == codes.OK
 
 
+def test_write_parents_creates_policy(test_api_fixture) -> None:
+    """Models created by writing an artifact get their policy."""
+    test_api: TestAPI = test_api_fixture(None)
+    artifact = ArtifactFactory.make(ArtifactType.VALUE, DEFAULT_ARTIFACT_ID)
+    request = WriteArtifactRequest(artifact=artifact, parents=True)
+    test_api.admin_create_entity(
+        typing.cast(BaseModel, request), ARTIFACT_URI.format("m1", "v1")
+    )
+
+    with ManagedUserSession(state.user_store.session()) as user_store:
+        assert Policy.is_stored(ResourceType.MODEL, "m1", user_store)
+
+
 @pytest.mark.parametrize(
     "api_user",
     user_generator.get_test_users_with_read_permissions(
@@ -126,6 +148,40 @@ def test_read(
     assert read == created
 
 
+@pytest.mark.parametrize(
+    "api_user",
+    user_generator.get_test_users_with_read_permissions(
+        ResourceType.MODEL, resource_id=get_sample_model().identifier
+    ),
+)
+def test_read_etag(test_api_fixture, api_user: UserWithPassword) -> None:
+    """Artifact reads carry a weak ETag, and are not repeated while it matches."""
+    model = get_sample_model()
+    version = get_sample_version()
+    test_api: TestAPI = test_api_fixture(api_user)
+    create_context(test_api)
+    test_client = test_api.get_test_client()
+
+    art_model = ArtifactFactory.make(ArtifactType.VALUE, id=DEFAULT_ARTIFACT_ID)
+    create_artifact_using_admin(art_model, test_api)
+    url = f"{ARTIFACT_URI.format(model.identifier, version.identifier)}/{DEFAULT_ARTIFACT_ID}"
+
+    res = test_client.get(url)
+    assert res.status_code == codes.OK
+    etag = res.headers["ETag"]
+    assert etag.startswith('W/"') and etag.endswith('"')
+
+    for if_none_match in (etag, etag[2:], f'"other", {etag}', "*"):
+        res = test_client.get(url, headers={"If-None-Match": if_none_match})
+        assert res.status_code == codes.NOT_MODIFIED
+        assert res.headers["ETag"] == etag
+        assert res.content == b""
+
+    res = test_client.get(url, headers={"If-None-Match": '"other"'})
+    assert res.status_code == codes.OK
+    assert res.headers["ETag"] == etag
+
+
 @pytest.mark.parametrize(
     "api_user",
     user_generator.get_test_users_with_read_permissions(
@@ -200,6 +256,127 @@ def test_search(
     assert read == created
 
 
+@pytest.mark.parametrize(
+    "api_user",
+    user_generator.get_test_users_with_read_permissions(
+        ResourceType.MODEL, resource_id=get_sample_model().identifier
+    ),
+)
+def test_search_get(test_api_fixture, api_user: UserWithPassword) -> None:
+    """Artifacts can be searched with read permission, and results carry an ETag."""
+    model = get_sample_model()
+    version = get_sample_version()
+    test_api: TestAPI = test_api_fixture(api_user)
+    create_context(test_api)
+    test_client = test_api.get_test_client()
+
+    for id in ["id0", "id1"]:
+        create_artifact_using_admin(
+            ArtifactFactory.make(ArtifactType.VALUE, id=id), test_api
+        )
+    query = Query(
+        filter=ArtifactIdentifierFilter(
+            type=FilterType.IDENTIFIER, artifact_id="id1"
+        )
+    )
+    url = ARTIFACT_URI.format(model.identifier, version.identifier)
+
+    res = test_client.get(url, params={"q": encode_query(Query())})
+    assert res.status_code == codes.OK
+    assert len(res.json()) == 2
+
+    res = test_client.get(url, params={"q": encode_query(query)})
+    assert res.status_code == codes.OK
+    assert [a["header"]["identifier"] for a in res.json()] == ["id1"]
+    assert res.headers["Cache-Control"] == "private, no-cache"
+    etag = res.headers["ETag"]
+
+    res = test_client.get(
+        url,
+        params={"q": encode_query(query)},
+        headers={"If-None-Match": etag},
+    )
+    assert res.status_code == codes.NOT_MODIFIED
+    assert res.content == b""
+
+    res = test_client.get(url, params={"q": "not a query"})
+    assert res.status_code == codes.BAD_REQUEST
+
+
+@pytest.mark.parametrize(
+    "api_user",
+    user_generator.get_test_users_with_no_read_permissions(
+        ResourceType.MODEL, resource_id=get_sample_model().identifier
+    ),
+)
+def test_search_get_no_permission(
+    test_api_fixture, api_user: UserWithPassword
+) -> None:
+    """Searching artifacts requires read permission."""
+    model = get_sample_model()
+    version = get_sample_version()
+    test_api: TestAPI = test_api_fixture(api_user)
+    create_context(test_api)
+    create_fake_model_using_admin(test_api)
+    test_client = test_api.get_test_client()
+
+    res = test_client.get(
+        ARTIFACT_URI.format(model.identifier, version.identifier),
+        params={"q": encode_query(Query())},
+    )
+    assert res.status_code == codes.FORBIDDEN
+
+
+def test_read_search_identifier(test_api_fixture) -> None:
+    """Artifacts identified as 'search' can be read, as searches do not use that path."""
+    model = get_sample_model()
+    version = get_sample_version()
+    test_api: TestAPI = test_api_fixture()
+    create_context(test_api)
+    test_client = test_api.get_test_client_for_admin()
+    url = ARTIFACT_URI.format(model.identifier, version.identifier)
+    artifact = ArtifactFactory.make(ArtifactType.VALUE, id="search")
+
+    res = test_client.post(
+        url, json=WriteArtifactRequest(artifact=artifact).model_dump()
+    )
+    assert res.status_code == codes.OK
+    res = test_client.get(f"{url}/search")
+    assert res.status_code == codes.OK
+    read = ArtifactModel(**res.json())
+    assert read.header.identifier == "search"
+    assert read.body == artifact.body
+
+
+@pytest.mark.parametrize(
+    "api_user",
+    user_generator.get_test_users_with_write_permissions(
+        ResourceType.MODEL, resource_id=get_sample_model().identifier
+    ),
+)
+def test_search_headers(test_api_fixture, api_user: UserWithPassword) -> None:
+    """Artifact headers can be searched."""
+    model = get_sample_model()
+    version = get_sample_version()
+    test_api: TestAPI = test_api_fixture(api_user)
+    create_context(test_api)
+    test_client = test_api.get_test_client()
+
+    art_model = ArtifactFactory.make(ArtifactType.VALUE, id=DEFAULT_ARTIFACT_ID)
+    art_json = create_artifact_using_admin(art_model, test_api)
+    created = ArtifactModel(**art_json["artifact"])
+
+    res = test_client.post(
+        f"{ARTIFACT_URI.format(model.identifier, version.identifier)}/search/headers",
+        json=Query().model_dump(),
+    )
+    assert res.status_code == codes.OK
+
+    collection = res.json()
+    assert len(collection) == 1
+    assert ArtifactHeaderModel(**collection[0]) == created.header
+
+
 @pytest.mark.parametrize(
     "api_user",
     user_generator.get_test_users_with_write_permissions(
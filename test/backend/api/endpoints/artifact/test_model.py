@@ -58,6 +58,9 @@ def test_health(
     res = test_client.get(f"{settings.API_PREFIX}/healthz")
     assert res.status_code == codes.OK
 
+    res = test_client.get(f"{settings.API_PREFIX}/healthz/pools")
+    assert res.status_code == codes.OK
+
 
 @pytest.mark.parametrize(
     "api_user",
@@ -12,6 +12,9 @@ import pytest
 from mlte.backend.api import codes
 from mlte.backend.core.config import settings
 from mlte.backend.state import state
+from mlte.context.model import ModelCreate
+from mlte.store.artifact.store import ManagedArtifactSession
+from mlte.store.user.policy import Policy
 from mlte.store.user.store_session import ManagedUserSession, UserStoreSession
 from mlte.user.model import (
     Group,
@@ -313,3 +316,27 @@ def test_delete_no_permission(
 
     res = test_client.delete(f"{GROUP_URI}/{group.name}")
     assert res.status_code == codes.FORBIDDEN
+
+
+def test_reconcile_policies(test_api_fixture) -> None:  # noqa
+    """Admins can create the missing policies of models created without the API."""
+    api_user = user_generator.build_test_user(
+        groups=Policy.build_groups(ResourceType.GROUP)
+    )
+    test_api: TestAPI = test_api_fixture(api_user)
+    with ManagedArtifactSession(state.artifact_store.session()) as handle:
+        handle.create_model(ModelCreate(identifier="m1"))
+
+    res = test_api.get_test_client().post(f"{GROUP_URI}s/policies/reconcile")
+    assert res.status_code == codes.FORBIDDEN
+
+    admin_client = test_api.get_test_client_for_admin()
+    res = admin_client.post(f"{GROUP_URI}s/policies/reconcile")
+    assert res.status_code == codes.OK
+    assert res.json() == ["m1"]
+    with ManagedUserSession(state.user_store.session()) as user_store:
+        assert Policy.is_stored(ResourceType.MODEL, "m1", user_store)
+
+    # Nothing is left to create.
+    res = admin_client.post(f"{GROUP_URI}s/policies/reconcile")
+    assert res.json() == []
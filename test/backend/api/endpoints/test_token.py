@@ -4,13 +4,34 @@ test/backend/api/endpoint/test_token.py
 Test the API for token endpoint
 """
 
+import asyncio
+import statistics
+import time
+from typing import Any, List, Tuple, cast
+
+import httpx
+
+from mlte.artifact.type import ArtifactType
 from mlte.backend.api import codes
 from mlte.backend.core.config import settings
+from mlte.backend.state import state
+from mlte.store.user.store_session import ManagedUserSession
+from mlte.user import passwords
+from test.backend.api.endpoints.artifact.test_artifact import (
+    ARTIFACT_URI,
+    DEFAULT_ARTIFACT_ID,
+    create_artifact_using_admin,
+    create_context,
+)
+from test.backend.api.endpoints.artifact.test_model import get_sample_model
+from test.backend.api.endpoints.artifact.test_version import get_sample_version
 from test.backend.api.endpoints.test_user import (
     create_sample_user_using_admin,
     get_sample_user,
 )
+from test.backend.fixture import user_generator
 from test.backend.fixture.test_api import TestAPI
+from test.fixture.artifact import ArtifactFactory
 
 TOKEN_ENDPOINT = "/token"
 TOKEN_URI = f"{settings.API_PREFIX}{TOKEN_ENDPOINT}"
@@ -68,3 +89,84 @@ def test_invalid_user(test_api_fixture) -> None:
     # Check result.
     assert res.status_code == codes.BAD_REQUEST
     assert res.json()["error"] == "invalid_grant"
+
+
+def test_rehash_on_login(test_api_fixture) -> None:
+    """Passwords hashed with another cost factor are hashed again on login."""
+    test_api: TestAPI = test_api_fixture()
+    test_client = test_api.get_test_client()
+    user = get_sample_user()
+    try:
+        passwords.set_rounds(4)
+        create_sample_user_using_admin(test_api)
+        passwords.set_rounds(5)
+
+        form_data = test_client._format_oauth_password_payload(
+            user.username, user.password
+        )
+        res = test_client.post(f"{TOKEN_URI}", data=form_data)
+        assert res.status_code == codes.OK
+    finally:
+        passwords.set_rounds(passwords.DEFAULT_ROUNDS)
+
+    with ManagedUserSession(state.user_store.session()) as user_store:
+        hashed_password = user_store.user_mapper.read(
+            user.username
+        ).hashed_password
+    assert hashed_password.split("$")[2] == "05"
+    assert passwords.verify_password(user.password, hashed_password)
+
+
+def test_logins_do_not_block_reads(test_api_fixture) -> None:
+    """Reads are served while concurrent logins verify passwords."""
+    test_api: TestAPI = test_api_fixture(user_generator.build_test_user())
+    create_context(test_api)
+    artifact = ArtifactFactory.make(ArtifactType.VALUE, DEFAULT_ARTIFACT_ID)
+    create_artifact_using_admin(artifact, test_api)
+    url = ARTIFACT_URI.format(
+        get_sample_model().identifier, get_sample_version().identifier
+    )
+    headers = test_api.get_test_client_for_admin().headers
+    logins = 4
+
+    async def read(client: httpx.AsyncClient) -> float:
+        start = time.perf_counter()
+        res = await client.get(
+            f"{url}/{artifact.header.identifier}", headers=headers
+        )
+        assert res.status_code == codes.OK
+        return time.perf_counter() - start
+
+    async def run() -> Tuple[List[float], List[float]]:
+        async with httpx.AsyncClient(
+            # httpx types ASGI apps more narrowly than Starlette does.
+            transport=httpx.ASGITransport(app=cast(Any, test_api.app)),
+            base_url="http://test",
+        ) as client:
+            baseline = [await read(client) for _ in range(10)]
+
+            form_data = {
+                "grant_type": "password",
+                "username": user_generator.TEST_API_USERNAME,
+                "password": user_generator.TEST_API_PASS,
+            }
+            login_tasks = [
+                asyncio.create_task(client.post(TOKEN_URI, data=form_data))
+                for _ in range(logins)
+            ]
+            await asyncio.sleep(0)
+
+            latencies = []
+            while not all(task.done() for task in login_tasks):
+                latencies.append(await read(client))
+            for task in login_tasks:
+                assert (await task).status_code == codes.OK
+            return baseline, latencies
+
+    baseline, latencies = asyncio.run(run())
+
+    # With verification on the event loop, reads would wait for whole logins.
+    # Reads still share the CPU with the password workers, so allow plenty.
+    assert len(latencies) > 1
+    assert statistics.median(latencies) < 10 * max(baseline)
+    assert max(latencies) < 50 * max(baseline)
@@ -0,0 +1,185 @@
+"""
+test/backend/api/test_body_encoding.py
+
+Test the compression and content negotiation of API bodies.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+
+import pytest
+
+from mlte.artifact.model import ArtifactModel
+from mlte.backend.api import codes
+from mlte.backend.api.model import WriteArtifactRequest
+from mlte.backend.core.config import settings
+from mlte.evidence.metadata import EvidenceMetadata, Identifier
+from mlte.store.common import encoding
+from mlte.value.types.array import Array
+from test.backend.api.endpoints.artifact.test_artifact import (
+    ARTIFACT_URI,
+    create_context,
+)
+from test.backend.api.endpoints.artifact.test_model import get_sample_model
+from test.backend.api.endpoints.artifact.test_version import get_sample_version
+from test.backend.fixture.http import (  # noqa
+    mem_store_test_api as test_api_fixture,
+)
+from test.backend.fixture.test_api import TestAPI
+
+URI = ARTIFACT_URI.format(
+    get_sample_model().identifier, get_sample_version().identifier
+)
+
+
+def _large_artifact() -> ArtifactModel:
+    """An artifact large enough to be compressed."""
+    return Array(
+        EvidenceMetadata(
+            measurement_type="typename", identifier=Identifier(name="array")
+        ),
+        list(range(1000)),
+    ).to_model()
+
+
+def _request_body(artifact: ArtifactModel) -> bytes:
+    return json.dumps(
+        WriteArtifactRequest(artifact=artifact).model_dump()
+    ).encode("utf-8")
+
+
+def test_gzip_request_and_response(test_api_fixture) -> None:  # noqa
+    """Compressed request bodies are accepted, and large responses compressed."""
+    test_api: TestAPI = test_api_fixture()
+    create_context(test_api)
+    client = test_api.get_test_client_for_admin()
+    artifact = _large_artifact()
+
+    res = client.post(
+        URI,
+        data=gzip.compress(_request_body(artifact)),
+        headers={
+            "Content-Type": encoding.JSON_CONTENT_TYPE,
+            "Content-Encoding": encoding.GZIP_ENCODING,
+        },
+    )
+    assert res.status_code == codes.OK
+
+    res = client.get(
+        f"{URI}/{artifact.header.identifier}",
+        headers={"Accept-Encoding": "gzip"},
+    )
+    assert res.status_code == codes.OK
+    assert res.headers["content-encoding"] == encoding.GZIP_ENCODING
+    read = ArtifactModel(**res.json())
+    assert read.body == artifact.body
+
+
+def test_malformed_body(test_api_fixture) -> None:  # noqa
+    """Bodies that cannot be decompressed are rejected."""
+    test_api: TestAPI = test_api_fixture()
+    create_context(test_api)
+    client = test_api.get_test_client_for_admin()
+
+    res = client.post(
+        URI,
+        data=b"not gzip",
+        headers={
+            "Content-Type": encoding.JSON_CONTENT_TYPE,
+            "Content-Encoding": encoding.GZIP_ENCODING,
+        },
+    )
+    assert res.status_code == codes.BAD_REQUEST
+
+
+def test_json_fallback(test_api_fixture) -> None:  # noqa
+    """Clients that accept MessagePack get JSON if the server cannot produce it."""
+    test_api: TestAPI = test_api_fixture()
+    client = test_api.get_test_client_for_admin()
+
+    res = client.get(
+        f"{settings.API_PREFIX}/healthz",
+        headers={
+            "Accept": f"{encoding.MSGPACK_CONTENT_TYPE}, {encoding.JSON_CONTENT_TYPE}"
+        },
+    )
+    expected = (
+        encoding.MSGPACK_CONTENT_TYPE
+        if encoding.msgpack_available()
+        else encoding.JSON_CONTENT_TYPE
+    )
+    assert encoding.media_type(res.headers["content-type"]) == expected
+
+
+@pytest.mark.skipif(encoding.msgpack_available(), reason="msgpack is installed")
+def test_msgpack_unsupported(test_api_fixture) -> None:  # noqa
+    """MessagePack bodies are rejected if the server cannot decode them."""
+    test_api: TestAPI = test_api_fixture()
+    client = test_api.get_test_client_for_admin()
+
+    res = client.post(
+        URI,
+        data=b"\x80",
+        headers={"Content-Type": encoding.MSGPACK_CONTENT_TYPE},
+    )
+    assert res.status_code == codes.UNSUPPORTED_MEDIA_TYPE
+
+
+@pytest.mark.skipif(
+    not encoding.msgpack_available(), reason="msgpack is not installed"
+)
+def test_msgpack_round_trip(test_api_fixture) -> None:  # noqa
+    """MessagePack request and response bodies carry the same artifacts as JSON."""
+    test_api: TestAPI = test_api_fixture()
+    create_context(test_api)
+    client = test_api.get_test_client_for_admin()
+    client.configure_encoding(compress=True, msgpack=True)
+    artifact = _large_artifact()
+
+    res = client.post(
+        URI,
+        **client.encode_json(
+            WriteArtifactRequest(artifact=artifact).model_dump()
+        ),
+    )
+    assert res.status_code == codes.OK
+
+    res = client.get(f"{URI}/{artifact.header.identifier}")
+    assert res.status_code == codes.OK
+    assert (
+        encoding.media_type(res.headers["content-type"])
+        == encoding.MSGPACK_CONTENT_TYPE
+    )
+    assert ArtifactModel(**client.decode_json(res)).body == artifact.body
+
+
+def test_etag_shared_across_encodings(test_api_fixture) -> None:  # noqa
+    """All representations of an artifact carry the same weak ETag, and revalidate with it."""
+    test_api: TestAPI = test_api_fixture()
+    create_context(test_api)
+    client = test_api.get_test_client_for_admin()
+    artifact = _large_artifact()
+    res = client.post(
+        URI, json=WriteArtifactRequest(artifact=artifact).model_dump()
+    )
+    assert res.status_code == codes.OK
+
+    url = f"{URI}/{artifact.header.identifier}"
+    representations = [
+        {"Accept-Encoding": "identity"},
+        {"Accept-Encoding": encoding.GZIP_ENCODING},
+    ]
+    if encoding.msgpack_available():
+        representations.append({"Accept": encoding.MSGPACK_CONTENT_TYPE})
+
+    etag = client.get(url, headers=representations[0]).headers["ETag"]
+    assert etag.startswith("W/")
+    for headers in representations:
+        res = client.get(url, headers=headers)
+        assert res.status_code == codes.OK
+        assert res.headers["ETag"] == etag
+
+        res = client.get(url, headers={**headers, "If-None-Match": etag})
+        assert res.status_code == codes.NOT_MODIFIED
@@ -0,0 +1,156 @@
+"""
+test/backend/api/test_metrics.py
+
+Test the collection and exposition of backend metrics.
+"""
+
+from __future__ import annotations
+
+from typing import Generator
+
+import pytest
+
+from mlte.backend.api import codes
+from mlte.backend.api.metrics import Counter, Histogram, Metrics
+from mlte.backend.core.config import settings
+from mlte.backend.state import state
+from mlte.context.model import ModelCreate
+from mlte.store.artifact.underlying.memory import InMemoryStore
+from mlte.store.base import StoreURI
+from mlte.store.error import ErrorNotFound
+from test.backend.fixture.http import (  # noqa
+    mem_store_test_api as test_api_fixture,
+)
+from test.backend.fixture.test_api import TestAPI
+
+METRICS_URI = f"{settings.API_PREFIX}/metrics"
+
+
+@pytest.fixture
+def enabled_metrics() -> Generator[Metrics, None, None]:
+    """Collect metrics in the backend state for the duration of a test."""
+    state.metrics.clear()
+    state.metrics.enabled = True
+    yield state.metrics
+    state.metrics.enabled = False
+    state.metrics.clear()
+
+
+def test_counter_render() -> None:
+    counter = Counter("requests_total", "Requests.", ["route"])
+    counter.inc("/a")
+    counter.inc("/a")
+    counter.inc('/"b"', amount=3)
+
+    assert counter.render() == [
+        "# HELP requests_total Requests.",
+        "# TYPE requests_total counter",
+        'requests_total{route="/\\"b\\""} 3',
+        'requests_total{route="/a"} 2',
+    ]
+
+
+def test_histogram_render() -> None:
+    histogram = Histogram("duration_seconds", "Duration.", ["op"], [0.1, 1])
+    for value in [0.05, 0.1, 0.5, 2]:
+        histogram.observe(value, "read")
+
+    assert histogram.render() == [
+        "# HELP duration_seconds Duration.",
+        "# TYPE duration_seconds histogram",
+        'duration_seconds_bucket{op="read",le="0.1"} 2',
+        'duration_seconds_bucket{op="read",le="1"} 3',
+        'duration_seconds_bucket{op="read",le="+Inf"} 4',
+        'duration_seconds_sum{op="read"} 2.65',
+        'duration_seconds_count{op="read"} 4',
+    ]
+
+
+def test_pool_render() -> None:
+    text = Metrics().render(
+        {
+            "artifact_store": {
+                "pool": "QueuePool",
+                "size": 5,
+                "checked_out": 2,
+            },
+            "user_store": {"pool": "StaticPool"},
+        }
+    )
+
+    assert "# TYPE mlte_store_pool_size gauge" in text
+    assert 'mlte_store_pool_size{store="artifact_store"} 5' in text
+    assert 'mlte_store_pool_checked_out{store="artifact_store"} 2' in text
+    assert "user_store" not in text
+
+
+def test_timed_session() -> None:
+    session = InMemoryStore(StoreURI.from_string("memory://")).session()
+
+    # Disabled metrics leave sessions alone.
+    assert Metrics().timed(session, "artifact") is session
+
+    metrics = Metrics(enabled=True)
+    timed = metrics.timed(session, "artifact")
+    timed.create_model(ModelCreate(identifier="model"))
+    assert timed.list_models() == ["model"]
+    with pytest.raises(ErrorNotFound):
+        timed.read_model("other")
+
+    operations = {labels for labels in metrics.store_duration.values}
+    assert operations == {
+        ("artifact", "create_model"),
+        ("artifact", "list_models"),
+        ("artifact", "read_model"),
+    }
+    assert metrics.store_errors.values == {("artifact", "read_model"): 1}
+
+
+def test_metrics_disabled(test_api_fixture) -> None:  # noqa
+    test_api: TestAPI = test_api_fixture()
+    client = test_api.get_test_client()
+
+    res = client.get(METRICS_URI)
+    assert res.status_code == codes.NOT_FOUND
+
+
+def test_metrics_scrape(test_api_fixture, enabled_metrics) -> None:  # noqa
+    test_api: TestAPI = test_api_fixture()
+    client = test_api.get_test_client_for_admin()
+    res = client.post(
+        f"{settings.API_PREFIX}/model",
+        json=ModelCreate(identifier="model").model_dump(),
+    )
+    assert res.status_code == codes.OK
+    res = client.get(f"{settings.API_PREFIX}/model/model")
+    assert res.status_code == codes.OK
+
+    res = client.get(METRICS_URI)
+    assert res.status_code == codes.OK
+    assert res.headers["content-type"].startswith("text/plain")
+    text = res.text
+
+    # Requests, by route template.
+    assert (
+        'mlte_http_requests_total{method="GET",route="/api/model/{model_id}",status="200"} 1'
+        in text
+    )
+    assert (
+        'mlte_http_request_duration_seconds_count{method="POST",route="/api/model"} 1'
+        in text
+    )
+    assert (
+        'mlte_http_response_size_bytes_count{method="GET",route="/api/model/{model_id}"} 1'
+        in text
+    )
+
+    # Store operations, and authorization of each request.
+    assert (
+        'mlte_store_operation_duration_seconds_count{store="artifact",operation="create_model"} 1'
+        in text
+    )
+    assert (
+        'mlte_store_operation_duration_seconds_count{store="user",operation="user_mapper.read"}'
+        in text
+    )
+    assert 'mlte_auth_duration_seconds_count{cached="false"}' in text
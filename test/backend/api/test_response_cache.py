@@ -0,0 +1,201 @@
+"""
+test/backend/api/test_response_cache.py
+
+Test the cache of read endpoint responses.
+"""
+
+from __future__ import annotations
+
+import time
+
+from mlte.artifact.type import ArtifactType
+from mlte.backend.api import codes, response_cache
+from mlte.backend.api.model import WriteArtifactRequest
+from mlte.backend.api.response_cache import ResponseCache
+from mlte.backend.core.config import settings
+from mlte.backend.state import state
+from mlte.context.model import VersionCreate
+from mlte.store.artifact.store import ManagedArtifactSession
+from mlte.user.model import ResourceType
+from test.backend.api.endpoints.artifact.test_artifact import (
+    ARTIFACT_URI,
+    create_context,
+)
+from test.backend.api.endpoints.artifact.test_model import get_sample_model
+from test.backend.api.endpoints.artifact.test_version import get_sample_version
+from test.backend.fixture import user_generator
+from test.backend.fixture.http import (  # noqa
+    mem_store_test_api as test_api_fixture,
+)
+from test.backend.fixture.test_api import TestAPI
+from test.fixture.artifact import ArtifactFactory
+
+MODEL_ID = get_sample_model().identifier
+VERSION_ID = get_sample_version().identifier
+MODEL_URI = f"{settings.API_PREFIX}/model/{MODEL_ID}"
+VERSIONS_URI = f"{MODEL_URI}/version"
+ARTIFACTS_URI = ARTIFACT_URI.format(MODEL_ID, VERSION_ID)
+
+
+def _read(cache: ResponseCache, key: str, scope: response_cache.Scope) -> bytes:
+    """Read a response through the cache, creating it from its key."""
+    return cache.get_or_create(key, scope, lambda: key.encode("utf-8"))
+
+
+def test_hits_and_misses() -> None:
+    cache = ResponseCache()
+    assert _read(cache, "a", response_cache.MODELS) == b"a"
+    assert _read(cache, "a", response_cache.MODELS) == b"a"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_limits() -> None:
+    cache = ResponseCache(max_entries=2, max_bytes=10)
+    for key in ["a", "b", "c"]:
+        _read(cache, key, response_cache.MODELS)
+
+    # Least recently used entries go first.
+    assert list(cache.entries) == ["b", "c"]
+
+    # Entries are also evicted to stay under the size limit.
+    _read(cache, "d" * 10, response_cache.MODELS)
+    assert list(cache.entries) == ["d" * 10]
+    assert cache.size == 10
+
+    # Responses over the size limit are not cached at all.
+    _read(cache, "e" * 11, response_cache.MODELS)
+    assert list(cache.entries) == ["d" * 10]
+
+    # A size of 0 disables the cache.
+    disabled = ResponseCache(max_entries=0)
+    _read(disabled, "a", response_cache.MODELS)
+    assert len(disabled.entries) == 0
+
+
+def test_expiration() -> None:
+    cache = ResponseCache(ttl=0.05)
+    _read(cache, "a", response_cache.MODELS)
+    time.sleep(0.1)
+    _read(cache, "a", response_cache.MODELS)
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+def test_invalidation() -> None:
+    cache = ResponseCache()
+    _read(cache, "models", response_cache.MODELS)
+    _read(cache, "m1", response_cache.model_scope("m1"))
+    _read(cache, "m1v1", response_cache.version_scope("m1", "v1"))
+    _read(cache, "m1v2", response_cache.version_scope("m1", "v2"))
+    _read(cache, "m2v1", response_cache.version_scope("m2", "v1"))
+
+    cache.invalidate(response_cache.version_scope("m1", "v1"))
+    assert set(cache.entries) == {"models", "m1", "m1v2", "m2v1"}
+
+    cache.invalidate_model("m1")
+    assert set(cache.entries) == {"models", "m2v1"}
+
+    cache.invalidate(response_cache.MODELS)
+    assert set(cache.entries) == {"m2v1"}
+    assert cache.size == len("m2v1")
+
+
+def test_write_during_read() -> None:
+    cache = ResponseCache()
+
+    def read() -> bytes:
+        # A write lands while the response is being read.
+        cache.invalidate(response_cache.MODELS)
+        return b"stale"
+
+    assert cache.get_or_create("a", response_cache.MODELS, read) == b"stale"
+    assert len(cache.entries) == 0
+
+
+def test_reads_are_cached(test_api_fixture) -> None:  # noqa
+    test_api: TestAPI = test_api_fixture()
+    create_context(test_api)
+    client = test_api.get_test_client_for_admin()
+
+    for _ in range(2):
+        for uri in [
+            f"{settings.API_PREFIX}/model",
+            MODEL_URI,
+            VERSIONS_URI,
+            ARTIFACTS_URI,
+        ]:
+            res = client.get(uri)
+            assert res.status_code == codes.OK
+    assert state.responses.hits == 4
+
+    # Cached responses are the same as those read from the store.
+    res = client.get(VERSIONS_URI)
+    assert res.json() == [VERSION_ID]
+
+
+def test_writes_invalidate(test_api_fixture) -> None:  # noqa
+    test_api: TestAPI = test_api_fixture()
+    create_context(test_api)
+    client = test_api.get_test_client_for_admin()
+    assert client.get(VERSIONS_URI).json() == [VERSION_ID]
+    assert client.get(ARTIFACTS_URI).json() == []
+
+    res = client.post(
+        VERSIONS_URI, json=VersionCreate(identifier="v1").model_dump()
+    )
+    assert res.status_code == codes.OK
+    assert sorted(client.get(VERSIONS_URI).json()) == sorted([VERSION_ID, "v1"])
+
+    artifact = ArtifactFactory.make(ArtifactType.NEGOTIATION_CARD, "id0")
+    res = client.post(
+        ARTIFACTS_URI,
+        json=WriteArtifactRequest(artifact=artifact).model_dump(),
+    )
+    assert res.status_code == codes.OK
+    assert len(client.get(ARTIFACTS_URI).json()) == 1
+    assert client.get(f"{ARTIFACTS_URI}/id0").status_code == codes.OK
+
+    res = client.delete(f"{ARTIFACTS_URI}/id0")
+    assert res.status_code == codes.OK
+    assert client.get(ARTIFACTS_URI).json() == []
+    assert client.get(f"{ARTIFACTS_URI}/id0").status_code == codes.NOT_FOUND
+
+    res = client.delete(MODEL_URI)
+    assert res.status_code == codes.OK
+    assert client.get(f"{settings.API_PREFIX}/model").json() == []
+    assert client.get(MODEL_URI).status_code == codes.NOT_FOUND
+
+
+def test_writes_to_other_versions_keep_cache(test_api_fixture) -> None:  # noqa
+    test_api: TestAPI = test_api_fixture()
+    create_context(test_api)
+    client = test_api.get_test_client_for_admin()
+    client.get(ARTIFACTS_URI)
+
+    # Written directly to the store, so the cached response is kept.
+    with ManagedArtifactSession(state.artifact_store.session()) as handle:
+        handle.create_version(MODEL_ID, VersionCreate(identifier="v1"))
+    res = client.post(
+        ARTIFACT_URI.format(MODEL_ID, "v1"),
+        json=WriteArtifactRequest(
+            artifact=ArtifactFactory.make(ArtifactType.NEGOTIATION_CARD, "id0")
+        ).model_dump(),
+    )
+    assert res.status_code == codes.OK
+
+    hits = state.responses.hits
+    assert client.get(ARTIFACTS_URI).json() == []
+    assert state.responses.hits == hits + 1
+
+
+def test_cached_reads_are_authorized(test_api_fixture) -> None:  # noqa
+    user = user_generator.get_test_users_with_no_read_permissions(
+        ResourceType.MODEL, MODEL_ID
+    )[0]
+    test_api: TestAPI = test_api_fixture(user)
+    create_context(test_api)
+
+    # The admin caches the response, which is still not served to others.
+    admin = test_api.get_test_client_for_admin()
+    assert admin.get(ARTIFACTS_URI).status_code == codes.OK
+    client = test_api.get_test_client()
+    assert client.get(ARTIFACTS_URI).status_code == codes.FORBIDDEN
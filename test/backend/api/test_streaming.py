@@ -0,0 +1,96 @@
+"""
+test/backend/api/test_streaming.py
+
+Test streaming artifact listings as newline delimited JSON.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, List
+
+import pytest
+
+from mlte.artifact.type import ArtifactType
+from mlte.backend.api import codes
+from mlte.backend.api.endpoints import artifact as artifact_endpoints
+from mlte.backend.api.model import WriteArtifactRequest
+from mlte.store.artifact.query import Query, encode_query
+from mlte.store.common import encoding
+from test.backend.api.endpoints.artifact.test_artifact import (
+    ARTIFACT_URI,
+    create_context,
+)
+from test.backend.api.endpoints.artifact.test_model import get_sample_model
+from test.backend.api.endpoints.artifact.test_version import get_sample_version
+from test.backend.fixture.http import (  # noqa
+    mem_store_test_api as test_api_fixture,
+)
+from test.backend.fixture.test_api import TestAPI
+from test.fixture.artifact import ArtifactFactory
+
+ARTIFACTS_URI = ARTIFACT_URI.format(
+    get_sample_model().identifier, get_sample_version().identifier
+)
+NDJSON = {"Accept": encoding.NDJSON_CONTENT_TYPE}
+
+ARTIFACTS = 5
+"""The number of artifacts written for each test."""
+
+
+def _lines(body: str) -> List[Any]:
+    """Parse a newline delimited JSON body."""
+    return [json.loads(line) for line in body.splitlines() if line]
+
+
+@pytest.fixture
+def client(test_api_fixture, monkeypatch):  # noqa
+    """An admin client of a backend with a few artifacts, streamed two at a time."""
+    monkeypatch.setattr(artifact_endpoints, "STREAM_PAGE_SIZE", 2)
+    test_api: TestAPI = test_api_fixture()
+    create_context(test_api)
+    client = test_api.get_test_client_for_admin()
+    for index in range(ARTIFACTS):
+        artifact = ArtifactFactory.make(
+            ArtifactType.NEGOTIATION_CARD, f"id{index}"
+        )
+        res = client.post(
+            ARTIFACTS_URI,
+            json=WriteArtifactRequest(artifact=artifact).model_dump(),
+        )
+        assert res.status_code == codes.OK
+    return client
+
+
+def test_read_streamed(client) -> None:
+    """Streamed listings hold the same artifacts, in the same order."""
+    for params in ["", "?limit=3", "?limit=4&offset=2", "?offset=5"]:
+        listed = client.get(f"{ARTIFACTS_URI}{params}").json()
+        res = client.get(f"{ARTIFACTS_URI}{params}", headers=NDJSON)
+        assert res.status_code == codes.OK
+        assert res.headers["content-type"] == encoding.NDJSON_CONTENT_TYPE
+        assert _lines(res.text) == listed
+
+
+def test_search_streamed(client) -> None:
+    """Search results are streamed, and errors keep their status codes."""
+    body = Query().model_dump()
+    searched = client.post(f"{ARTIFACTS_URI}/search", json=body).json()
+    res = client.post(f"{ARTIFACTS_URI}/search", json=body, headers=NDJSON)
+    assert res.status_code == codes.OK
+    assert len(_lines(res.text)) == ARTIFACTS
+    assert sorted(
+        _lines(res.text), key=lambda a: a["header"]["identifier"]
+    ) == (sorted(searched, key=lambda a: a["header"]["identifier"]))
+
+    res = client.get(
+        ARTIFACTS_URI,
+        params={"q": encode_query(Query())},
+        headers=NDJSON,
+    )
+    assert res.status_code == codes.OK
+    assert len(_lines(res.text)) == ARTIFACTS
+
+    missing = ARTIFACT_URI.format(get_sample_model().identifier, "missing")
+    res = client.post(f"{missing}/search", json=body, headers=NDJSON)
+    assert res.status_code == codes.NOT_FOUND
@@ -48,24 +48,53 @@ class FastAPITestHttpClient(OAuthHttpClient):
         """The underlying client."""
 
     def get(self, url: str, **kwargs) -> httpx.Response:
-        return self.client.get(url, headers=self.headers, **kwargs)
+        headers = kwargs.pop("headers", None)
+        return self._with_token_renewal(
+            lambda: self.client.get(
+                url, headers=self._request_headers(headers), **kwargs
+            )
+        )
 
     def post(
         self, url: str, data: Any = None, json: Any = None, **kwargs
     ) -> httpx.Response:
-        return self.client.post(
-            url, headers=self.headers, data=data, json=json, **kwargs
+        headers = kwargs.pop("headers", None)
+        return self._with_token_renewal(
+            lambda: self.client.post(
+                url,
+                headers=self._request_headers(headers),
+                **_body(data, json),
+                **kwargs,
+            )
         )
 
     def put(
         self, url: str, data: Any = None, json: Any = None, **kwargs
     ) -> httpx.Response:
-        return self.client.put(
-            url, headers=self.headers, data=data, json=json, **kwargs
+        headers = kwargs.pop("headers", None)
+        return self._with_token_renewal(
+            lambda: self.client.put(
+                url,
+                headers=self._request_headers(headers),
+                **_body(data, json),
+                **kwargs,
+            )
         )
 
     def delete(self, url: str, **kwargs) -> httpx.Response:
-        return self.client.delete(url, headers=self.headers, **kwargs)
+        headers = kwargs.pop("headers", None)
+        return self._with_token_renewal(
+            lambda: self.client.delete(
+                url, headers=self._request_headers(headers), **kwargs
+            )
+        )
+
+
+def _body(data: Any, json: Any) -> Dict[str, Any]:
+    """Get the body arguments for the TestClient, which takes raw bodies as content."""
+    if isinstance(data, bytes):
+        return {"content": data, "json": json}
+    return {"data": data, "json": json}
 
 
 # -----------------------------------------------------------------------------
@@ -0,0 +1,87 @@
+"""
+test/store/artifact/test_compression.py
+
+Unit tests for compressed artifact storage.
+"""
+
+from pathlib import Path
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from mlte.artifact.type import ArtifactType
+from mlte.evidence.metadata import EvidenceMetadata, Identifier
+from mlte.store.artifact.store import ManagedArtifactSession
+from mlte.store.artifact.underlying.fs import LocalFileSystemStore
+from mlte.store.artifact.underlying.rdbs.metadata_value import DBValue
+from mlte.store.artifact.underlying.rdbs.store import RelationalDBStore
+from mlte.store.base import StoreURI
+from mlte.store.common import compression
+from mlte.store.common.compression import CompressionAlgorithm
+from mlte.value.types.array import Array
+
+from ...fixture.artifact import ArtifactFactory
+
+MODEL_ID = "model0"
+VERSION_ID = "version0"
+
+
+def test_fs_compression(tmp_path: Path) -> None:
+    """Compressed and uncompressed artifact files coexist in a FS store."""
+    plain_store = LocalFileSystemStore(StoreURI.from_string(f"fs://{tmp_path}"))
+    plain = ArtifactFactory.make(ArtifactType.VALUE, "plain")
+    with ManagedArtifactSession(plain_store.session()) as handle:
+        handle.write_artifact(MODEL_ID, VERSION_ID, plain, parents=True)
+
+    store = LocalFileSystemStore(
+        StoreURI.from_string(
+            f"fs://{tmp_path}?compression=gzip&compression_threshold=0"
+        )
+    )
+    compressed = ArtifactFactory.make(ArtifactType.VALUE, "compressed")
+    with ManagedArtifactSession(store.session()) as handle:
+        handle.write_artifact(MODEL_ID, VERSION_ID, compressed)
+
+        path = Path(tmp_path, "models", MODEL_ID, VERSION_ID)
+        assert (
+            Path(path, "compressed.json")
+            .read_bytes()
+            .startswith(compression.MAGIC[CompressionAlgorithm.GZIP])
+        )
+        assert Path(path, "plain.json").read_bytes().startswith(b"{")
+
+        assert (
+            handle.read_artifact(MODEL_ID, VERSION_ID, "compressed").body
+            == compressed.body
+        )
+        assert (
+            handle.read_artifact(MODEL_ID, VERSION_ID, "plain").body
+            == plain.body
+        )
+
+
+def test_rdbs_compression() -> None:
+    """Large value data is compressed in the DB and read back transparently."""
+    store = RelationalDBStore(
+        StoreURI.from_string(
+            "sqlite+pysqlite:///:memory:?compression=gzip&compression_threshold=0"
+        ),
+        poolclass=StaticPool,
+    )
+    artifact = Array(
+        EvidenceMetadata(
+            measurement_type="typename", identifier=Identifier(name="value0")
+        ),
+        list(range(1000)),
+    ).to_model()
+    with ManagedArtifactSession(store.session()) as handle:
+        handle.write_artifact(MODEL_ID, VERSION_ID, artifact, parents=True)
+        read = handle.read_artifact(
+            MODEL_ID, VERSION_ID, artifact.header.identifier
+        )
+        assert read.body == artifact.body
+
+    with Session(store.engine) as session:
+        data_json = session.scalars(select(DBValue.data_json)).one()
+        assert data_json.startswith("gzip:")
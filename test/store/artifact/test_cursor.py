@@ -0,0 +1,26 @@
+"""
+test/store/artifact/test_cursor.py
+
+Unit tests for artifact listing cursors.
+"""
+
+import pytest
+
+import mlte.store.error as errors
+from mlte.store.artifact.cursor import ArtifactCursor
+
+
+def test_round_trip() -> None:
+    """A cursor can be encoded and decoded."""
+    cursor = ArtifactCursor(identifier="value0", timestamp=10)
+    assert ArtifactCursor.decode(cursor.encode()) == cursor
+
+    cursor = ArtifactCursor(identifier="value0")
+    assert ArtifactCursor.decode(cursor.encode()) == cursor
+
+
+@pytest.mark.parametrize("cursor", ["", "not a cursor", "bnVsbA==", "e30="])
+def test_invalid(cursor: str) -> None:
+    """Malformed cursors are rejected."""
+    with pytest.raises(errors.ErrorBadRequest):
+        ArtifactCursor.decode(cursor)
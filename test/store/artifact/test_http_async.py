@@ -0,0 +1,205 @@
+"""
+test/store/artifact/test_http_async.py
+
+Unit tests for the asyncio HTTP artifact store, run against the backend app through an ASGI transport.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import typing
+from typing import List
+
+import httpx
+import pytest
+
+import mlte.store.error as errors
+from mlte._private import url as url_utils
+from mlte.context.context import Context
+from mlte.context.model import ModelCreate, VersionCreate
+from mlte.evidence.metadata import EvidenceMetadata, Identifier
+from mlte.store.artifact.underlying.http_async import AsyncHttpArtifactStore
+from mlte.store.base import StoreURI
+from mlte.store.common.http_clients import AsyncHttpxClient
+from mlte.value.types.integer import Integer
+from test.backend.fixture import user_generator
+from test.backend.fixture.test_api import TestAPI
+from test.store.artifact.fixture import FX_MODEL_ID, FX_VERSION_ID
+
+POOL_SIZE = 4
+"""The concurrency bound of the test client."""
+
+
+class _CountingTransport(httpx.ASGITransport):
+    """An ASGI transport that records the largest number of requests in flight."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.paths: List[str] = []
+
+    async def handle_async_request(
+        self, request: httpx.Request
+    ) -> httpx.Response:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self.paths.append(request.url.path)
+        try:
+            # Yield, so that concurrent requests overlap.
+            await asyncio.sleep(0)
+            return await super().handle_async_request(request)
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture(scope="function")
+def async_store() -> AsyncHttpArtifactStore:
+    """An asyncio HTTP store configured to send its requests to the test app."""
+    user = user_generator.build_admin_user()
+    test_api = TestAPI()
+    test_api.set_users(user)
+
+    client = AsyncHttpxClient(
+        pool_size=POOL_SIZE, transport=_CountingTransport(app=test_api.app)
+    )
+    return AsyncHttpArtifactStore(
+        StoreURI.from_string(
+            url_utils.set_url_username_password(
+                "http://testserver", user.username, user.password
+            )
+        ),
+        client,
+    )
+
+
+def _transport(store: AsyncHttpArtifactStore) -> _CountingTransport:
+    return typing.cast(_CountingTransport, store.client.client._transport)
+
+
+def test_session(async_store: AsyncHttpArtifactStore) -> None:
+    """All the session operations are available as awaitables."""
+    value = Integer(
+        EvidenceMetadata(
+            measurement_type="typename", identifier=Identifier(name="id")
+        ),
+        1,
+    ).to_model()
+
+    async def run() -> None:
+        async with async_store.session() as handle:
+            await handle.create_model(ModelCreate(identifier=FX_MODEL_ID))
+            await handle.create_version(
+                FX_MODEL_ID, VersionCreate(identifier=FX_VERSION_ID)
+            )
+            assert await handle.list_models() == [FX_MODEL_ID]
+            assert await handle.list_versions(FX_MODEL_ID) == [FX_VERSION_ID]
+
+            written = await handle.write_artifact_with_header(
+                FX_MODEL_ID, FX_VERSION_ID, value
+            )
+            assert written.body == value.body
+            read = await handle.read_artifact(
+                FX_MODEL_ID, FX_VERSION_ID, "id.value"
+            )
+            assert read.body == value.body
+            assert await handle.list_artifact_headers(
+                FX_MODEL_ID, FX_VERSION_ID
+            ) == [read.header]
+            assert [
+                artifact
+                async for artifact in handle.iter_artifacts(
+                    FX_MODEL_ID, FX_VERSION_ID, page_size=1
+                )
+            ] == [read]
+
+            await handle.delete_artifact(FX_MODEL_ID, FX_VERSION_ID, "id.value")
+            assert (
+                await handle.search_artifacts(FX_MODEL_ID, FX_VERSION_ID) == []
+            )
+            await handle.delete_model(FX_MODEL_ID)
+        await async_store.aclose()
+
+    asyncio.run(run())
+
+
+def test_save_load_async(async_store: AsyncHttpArtifactStore) -> None:
+    """Many artifacts can be saved and loaded concurrently, within the concurrency bound."""
+    ctx = Context(FX_MODEL_ID, FX_VERSION_ID)
+    values = [
+        Integer(
+            EvidenceMetadata(
+                measurement_type="typename",
+                identifier=Identifier(name=f"id{i}"),
+            ),
+            i,
+        )
+        for i in range(20)
+    ]
+
+    async def run() -> List[Integer]:
+        await values[0].save_async(ctx, async_store, parents=True)
+        await asyncio.gather(
+            *(value.save_async(ctx, async_store) for value in values[1:])
+        )
+        loaded = await asyncio.gather(
+            *(
+                Integer.load_async(
+                    value.identifier, context=ctx, store=async_store
+                )
+                for value in values
+            )
+        )
+        await async_store.aclose()
+        return typing.cast(List[Integer], loaded)
+
+    assert asyncio.run(run()) == values
+
+    transport = _transport(async_store)
+    assert 1 < transport.max_in_flight <= POOL_SIZE
+    # All sessions share the client's token.
+    assert (
+        len([path for path in transport.paths if path.endswith("/token")]) == 1
+    )
+
+
+def test_write_artifacts_single_request(
+    async_store: AsyncHttpArtifactStore,
+) -> None:
+    """A batch is sent in a single request, so a batch with an existing artifact writes none of them."""
+    values = [
+        Integer(
+            EvidenceMetadata(
+                measurement_type="typename",
+                identifier=Identifier(name=f"id{i}"),
+            ),
+            i,
+        ).to_model()
+        for i in range(3)
+    ]
+
+    async def run() -> None:
+        async with async_store.session() as handle:
+            await handle.write_artifacts(
+                FX_MODEL_ID, FX_VERSION_ID, values[:2], parents=True
+            )
+            with pytest.raises(errors.ErrorAlreadyExists):
+                await handle.write_artifacts(
+                    FX_MODEL_ID, FX_VERSION_ID, [values[2], values[0]]
+                )
+            headers = await handle.list_artifact_headers(
+                FX_MODEL_ID, FX_VERSION_ID
+            )
+            assert sorted(header.identifier for header in headers) == [
+                "id0.value",
+                "id1.value",
+            ]
+        await async_store.aclose()
+
+    asyncio.run(run())
+    batches = [
+        path
+        for path in _transport(async_store).paths
+        if path.endswith("/artifact/batch")
+    ]
+    assert len(batches) == 2
@@ -0,0 +1,279 @@
+"""
+test/store/artifact/test_http_buffer.py
+
+Unit tests for write-behind buffering of HTTP store writes.
+"""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import List, Optional, Set, Tuple
+
+import pytest
+
+import mlte.store.error as errors
+from mlte.artifact.model import ArtifactModel
+from mlte.artifact.type import ArtifactType
+from mlte.store.artifact.store import ManagedArtifactSession
+from mlte.store.artifact.underlying.http import HttpArtifactStore
+from mlte.store.artifact.underlying.http_buffer import PendingWrite, WriteBuffer
+from mlte.store.base import StoreURI
+from test.fixture.artifact import ArtifactFactory
+from test.store.artifact.fixture import http_store  # noqa
+from test.store.artifact.fixture import FX_MODEL_ID, FX_VERSION_ID
+
+
+class _Server:
+    """Records the batches it receives, failing them with the given errors first, and those with existing artifacts."""
+
+    def __init__(self, *failures: Exception) -> None:
+        self.batches: List[Tuple[str, List[str]]] = []
+        self.failures = list(failures)
+        self.gate: Optional[threading.Event] = None
+        self.existing: Set[str] = set()
+
+    def write(
+        self,
+        model_id: str,
+        version_id: str,
+        artifacts: List[ArtifactModel],
+        force: bool,
+        parents: bool,
+    ) -> None:
+        if self.gate is not None:
+            self.gate.wait()
+        ids = [artifact.header.identifier for artifact in artifacts]
+        if self.existing.intersection(ids):
+            raise errors.ErrorAlreadyExists(", ".join(ids))
+        if self.failures:
+            raise self.failures.pop(0)
+        self.batches.append((model_id, ids))
+
+
+def _spooled(spool_dir: Path) -> List[Path]:
+    """The writes saved in the spool subdirectories of all buffers."""
+    return list(spool_dir.glob("*/*.json"))
+
+
+def _write(id: str, model_id: str = FX_MODEL_ID) -> PendingWrite:
+    return PendingWrite(
+        model=model_id,
+        version=FX_VERSION_ID,
+        artifact=ArtifactFactory.make(ArtifactType.VALUE, id),
+    )
+
+
+def test_batches() -> None:
+    """Writes are sent in batches of the same model and version, in order."""
+    server = _Server()
+    buffer = WriteBuffer(server.write, batch_size=2, flush_interval=60)
+    for write in [_write("a"), _write("b"), _write("c"), _write("d", "m2")]:
+        buffer.put(write)
+    buffer.flush()
+
+    assert server.batches == [
+        (FX_MODEL_ID, ["a", "b"]),
+        (FX_MODEL_ID, ["c"]),
+        ("m2", ["d"]),
+    ]
+    assert buffer.pending == 0
+    buffer.close()
+
+
+def test_scoped_flush() -> None:
+    """A flush limited to a model sends the writes to it ahead of the others, and only waits for those."""
+    server = _Server()
+    buffer = WriteBuffer(server.write, batch_size=10, flush_interval=60)
+    for write in [
+        _write("a", "m2"),
+        _write("b"),
+        _write("c", "m2"),
+        _write("d"),
+    ]:
+        buffer.put(write)
+    buffer.flush(model=FX_MODEL_ID)
+
+    assert server.batches == [(FX_MODEL_ID, ["b"]), (FX_MODEL_ID, ["d"])]
+    assert buffer.pending == 2
+
+    buffer.flush(model="m2", version=FX_VERSION_ID)
+    assert server.batches[2:] == [("m2", ["a", "c"])]
+    assert buffer.pending == 0
+    buffer.close()
+
+
+def test_flush_interval() -> None:
+    """Queued writes are sent after the flush interval without a flush."""
+    server = _Server()
+    buffer = WriteBuffer(server.write, batch_size=10, flush_interval=0.01)
+    buffer.put(_write("a"))
+    for _ in range(500):
+        if server.batches:
+            break
+        threading.Event().wait(0.01)
+    assert server.batches == [(FX_MODEL_ID, ["a"])]
+    buffer.close()
+
+
+def test_backpressure() -> None:
+    """Writers block while the buffer is full."""
+    server = _Server()
+    server.gate = threading.Event()
+    buffer = WriteBuffer(
+        server.write, batch_size=1, buffer_size=1, flush_interval=60
+    )
+    buffer.put(_write("a"))  # Taken by the thread, which waits on the gate.
+    buffer.put(_write("b"))  # Fills the buffer.
+
+    writer = threading.Thread(target=buffer.put, args=(_write("c"),))
+    writer.start()
+    writer.join(timeout=0.2)
+    assert writer.is_alive()
+
+    server.gate.set()
+    writer.join()
+    buffer.close()
+    assert [ids for _, ids in server.batches] == [["a"], ["b"], ["c"]]
+
+
+def test_error_surfaced_and_retried() -> None:
+    """A failed batch is raised by the next flush, then sent again."""
+    server = _Server(errors.InternalError("down"))
+    buffer = WriteBuffer(server.write, batch_size=10, flush_interval=60)
+    buffer.put(_write("a"))
+
+    with pytest.raises(errors.InternalError):
+        buffer.flush()
+    buffer.flush()
+    assert server.batches == [(FX_MODEL_ID, ["a"])]
+    buffer.close()
+
+
+def test_final_error_dropped() -> None:
+    """Writes failing with an error a retry cannot fix are dropped once it is raised, and only them."""
+    server = _Server()
+    server.existing = {"b"}
+    buffer = WriteBuffer(server.write, batch_size=10, flush_interval=60)
+    for id in ["a", "b", "c"]:
+        buffer.put(_write(id))
+
+    with pytest.raises(errors.ErrorAlreadyExists):
+        buffer.close()
+    assert server.batches == [(FX_MODEL_ID, ["a"]), (FX_MODEL_ID, ["c"])]
+    assert buffer.pending == 0
+
+
+def test_final_error_then_retry(tmp_path: Path) -> None:
+    """Writes after a dropped one stay queued if sending them fails in a way a retry can fix."""
+    server = _Server(errors.InternalError("down"))
+    server.existing = {"a"}
+    buffer = WriteBuffer(
+        server.write, batch_size=10, flush_interval=60, spool_dir=tmp_path
+    )
+    buffer.put(_write("a"))
+    buffer.put(_write("b"))
+
+    with pytest.raises(errors.ErrorAlreadyExists):
+        buffer.flush()
+    assert buffer.pending == 1
+    assert len(_spooled(tmp_path)) == 1
+    buffer.close()
+    assert server.batches == [(FX_MODEL_ID, ["b"])]
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_spool_replay(tmp_path: Path) -> None:
+    """Writes that could not be sent are kept in the spool, and sent by the next buffer."""
+    failing = _Server(*(errors.InternalError("down") for _ in range(3)))
+    buffer = WriteBuffer(
+        failing.write, batch_size=10, flush_interval=60, spool_dir=tmp_path
+    )
+    buffer.put(_write("a"))
+    buffer.put(_write("b"))
+    with pytest.raises(errors.InternalError):
+        buffer.close()
+    assert len(_spooled(tmp_path)) == 2
+
+    server = _Server()
+    buffer = WriteBuffer(
+        server.write, batch_size=10, flush_interval=60, spool_dir=tmp_path
+    )
+    buffer.put(_write("c"))
+    buffer.close()
+    assert server.batches == [(FX_MODEL_ID, ["a", "b", "c"])]
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_spool_shared(tmp_path: Path) -> None:
+    """Buffers sharing a spool directory do not overwrite each other's writes."""
+    servers = [_Server(errors.InternalError("down")) for _ in range(2)]
+    buffers = [
+        WriteBuffer(
+            server.write, batch_size=10, flush_interval=60, spool_dir=tmp_path
+        )
+        for server in servers
+    ]
+    for index, buffer in enumerate(buffers):
+        buffer.put(_write(f"id{index}"))
+        with pytest.raises(errors.InternalError):
+            buffer.flush()
+    assert len(_spooled(tmp_path)) == 2
+
+    for buffer in buffers:
+        buffer.close()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_spool_of_running_buffer_not_replayed(tmp_path: Path) -> None:
+    """A buffer only takes over the spooled writes of buffers that are gone."""
+    first = _Server(errors.InternalError("down"))
+    running = WriteBuffer(
+        first.write, batch_size=10, flush_interval=60, spool_dir=tmp_path
+    )
+    running.put(_write("x"))
+    with pytest.raises(errors.InternalError):
+        running.flush()
+
+    second = _Server()
+    buffer = WriteBuffer(
+        second.write, batch_size=10, flush_interval=60, spool_dir=tmp_path
+    )
+    assert buffer.pending == 0
+    buffer.close()
+    assert second.batches == []
+
+    running.close()
+    assert first.batches == [(FX_MODEL_ID, ["x"])]
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_buffered_store(http_store: HttpArtifactStore) -> None:  # noqa
+    """Writes to a buffered store are sent in the background, and visible to later reads."""
+    store = HttpArtifactStore(
+        StoreURI.from_string(f"{http_store.uri.uri}?buffered=true"),
+        http_store.client,
+    )
+    assert store.buffer is not None
+
+    artifacts = [
+        ArtifactFactory.make(ArtifactType.VALUE, f"id{i}") for i in range(5)
+    ]
+    with ManagedArtifactSession(store.session()) as handle:
+        for artifact in artifacts:
+            handle.write_artifact(
+                FX_MODEL_ID, FX_VERSION_ID, artifact, parents=True
+            )
+        read = handle.search_artifacts(FX_MODEL_ID, FX_VERSION_ID)
+    assert sorted(a.header.identifier for a in read) == [
+        f"id{i}" for i in range(5)
+    ]
+    store.close()
+
+
+def test_buffer_options_require_buffered() -> None:
+    """Buffer options are rejected unless buffering is enabled."""
+    with pytest.raises(RuntimeError):
+        HttpArtifactStore(
+            StoreURI.from_string("http://localhost:8080?spool_dir=/tmp/spool")
+        )
@@ -0,0 +1,174 @@
+"""
+test/store/artifact/test_http_cache.py
+
+Unit tests for the client-side artifact cache of the HTTP store.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List
+
+from mlte.artifact.type import ArtifactType
+from mlte.backend.api import codes
+from mlte.store.artifact.query import ArtifactTypeFilter, FilterType, Query
+from mlte.store.artifact.store import ManagedArtifactSession
+from mlte.store.artifact.underlying.http import HttpArtifactStore
+from mlte.store.artifact.underlying.http_cache import (
+    ArtifactCache,
+    parse_cache_options,
+)
+from mlte.store.base import StoreURI
+from test.fixture.artifact import ArtifactFactory
+from test.store.artifact.fixture import http_store  # noqa
+from test.store.artifact.fixture import FX_MODEL_ID, FX_VERSION_ID
+
+
+def test_parse_cache_options() -> None:
+    """Cache options are extracted from the URI query string."""
+    uri, options = parse_cache_options(
+        "http://host:8080?cache_size=10&cache_dir=/tmp/cache&pool_size=2"
+    )
+    assert uri == "http://host:8080?pool_size=2"
+    assert options == {"cache_size": 10, "cache_dir": Path("/tmp/cache")}
+
+
+def test_lru_eviction() -> None:
+    """The least recently used artifacts are evicted beyond the cache size."""
+    cache = ArtifactCache(cache_size=2)
+    artifact = ArtifactFactory.make(ArtifactType.VALUE)
+    cache.put("a", '"1"', artifact)
+    cache.put("b", '"2"', artifact)
+    assert cache.get("a") == ('"1"', artifact)
+    cache.put("c", '"3"', artifact)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+    cache.invalidate("a")
+    assert cache.get("a") is None
+
+
+def test_copies() -> None:
+    """Changes to the artifacts read from the cache do not affect it."""
+    cache = ArtifactCache()
+    artifact = ArtifactFactory.make(ArtifactType.VALUE)
+    cache.put("a", '"1"', artifact)
+
+    _, cached = cache.get("a")  # type: ignore[misc]
+    cached.header.creator = "someone"
+    assert cache.get("a") == ('"1"', artifact)
+
+
+def test_disk(tmp_path: Path) -> None:
+    """Entries persisted to a directory are available to later caches, within the size."""
+    artifact = ArtifactFactory.make(ArtifactType.VALUE)
+    cache = ArtifactCache(cache_size=2, cache_dir=tmp_path)
+    cache.put("a", '"1"', artifact)
+    cache.put("b", '"2"', artifact)
+
+    assert ArtifactCache(cache_dir=tmp_path).get("b") == ('"2"', artifact)
+    assert len(list(tmp_path.iterdir())) == 2
+
+    # A smaller cache drops the oldest entries.
+    ArtifactCache(cache_size=1, cache_dir=tmp_path)
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+def test_results(tmp_path: Path) -> None:
+    """Search results are cached as a single entry, also on disk."""
+    artifacts = [
+        ArtifactFactory.make(ArtifactType.VALUE, f"id{i}") for i in range(2)
+    ]
+    cache = ArtifactCache(cache_dir=tmp_path)
+    cache.put_results("search", '"1"', artifacts)
+    cache.put("read", '"2"', artifacts[0])
+
+    assert cache.get_results("search") == ('"1"', artifacts)
+    assert ArtifactCache(cache_dir=tmp_path).get_results("search") == (
+        '"1"',
+        artifacts,
+    )
+
+    # Artifacts and results are not mistaken for each other.
+    assert cache.get("search") is None
+    assert cache.get_results("read") is None
+
+
+def test_store_revalidates(http_store: HttpArtifactStore) -> None:  # noqa
+    """Repeated reads are answered from the cache while the server reports no change."""
+    statuses: List[int] = []
+    get = http_store.client.get
+
+    def recording_get(url: str, **kwargs):
+        res = get(url, **kwargs)
+        statuses.append(res.status_code)
+        return res
+
+    http_store.client.get = recording_get  # type: ignore[method-assign]
+
+    artifact = ArtifactFactory.make(ArtifactType.VALUE, "id0")
+    with ManagedArtifactSession(http_store.session()) as handle:
+        handle.write_artifact(
+            FX_MODEL_ID, FX_VERSION_ID, artifact, parents=True
+        )
+        first = handle.read_artifact(FX_MODEL_ID, FX_VERSION_ID, "id0")
+        second = handle.read_artifact(FX_MODEL_ID, FX_VERSION_ID, "id0")
+        assert first == second
+        assert statuses == [codes.OK, codes.NOT_MODIFIED]
+
+        # Writes drop the cached copy.
+        handle.write_artifact(FX_MODEL_ID, FX_VERSION_ID, artifact, force=True)
+        handle.read_artifact(FX_MODEL_ID, FX_VERSION_ID, "id0")
+        assert statuses[-1] == codes.OK
+
+
+def test_store_revalidates_search(
+    http_store: HttpArtifactStore,  # noqa
+) -> None:
+    """Repeated searches are answered from the cache while the server reports no change."""
+    statuses: List[int] = []
+    get = http_store.client.get
+
+    def recording_get(url: str, **kwargs):
+        res = get(url, **kwargs)
+        statuses.append(res.status_code)
+        return res
+
+    http_store.client.get = recording_get  # type: ignore[method-assign]
+
+    query = Query(
+        filter=ArtifactTypeFilter(
+            type=FilterType.TYPE, artifact_type=ArtifactType.VALUE
+        )
+    )
+    with ManagedArtifactSession(http_store.session()) as handle:
+        handle.write_artifact(
+            FX_MODEL_ID,
+            FX_VERSION_ID,
+            ArtifactFactory.make(ArtifactType.VALUE, "id0"),
+            parents=True,
+        )
+        first = handle.search_artifacts(FX_MODEL_ID, FX_VERSION_ID, query)
+        second = handle.search_artifacts(FX_MODEL_ID, FX_VERSION_ID, query)
+        assert first == second and len(first) == 1
+        assert statuses == [codes.OK, codes.NOT_MODIFIED]
+
+        # Writes change the results the server reports.
+        handle.write_artifact(
+            FX_MODEL_ID,
+            FX_VERSION_ID,
+            ArtifactFactory.make(ArtifactType.VALUE, "id1"),
+        )
+        third = handle.search_artifacts(FX_MODEL_ID, FX_VERSION_ID, query)
+        assert statuses[-1] == codes.OK and len(third) == 2
+
+
+def test_store_cache_disabled() -> None:
+    """The cache can be disabled through the URI."""
+    store = HttpArtifactStore(
+        StoreURI.from_string("http://localhost:8080?cache_size=0")
+    )
+    assert store.cache is None
+    assert store.uri.uri == "http://localhost:8080"
+    store.close()
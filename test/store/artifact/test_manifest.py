@@ -0,0 +1,112 @@
+"""
+test/store/artifact/test_manifest.py
+
+Unit tests for the artifact manifest of the local FS artifact store.
+"""
+
+from pathlib import Path
+
+from mlte.artifact.type import ArtifactType
+from mlte.context.model import ModelCreate, VersionCreate
+from mlte.store.artifact.query import ArtifactTypeFilter, FilterType, Query
+from mlte.store.artifact.store import ManagedArtifactSession
+from mlte.store.artifact.underlying.fs import LocalFileSystemStore
+from mlte.store.artifact.underlying.manifest import ArtifactManifest
+from test.store.artifact import artifact_store_creators
+
+from ...fixture.artifact import ArtifactFactory
+
+MODEL_ID = "model0"
+VERSION_ID = "version0"
+
+
+def _create_store_with_artifacts(tmp_path: Path) -> LocalFileSystemStore:
+    """Create an FS store with a mix of artifacts in a single version."""
+    store = artifact_store_creators.create_fs_store(tmp_path)
+    with ManagedArtifactSession(store.session()) as handle:
+        handle.create_model(ModelCreate(identifier=MODEL_ID))
+        handle.create_version(MODEL_ID, VersionCreate(identifier=VERSION_ID))
+        for i in range(5):
+            handle.write_artifact(
+                MODEL_ID,
+                VERSION_ID,
+                ArtifactFactory.make(ArtifactType.VALUE, f"value{i}"),
+            )
+        handle.write_artifact(
+            MODEL_ID,
+            VERSION_ID,
+            ArtifactFactory.make(ArtifactType.SPEC, "spec0"),
+        )
+    return store
+
+
+def _version_path(store: LocalFileSystemStore) -> Path:
+    return Path(store.storage.base_path, MODEL_ID, VERSION_ID)
+
+
+def test_manifest_is_maintained(tmp_path) -> None:
+    """Writes and deletes keep the manifest up to date."""
+    store = _create_store_with_artifacts(tmp_path)
+    manifest_path = Path(_version_path(store), ArtifactManifest.FILENAME)
+    assert manifest_path.exists()
+
+    entries = store.manifest.entries(_version_path(store))
+    assert [e.identifier for e in entries] == [
+        "spec0",
+        "value0",
+        "value1",
+        "value2",
+        "value3",
+        "value4",
+    ]
+    assert all(e.size > 0 for e in entries)
+
+    with ManagedArtifactSession(store.session()) as handle:
+        handle.delete_artifact(MODEL_ID, VERSION_ID, "value0")
+
+    # A fresh manifest reader sees the change on disk.
+    manifest = ArtifactManifest(store.storage)
+    assert "value0" not in [
+        e.identifier for e in manifest.entries(_version_path(store))
+    ]
+
+
+def test_pagination_and_search(tmp_path) -> None:
+    """Paginated reads and header queries are answered from the manifest."""
+    store = _create_store_with_artifacts(tmp_path)
+
+    with ManagedArtifactSession(store.session()) as handle:
+        page = handle.read_artifacts(MODEL_ID, VERSION_ID, limit=2, offset=1)
+        assert [a.header.identifier for a in page] == ["value0", "value1"]
+
+        values = handle.search_artifacts(
+            MODEL_ID,
+            VERSION_ID,
+            Query(
+                filter=ArtifactTypeFilter(
+                    type=FilterType.TYPE, artifact_type=ArtifactType.VALUE
+                )
+            ),
+        )
+        assert len(values) == 5
+
+
+def test_manifest_rebuild(tmp_path) -> None:
+    """A version folder without a manifest, or with a stale one, is indexed on read."""
+    store = _create_store_with_artifacts(tmp_path)
+    version_path = _version_path(store)
+
+    # Simulate a folder written by an older version.
+    Path(version_path, ArtifactManifest.FILENAME).unlink()
+    store = LocalFileSystemStore(store.uri)
+    with ManagedArtifactSession(store.session()) as handle:
+        assert len(handle.read_artifacts(MODEL_ID, VERSION_ID)) == 6
+
+    # Simulate a file removed behind the store's back.
+    Path(version_path, "value4.json").unlink()
+    with ManagedArtifactSession(store.session()) as handle:
+        assert len(handle.read_artifacts(MODEL_ID, VERSION_ID)) == 5
+
+    # An explicit rebuild produces the same result.
+    Path(version_path, ArtifactManifest.FILENAME).write_text("{corrupt")
+    assert len(store.manifest.rebuild(version_path)) == 5
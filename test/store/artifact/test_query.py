@@ -4,6 +4,8 @@ test/store/test_query.py
 Unit tests for store query functionality.
 """
 
+from typing import List
+
 import pytest
 
 from mlte.artifact.type import ArtifactType
@@ -12,9 +14,13 @@ from mlte.store.artifact.query import (
     AndFilter,
     ArtifactIdentifierFilter,
     ArtifactTypeFilter,
+    Filter,
     FilterType,
     NoneFilter,
     OrFilter,
+    Query,
+    decode_query,
+    encode_query,
 )
 
 from ...fixture.artifact import ArtifactFactory, TypeUtil
@@ -125,3 +131,61 @@ def test_or() -> None:
 @pytest.mark.skip("Implement.")
 def test_or_match() -> None:
     assert True
+
+
+@pytest.mark.parametrize("artifact_type", ArtifactType)
+def test_match_header(artifact_type: ArtifactType) -> None:
+    """Filters evaluated on the header agree with filters evaluated on the artifact."""
+    a = ArtifactFactory.make(artifact_type, "id0")
+
+    filters: List[Filter] = [
+        AllFilter(type=FilterType.ALL),
+        NoneFilter(type=FilterType.NONE),
+        AndFilter(
+            type=FilterType.AND,
+            filters=[
+                ArtifactIdentifierFilter(
+                    type=FilterType.IDENTIFIER, artifact_id="id0"
+                ),
+                ArtifactTypeFilter(
+                    type=FilterType.TYPE, artifact_type=artifact_type
+                ),
+            ],
+        ),
+        OrFilter(
+            type=FilterType.OR,
+            filters=[
+                ArtifactIdentifierFilter(
+                    type=FilterType.IDENTIFIER, artifact_id="id1"
+                ),
+                NoneFilter(type=FilterType.NONE),
+            ],
+        ),
+    ]
+    for filter in filters:
+        assert filter.match_header(a.header) == filter.match(a)
+
+
+def test_encode_query() -> None:
+    """Queries encoded for URLs decode to the same query, and equal queries encode the same."""
+    q = Query(
+        filter=AndFilter(
+            type=FilterType.AND,
+            filters=[
+                ArtifactIdentifierFilter(
+                    type=FilterType.IDENTIFIER, artifact_id="id0"
+                ),
+                ArtifactTypeFilter(
+                    type=FilterType.TYPE, artifact_type=ArtifactType.VALUE
+                ),
+            ],
+        )
+    )
+    encoded = encode_query(q)
+    assert decode_query(encoded) == q
+    assert encode_query(Query(**q.model_dump())) == encoded
+    assert "=" not in encoded and "/" not in encoded and "+" not in encoded
+
+    for invalid in ["", "not base64!", encode_query(Query())[:-3]]:
+        with pytest.raises(ValueError):
+            decode_query(invalid)
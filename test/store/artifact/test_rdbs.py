@@ -0,0 +1,316 @@
+"""
+test/store/artifact/test_rdbs.py
+
+Unit tests for the relational DB artifact store implementation.
+"""
+
+from contextlib import contextmanager
+from typing import Generator, List
+
+import pytest
+from sqlalchemy import event, inspect, text
+
+import mlte.store.error as errors
+from mlte.artifact.type import ArtifactType
+from mlte.context.model import ModelCreate, VersionCreate
+from mlte.store.artifact.query import (
+    AndFilter,
+    ArtifactIdentifierFilter,
+    ArtifactTypeFilter,
+    FilterType,
+    NoneFilter,
+    OrFilter,
+    Query,
+)
+from mlte.store.artifact.store import ManagedArtifactSession
+from mlte.store.artifact.underlying.rdbs.query import compile_filter
+from mlte.store.artifact.underlying.rdbs.store import (
+    RelationalDBStore,
+    RelationalDBStoreSession,
+)
+from mlte.store.base import StoreURI
+from test.store.artifact import artifact_store_creators
+
+from ...fixture.artifact import (
+    ArtifactFactory,
+    make_complete_validated_spec_model,
+)
+
+MODEL_ID = "model0"
+VERSION_ID = "version0"
+
+
+def _write_values(
+    handle: RelationalDBStoreSession, timestamps: List[int]
+) -> None:
+    """Write one value artifact per given timestamp."""
+    handle.create_model(ModelCreate(identifier=MODEL_ID))
+    handle.create_version(MODEL_ID, VersionCreate(identifier=VERSION_ID))
+    for i, timestamp in enumerate(timestamps):
+        artifact = ArtifactFactory.make(ArtifactType.VALUE, f"value{i}")
+        artifact.header.timestamp = timestamp
+        handle.write_artifact(MODEL_ID, VERSION_ID, artifact)
+
+
+def _ids(handle: RelationalDBStoreSession, **kwargs) -> List[str]:
+    """Read artifacts and return their identifiers."""
+    return [
+        a.header.identifier
+        for a in handle.read_artifacts(MODEL_ID, VERSION_ID, **kwargs)
+    ]
+
+
+@pytest.fixture(scope="function")
+def handle() -> Generator[RelationalDBStoreSession, None, None]:
+    """A session to an in-memory RDBS store with some values."""
+    store = artifact_store_creators.create_rdbs_store()
+    session = store.session()
+    _write_values(session, [30, 10, 20, 10])
+    yield session
+    session.close()
+
+
+def test_read_artifacts_order(handle: RelationalDBStoreSession) -> None:
+    """Artifacts are read ordered by timestamp, then identifier."""
+    assert _ids(handle) == ["value1", "value3", "value2", "value0"]
+
+
+def test_read_artifacts_limit_offset(handle: RelationalDBStoreSession) -> None:
+    """Limit and offset are applied over the ordered artifacts."""
+    assert _ids(handle, limit=2, offset=1) == ["value3", "value2"]
+    assert _ids(handle, limit=10, offset=4) == []
+
+
+def test_read_artifacts_after(handle: RelationalDBStoreSession) -> None:
+    """Keyset pagination continues after the given artifact."""
+    assert _ids(handle, limit=2, after="value3") == ["value2", "value0"]
+    assert _ids(handle, after="value0") == []
+
+    with pytest.raises(errors.ErrorNotFound):
+        _ids(handle, after="missing")
+
+
+def test_search_artifacts_page_keyset(
+    handle: RelationalDBStoreSession,
+) -> None:
+    """Pages follow the timestamp order, and cursors survive deleting the artifact they point to."""
+    page = handle.search_artifacts_page(MODEL_ID, VERSION_ID, limit=2)
+    assert [a.header.identifier for a in page.artifacts] == ["value1", "value3"]
+    assert page.next is not None
+
+    handle.delete_artifact(MODEL_ID, VERSION_ID, "value3")
+    page = handle.search_artifacts_page(
+        MODEL_ID, VERSION_ID, limit=2, cursor=page.next
+    )
+    assert [a.header.identifier for a in page.artifacts] == ["value2", "value0"]
+    assert page.next is None
+
+
+def test_list_artifact_headers_single_query(
+    handle: RelationalDBStoreSession,
+) -> None:
+    """Headers are listed with one query over the header table, without touching any body table."""
+    with _count_queries(handle) as statements:
+        headers = handle.list_artifact_headers(MODEL_ID, VERSION_ID)
+
+    assert [h.identifier for h in headers] == [
+        "value1",
+        "value3",
+        "value2",
+        "value0",
+    ]
+    assert len(statements) == 1
+    assert "value" not in statements[0].replace("artifact_header", "")
+
+
+def test_search_artifacts_in_sql(handle: RelationalDBStoreSession) -> None:
+    """Filters are translated to SQL and results are not truncated."""
+    for i in range(4, 120):
+        handle.write_artifact(
+            MODEL_ID,
+            VERSION_ID,
+            ArtifactFactory.make(ArtifactType.VALUE, f"value{i}"),
+        )
+    handle.write_artifact(
+        MODEL_ID, VERSION_ID, ArtifactFactory.make(ArtifactType.SPEC, "spec0")
+    )
+
+    values = ArtifactTypeFilter(
+        type=FilterType.TYPE, artifact_type=ArtifactType.VALUE
+    )
+    assert compile_filter(values) is not None
+    assert (
+        len(handle.search_artifacts(MODEL_ID, VERSION_ID, Query(filter=values)))
+        == 120
+    )
+
+    query = Query(
+        filter=OrFilter(
+            type=FilterType.OR,
+            filters=[
+                ArtifactIdentifierFilter(
+                    type=FilterType.IDENTIFIER, artifact_id="value2"
+                ),
+                AndFilter(
+                    type=FilterType.AND,
+                    filters=[
+                        ArtifactIdentifierFilter(
+                            type=FilterType.IDENTIFIER, artifact_id="spec0"
+                        ),
+                        ArtifactTypeFilter(
+                            type=FilterType.TYPE,
+                            artifact_type=ArtifactType.SPEC,
+                        ),
+                    ],
+                ),
+            ],
+        )
+    )
+    assert sorted(
+        a.header.identifier
+        for a in handle.search_artifacts(MODEL_ID, VERSION_ID, query)
+    ) == ["spec0", "value2"]
+    assert (
+        handle.search_artifacts(
+            MODEL_ID, VERSION_ID, Query(filter=NoneFilter(type=FilterType.NONE))
+        )
+        == []
+    )
+
+
+def test_search_artifacts_fallback(
+    handle: RelationalDBStoreSession, monkeypatch
+) -> None:
+    """Filters that can't be translated are evaluated in Python."""
+    monkeypatch.setattr(
+        "mlte.store.artifact.underlying.rdbs.store.compile_filter",
+        lambda _: None,
+    )
+    query = Query(
+        filter=ArtifactIdentifierFilter(
+            type=FilterType.IDENTIFIER, artifact_id="value1"
+        )
+    )
+    artifacts = handle.search_artifacts(MODEL_ID, VERSION_ID, query)
+    assert [a.header.identifier for a in artifacts] == ["value1"]
+
+
+def test_sessions_share_engine() -> None:
+    """Closing a session keeps the store's connection pool alive."""
+    store = artifact_store_creators.create_rdbs_store()
+    with ManagedArtifactSession(store.session()) as handle:
+        assert isinstance(handle, RelationalDBStoreSession)
+        _write_values(handle, [10])
+    with ManagedArtifactSession(store.session()) as handle:
+        assert isinstance(handle, RelationalDBStoreSession)
+        assert _ids(handle) == ["value0"]
+    store.close()
+
+
+@contextmanager
+def _count_queries(
+    handle: RelationalDBStoreSession,
+) -> Generator[List[str], None, None]:
+    """Record the SQL statements executed on the session's engine."""
+    statements: List[str] = []
+
+    def record(conn, cursor, statement, *args) -> None:
+        statements.append(statement)
+
+    event.listen(handle.engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(handle.engine, "before_cursor_execute", record)
+
+
+# The maximum number of queries needed to read a full artifact of each type.
+MAX_QUERIES = {
+    ArtifactType.NEGOTIATION_CARD: 11,
+    ArtifactType.VALUE: 5,
+    ArtifactType.SPEC: 7,
+    ArtifactType.VALIDATED_SPEC: 8,
+    ArtifactType.REPORT: 11,
+}
+
+
+@pytest.mark.parametrize("artifact_type", ArtifactType)
+def test_read_query_count(artifact_type: ArtifactType) -> None:
+    """Reading artifacts takes a bounded number of queries, regardless of their contents or count."""
+    store = artifact_store_creators.create_rdbs_store()
+    with ManagedArtifactSession(store.session()) as handle:
+        assert isinstance(handle, RelationalDBStoreSession)
+        handle.create_model(ModelCreate(identifier=MODEL_ID))
+        handle.create_version(MODEL_ID, VersionCreate(identifier=VERSION_ID))
+        handle.write_artifact(
+            MODEL_ID,
+            VERSION_ID,
+            ArtifactFactory.make(ArtifactType.SPEC, "spec", complete=True),
+        )
+        for i in range(3):
+            artifact = ArtifactFactory.make(
+                artifact_type, f"id{i}", complete=True
+            )
+            if artifact_type == ArtifactType.VALIDATED_SPEC:
+                artifact.body = make_complete_validated_spec_model()
+                artifact.body.spec_identifier = "spec"
+            handle.write_artifact(MODEL_ID, VERSION_ID, artifact)
+
+        query = Query(
+            filter=ArtifactTypeFilter(
+                type=FilterType.TYPE, artifact_type=artifact_type
+            )
+        )
+        with _count_queries(handle) as one:
+            handle.read_artifact(MODEL_ID, VERSION_ID, "id0")
+        with _count_queries(handle) as page:
+            artifacts = handle.search_artifacts(MODEL_ID, VERSION_ID, query)
+
+        assert len(artifacts) == (
+            4 if artifact_type == ArtifactType.SPEC else 3
+        )
+        assert len(one) <= MAX_QUERIES[artifact_type]
+        assert len(page) <= MAX_QUERIES[artifact_type]
+
+
+def test_same_identifier_in_versions(handle: RelationalDBStoreSession) -> None:
+    """Artifacts are looked up in their own model and version."""
+    handle.create_version(MODEL_ID, VersionCreate(identifier="version1"))
+    other = ArtifactFactory.make(ArtifactType.VALUE, "value0")
+    other.header.timestamp = 99
+    handle.write_artifact(MODEL_ID, "version1", other)
+
+    assert (
+        handle.read_artifact(MODEL_ID, VERSION_ID, "value0").header.timestamp
+        == 30
+    )
+    assert (
+        handle.read_artifact(MODEL_ID, "version1", "value0").header.timestamp
+        == 99
+    )
+
+    handle.delete_artifact(MODEL_ID, "version1", "value0")
+    assert (
+        handle.read_artifact(MODEL_ID, VERSION_ID, "value0").header.timestamp
+        == 30
+    )
+
+
+def test_index_upgrade(tmp_path) -> None:
+    """Indexes missing from an existing DB are created at startup."""
+    uri = StoreURI.from_string(f"sqlite:///{tmp_path}/store.db")
+    index = "ix_artifact_header_version_identifier"
+
+    store = RelationalDBStore(uri)
+    with store.engine.begin() as conn:
+        conn.execute(text(f"DROP INDEX {index}"))
+    store.close()
+
+    for _ in range(2):
+        store = RelationalDBStore(uri)
+        names = [
+            i["name"]
+            for i in inspect(store.engine).get_indexes("artifact_header")
+        ]
+        assert index in names
+        store.close()
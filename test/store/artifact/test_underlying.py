@@ -10,6 +10,7 @@ import mlte.store.error as errors
 from mlte.artifact.model import ArtifactModel
 from mlte.artifact.type import ArtifactType
 from mlte.context.model import ModelCreate, VersionCreate
+from mlte.store.artifact.query import ArtifactTypeFilter, FilterType, Query
 from mlte.store.artifact.store import (
     ArtifactStore,
     ArtifactStoreSession,
@@ -364,3 +365,134 @@ def test_artifact_overwrite(
 
         # Attempt to write with `force` succeeds
         _ = handle.write_artifact(model_id, version_id, artifact, force=True)
+
+
+@pytest.mark.parametrize("store_fixture_name", artifact_stores())
+def test_write_artifacts(
+    store_fixture_name: str, request: pytest.FixtureRequest
+) -> None:
+    """An artifact store supports writing artifacts in batches."""
+    store: ArtifactStore = request.getfixturevalue(store_fixture_name)
+
+    model_id = "model0"
+    version_id = "version0"
+
+    artifacts = [
+        ArtifactFactory.make(ArtifactType.VALUE, f"value{i}") for i in range(3)
+    ] + [ArtifactFactory.make(ArtifactType.SPEC, "spec0", complete=True)]
+
+    with ManagedArtifactSession(store.session()) as handle:
+        written = handle.write_artifacts(
+            model_id, version_id, artifacts, parents=True
+        )
+        assert len(written) == 4
+        assert len(handle.search_artifacts(model_id, version_id)) == 4
+        assert (
+            handle.read_artifact(model_id, version_id, "spec0").body
+            == artifacts[3].body
+        )
+
+        # A batch with an existing artifact is not written at all.
+        new = ArtifactFactory.make(ArtifactType.VALUE, "value3")
+        with pytest.raises(errors.ErrorAlreadyExists):
+            handle.write_artifacts(model_id, version_id, [new, artifacts[0]])
+        with pytest.raises(errors.ErrorNotFound):
+            handle.read_artifact(model_id, version_id, "value3")
+
+        # Nor is a batch with repeated identifiers.
+        with pytest.raises(errors.ErrorAlreadyExists):
+            handle.write_artifacts(model_id, version_id, [new, new])
+
+        # Attempt to write with `force` succeeds
+        handle.write_artifacts(
+            model_id, version_id, [new, artifacts[0]], force=True
+        )
+        assert len(handle.search_artifacts(model_id, version_id)) == 5
+
+
+@pytest.mark.parametrize("store_fixture_name", artifact_stores())
+def test_iter_artifacts(
+    store_fixture_name: str, request: pytest.FixtureRequest
+) -> None:
+    """An artifact store supports iterating over artifacts page by page."""
+    store: ArtifactStore = request.getfixturevalue(store_fixture_name)
+
+    model_id = "model0"
+    version_id = "version0"
+
+    artifacts = [
+        ArtifactFactory.make(ArtifactType.VALUE, f"value{i}") for i in range(7)
+    ] + [ArtifactFactory.make(ArtifactType.SPEC, "spec0", complete=True)]
+
+    with ManagedArtifactSession(store.session()) as handle:
+        handle.write_artifacts(model_id, version_id, artifacts, parents=True)
+
+        ids = [
+            artifact.header.identifier
+            for artifact in handle.iter_artifacts(
+                model_id, version_id, page_size=3
+            )
+        ]
+        assert sorted(ids) == sorted(a.header.identifier for a in artifacts)
+
+        query = Query(
+            filter=ArtifactTypeFilter(
+                type=FilterType.TYPE, artifact_type=ArtifactType.VALUE
+            )
+        )
+        values = list(
+            handle.iter_artifacts(model_id, version_id, query, page_size=2)
+        )
+        assert len(values) == 7
+        assert all(a.header.type == ArtifactType.VALUE for a in values)
+
+        page = handle.search_artifacts_page(model_id, version_id, limit=8)
+        assert len(page.artifacts) == 8
+        assert page.next is None
+
+        with pytest.raises(errors.ErrorBadRequest):
+            handle.search_artifacts_page(
+                model_id, version_id, cursor="not a cursor"
+            )
+        with pytest.raises(errors.ErrorBadRequest):
+            list(handle.iter_artifacts(model_id, version_id, page_size=0))
+
+
+@pytest.mark.parametrize("store_fixture_name", artifact_stores())
+def test_list_artifact_headers(
+    store_fixture_name: str, request: pytest.FixtureRequest
+) -> None:
+    """An artifact store supports listing artifact headers."""
+    store: ArtifactStore = request.getfixturevalue(store_fixture_name)
+
+    model_id = "model0"
+    version_id = "version0"
+
+    artifacts = [
+        ArtifactFactory.make(ArtifactType.VALUE, f"value{i}") for i in range(3)
+    ] + [ArtifactFactory.make(ArtifactType.SPEC, "spec0", complete=True)]
+
+    with ManagedArtifactSession(store.session()) as handle:
+        handle.write_artifacts(model_id, version_id, artifacts, parents=True)
+
+        headers = handle.list_artifact_headers(model_id, version_id)
+        assert sorted(h.identifier for h in headers) == [
+            "spec0",
+            "value0",
+            "value1",
+            "value2",
+        ]
+
+        query = Query(
+            filter=ArtifactTypeFilter(
+                type=FilterType.TYPE, artifact_type=ArtifactType.SPEC
+            )
+        )
+        headers = handle.list_artifact_headers(model_id, version_id, query)
+        assert len(headers) == 1
+        assert headers[0].identifier == "spec0"
+        assert headers[0].type == ArtifactType.SPEC
+        assert (
+            headers[0]
+            == handle.read_artifact(model_id, version_id, "spec0").header
+        )
@@ -0,0 +1,103 @@
+"""
+test/store/common/test_compression.py
+
+Unit tests for compression of stored payloads.
+"""
+
+import base64
+import os
+
+import pytest
+
+from mlte.store.common import compression
+from mlte.store.common.compression import Compression, CompressionAlgorithm
+
+PAYLOAD = b'{"data": [' + b", ".join(b"%d" % i for i in range(1000)) + b"]}"
+
+
+def test_round_trip() -> None:
+    """Compressed payloads are detected and decompressed on read."""
+    gzip = Compression(CompressionAlgorithm.GZIP, threshold=0)
+    stored = gzip.compress(PAYLOAD)
+    assert stored.startswith(compression.MAGIC[CompressionAlgorithm.GZIP])
+    assert len(stored) < len(PAYLOAD)
+    assert compression.decompress(stored) == PAYLOAD
+
+    # Uncompressed payloads are read as they are.
+    assert compression.decompress(PAYLOAD) == PAYLOAD
+
+
+@pytest.mark.skipif(
+    not compression.zstd_available(), reason="zstandard is not installed"
+)
+def test_zstd_round_trip() -> None:
+    """Zstandard compressed payloads and text are detected and decompressed on read."""
+    zstd = Compression(CompressionAlgorithm.ZSTD, threshold=0)
+    stored = zstd.compress(PAYLOAD)
+    assert stored.startswith(compression.MAGIC[CompressionAlgorithm.ZSTD])
+    assert len(stored) < len(PAYLOAD)
+    assert compression.decompress(stored) == PAYLOAD
+
+    text = PAYLOAD.decode("utf-8")
+    stored_text = zstd.compress_text(text)
+    assert stored_text.startswith("zstd:")
+    assert compression.decompress_text(stored_text) == text
+
+
+@pytest.mark.skipif(
+    compression.zstd_available(), reason="zstandard is installed"
+)
+def test_zstd_unavailable() -> None:
+    """Zstandard compression can't be configured without the zstandard package."""
+    with pytest.raises(RuntimeError):
+        Compression(CompressionAlgorithm.ZSTD)
+
+
+def test_threshold() -> None:
+    """Payloads under the threshold are not compressed."""
+    gzip = Compression(CompressionAlgorithm.GZIP, threshold=len(PAYLOAD) + 1)
+    assert gzip.compress(PAYLOAD) == PAYLOAD
+    assert compression.NO_COMPRESSION.compress(PAYLOAD) == PAYLOAD
+
+
+def test_text_round_trip() -> None:
+    """Compressed text is tagged with its algorithm and detected on read."""
+    text = PAYLOAD.decode("utf-8")
+    gzip = Compression(CompressionAlgorithm.GZIP, threshold=0)
+    stored = gzip.compress_text(text)
+    assert stored.startswith("gzip:")
+    assert len(stored) < len(text)
+    assert compression.decompress_text(stored) == text
+    assert compression.decompress_text(text) == text
+
+    # Payloads that do not shrink are kept as they are.
+    media = base64.b64encode(os.urandom(4096)).decode("ascii")
+    assert gzip.compress_text(media) == media
+
+
+def test_parse_compression_options() -> None:
+    """Compression options are extracted from the URI query string."""
+    uri, settings = compression.parse_compression_options(
+        "sqlite:///db.sqlite?compression=gzip&compression_threshold=10&pool_size=2"
+    )
+    assert uri == "sqlite:///db.sqlite?pool_size=2"
+    assert settings.algorithm == CompressionAlgorithm.GZIP
+    assert settings.threshold == 10
+
+    uri, settings = compression.parse_compression_options(
+        "fs:///tmp/store?compression=auto"
+    )
+    assert uri == "fs:///tmp/store"
+    assert settings.algorithm == compression.default_algorithm()
+    assert settings.threshold == compression.DEFAULT_THRESHOLD
+
+    uri, settings = compression.parse_compression_options("fs:///tmp/store")
+    assert uri == "fs:///tmp/store"
+    assert not settings.enabled
+
+    with pytest.raises(RuntimeError):
+        compression.parse_compression_options("fs://store?compression=lz4")
+    with pytest.raises(RuntimeError):
+        compression.parse_compression_options(
+            "fs://store?compression=gzip&compression_threshold=big"
+        )
@@ -0,0 +1,64 @@
+"""
+test/store/common/test_encoding.py
+
+Unit tests for the encodings of HTTP store bodies.
+"""
+
+import gzip
+
+import pytest
+
+from mlte.store.common import encoding
+from mlte.store.common.http_clients import RequestsClient
+
+
+def test_json_round_trip() -> None:
+    """Small bodies are sent as plain JSON, even when compression is on."""
+    body = encoding.encode_body({"a": [1, 2]}, compress=True)
+    assert body["headers"] == {"Content-Type": encoding.JSON_CONTENT_TYPE}
+    assert encoding.decode_body(body["data"], "application/json") == {
+        "a": [1, 2]
+    }
+
+
+def test_large_bodies_compressed() -> None:
+    """Bodies from the minimum size on are gzip compressed."""
+    payload = {"values": list(range(encoding.GZIP_MINIMUM_SIZE))}
+    body = encoding.encode_body(payload, compress=True)
+    assert body["headers"]["Content-Encoding"] == encoding.GZIP_ENCODING
+    assert encoding.decode_body(gzip.decompress(body["data"]), None) == payload
+
+
+def test_accepts_msgpack() -> None:
+    """MessagePack is detected among the accepted media types."""
+    assert encoding.accepts_msgpack("application/json, application/msgpack")
+    assert not encoding.accepts_msgpack("application/json")
+    assert not encoding.accepts_msgpack(None)
+
+
+def test_accepts_ndjson() -> None:
+    """Newline delimited JSON is detected among the accepted media types."""
+    assert encoding.accepts_ndjson("application/x-ndjson; q=1.0")
+    assert not encoding.accepts_ndjson("application/json, */*")
+    assert not encoding.accepts_ndjson(None)
+
+
+@pytest.mark.skipif(
+    not encoding.msgpack_available(), reason="msgpack is not installed"
+)
+def test_msgpack_round_trip() -> None:
+    """MessagePack bodies decode to the original payload."""
+    payload = {"a": [1, 2.5, "b", None]}
+    body = encoding.encode_body(payload, use_msgpack=True)
+    assert body["headers"]["Content-Type"] == encoding.MSGPACK_CONTENT_TYPE
+    assert (
+        encoding.decode_body(body["data"], encoding.MSGPACK_CONTENT_TYPE)
+        == payload
+    )
+
+
+@pytest.mark.skipif(encoding.msgpack_available(), reason="msgpack is installed")
+def test_msgpack_unavailable() -> None:
+    """Clients cannot be configured for MessagePack without the package."""
+    with pytest.raises(RuntimeError):
+        RequestsClient(msgpack=True)
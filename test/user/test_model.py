@@ -4,9 +4,25 @@ test/user/test_model.py
 Test the user and permission functions.
 """
 
+import itertools
+
 import pytest
 
-from mlte.user.model import MethodType, Permission, ResourceType
+from mlte.user.model import (
+    Group,
+    MethodType,
+    Permission,
+    PermissionIndex,
+    ResourceType,
+)
+
+ALL_PERMISSIONS = [
+    Permission(resource_type=type, resource_id=id, method=MethodType(method))
+    for type, id, method in itertools.product(
+        [ResourceType.MODEL, ResourceType.USER], [None, "1", "2"], MethodType
+    )
+]
+"""Permissions with every combination of wildcards."""
 
 
 @pytest.mark.parametrize(
@@ -212,3 +228,24 @@ def test_permission_granted_id_method(
     permission_granted = permission.grants_access(requested)
 
     assert permission_granted
+
+
+@pytest.mark.parametrize("permission", ALL_PERMISSIONS)
+def test_permission_index(permission: Permission) -> None:
+    """Checks that an index grants access to the same requests as its permissions."""
+    index = PermissionIndex.from_groups(
+        [Group(name="group", permissions=[permission])]
+    )
+
+    for requested in ALL_PERMISSIONS:
+        assert index.grants_access(requested) == permission.grants_access(
+            requested
+        )
+
+
+def test_permission_index_empty() -> None:
+    """Checks that an empty index grants nothing."""
+    index = PermissionIndex()
+
+    assert len(index) == 0
+    assert not any(index.grants_access(p) for p in ALL_PERMISSIONS)
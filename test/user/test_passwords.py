@@ -16,3 +16,18 @@ def test_hash_verification() -> None:
     verification_success = passwords.verify_password(password, hashed_pass)
 
     assert verification_success
+
+
+def test_rounds() -> None:
+    """Checks that hashes use the configured cost, and older ones are flagged for rehashing."""
+    try:
+        passwords.set_rounds(4)
+        hashed_pass = passwords.hash_password("secret")
+        assert hashed_pass.split("$")[2] == "04"
+        assert not passwords.needs_rehash(hashed_pass)
+
+        passwords.set_rounds(5)
+        assert passwords.needs_rehash(hashed_pass)
+        assert passwords.verify_password("secret", hashed_pass)
+    finally:
+        passwords.set_rounds(passwords.DEFAULT_ROUNDS)
@@ -39,3 +39,28 @@ def test_load_all(
     assert len(models) == 2
     assert models[0] == v1 or models[0] == v2
     assert models[1] == v1 or models[1] == v2
+
+
+def test_save_all(
+    store_with_context: Tuple[ArtifactStore, Context],  # noqa
+):
+    """
+    Saving a batch of values.
+    """
+    store, ctx = store_with_context
+
+    values = [
+        Integer(
+            EvidenceMetadata(
+                measurement_type="typename",
+                identifier=Identifier(name=f"id{i}"),
+            ),
+            i,
+        )
+        for i in range(10)
+    ]
+    Value.save_all_with(values, ctx, store)
+
+    models = Value.load_all_with(ctx, store)
+    assert len(models) == 10
+    assert all(value in models for value in values)
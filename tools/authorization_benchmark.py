@@ -0,0 +1,115 @@
+"""
+tools/authorization_benchmark.py
+
+A tool for measuring the cost of authorization checks for users with many permissions.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from typing import List
+
+from mlte.backend.api.auth.authorization import is_authorized
+from mlte.store.user.policy import Policy
+from mlte.user.model import (
+    BasicUser,
+    Group,
+    MethodType,
+    Permission,
+    PermissionIndex,
+    ResourceType,
+)
+
+# Script exit codes
+EXIT_SUCCESS = 0
+EXIT_FAILURE = 1
+
+
+def build_user(permissions: int) -> BasicUser:
+    """Build a user in the read and edit groups of as many models as needed for the number of permissions."""
+    groups: List[Group] = []
+    count = 0
+    model = 0
+    while count < permissions:
+        for group in Policy.build_groups(ResourceType.MODEL, f"model{model}"):
+            groups.append(group)
+            count += len(group.permissions)
+        model += 1
+    return BasicUser(username="user", groups=groups)
+
+
+def linear_scan(user: BasicUser, resource: Permission) -> bool:
+    """Check access by trying every permission of every group, as done before the index."""
+    return any(
+        permission.grants_access(resource)
+        for group in user.groups
+        for permission in group.permissions
+    )
+
+
+def sample_requests(models: int, count: int, seed: int) -> List[Permission]:
+    """Build requests on random models, half of which the user has no permissions for."""
+    rng = random.Random(seed)
+    return [
+        Permission(
+            resource_type=ResourceType.MODEL,
+            resource_id=f"model{rng.randrange(2 * models)}",
+            method=MethodType(rng.choice(list(MethodType))),
+        )
+        for _ in range(count)
+    ]
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse commandline arguments."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--permissions",
+        type=int,
+        default=10_000,
+        help="Permissions of the benchmark user.",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=200, help="Checks timed per case."
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="Seed for the sample requests."
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_arguments()
+
+    user = build_user(args.permissions)
+    models = len(user.groups) // 2
+    requests = sample_requests(models, args.repeat, args.seed)
+
+    start = time.perf_counter()
+    index = PermissionIndex.from_groups(user.groups)
+    build_us = (time.perf_counter() - start) * 1e6
+
+    start = time.perf_counter()
+    expected = [linear_scan(user, request) for request in requests]
+    scan_us = (time.perf_counter() - start) * 1e6 / args.repeat
+
+    start = time.perf_counter()
+    granted = [is_authorized(user, request, index) for request in requests]
+    index_us = (time.perf_counter() - start) * 1e6 / args.repeat
+
+    if granted != expected:
+        print("Index and linear scan disagree.", file=sys.stderr)
+        return EXIT_FAILURE
+
+    print(f"permissions: {len(index)} in {len(user.groups)} groups")
+    print(f"index build: {build_us:.0f} us")
+    print(f"linear scan: {scan_us:.1f} us per check")
+    print(f"index:       {index_us:.1f} us per check")
+    return EXIT_SUCCESS
+
+
+if __name__ == "__main__":
+    sys.exit(main())
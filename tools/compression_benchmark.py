@@ -0,0 +1,151 @@
+"""
+tools/compression_benchmark.py
+
+A tool for measuring the size and latency tradeoff of compressed artifact storage.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from mlte.artifact.model import ArtifactModel
+from mlte.evidence.metadata import EvidenceMetadata, Identifier
+from mlte.store.artifact.factory import create_store
+from mlte.store.artifact.store import ArtifactStore, ManagedArtifactSession
+from mlte.store.artifact.underlying.rdbs.metadata_value import DBValue
+from mlte.store.artifact.underlying.rdbs.store import RelationalDBStore
+from mlte.store.common import compression
+from mlte.value.types.array import Array
+from mlte.value.types.image import Image
+from mlte.value.types.integer import Integer
+
+# Script exit codes
+EXIT_SUCCESS = 0
+EXIT_FAILURE = 1
+
+MODEL_ID = "model"
+VERSION_ID = "version"
+
+
+def _metadata(name: str) -> EvidenceMetadata:
+    """Build the metadata for a benchmark value."""
+    return EvidenceMetadata(
+        measurement_type="benchmark", identifier=Identifier(name=name)
+    )
+
+
+def sample_values(seed: int) -> Dict[str, ArtifactModel]:
+    """Build representative values: a scalar, a large array and an image."""
+    rng = random.Random(seed)
+    size = 256 * 1024
+    return {
+        "integer": Integer(_metadata("integer"), 42).to_model(),
+        "array": Array(
+            _metadata("array"), [rng.random() for _ in range(100_000)]
+        ).to_model(),
+        # Image data is already compressed, so random bytes are representative.
+        "image": Image(
+            _metadata("image"),
+            rng.getrandbits(8 * size).to_bytes(size, "little"),
+        ).to_model(),
+    }
+
+
+def stored_size(store: ArtifactStore, root: Path, artifact_id: str) -> int:
+    """Get the number of bytes used to store an artifact's payload."""
+    if isinstance(store, RelationalDBStore):
+        with Session(store.engine) as session:
+            return int(
+                session.scalar(select(func.sum(func.length(DBValue.data_json))))
+                or 0
+            )
+    return (
+        Path(root, "models", MODEL_ID, VERSION_ID, f"{artifact_id}.json")
+        .stat()
+        .st_size
+    )
+
+
+def measure(
+    uri: str, root: Path, artifact: ArtifactModel, repeat: int
+) -> Tuple[int, float, float]:
+    """
+    Write and read an artifact repeatedly on a fresh store.
+    :return: The stored size in bytes, and the mean write and read times in milliseconds
+    """
+    store = create_store(uri)
+    identifier = artifact.header.identifier
+    try:
+        with ManagedArtifactSession(store.session()) as handle:
+            handle.write_artifact(MODEL_ID, VERSION_ID, artifact, parents=True)
+
+            start = time.perf_counter()
+            for _ in range(repeat):
+                handle.write_artifact(
+                    MODEL_ID, VERSION_ID, artifact, force=True
+                )
+            write_ms = (time.perf_counter() - start) * 1000 / repeat
+
+            start = time.perf_counter()
+            for _ in range(repeat):
+                handle.read_artifact(MODEL_ID, VERSION_ID, identifier)
+            read_ms = (time.perf_counter() - start) * 1000 / repeat
+
+        return stored_size(store, root, identifier), write_ms, read_ms
+    finally:
+        store.close()
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse commandline arguments."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--repeat", type=int, default=20, help="Operations timed per case."
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="Seed for the sample data."
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_arguments()
+
+    modes: List[str] = ["none", "gzip"]
+    if compression.zstd_available():
+        modes.append("zstd")
+
+    print(
+        f"{'backend':<8} {'value':<8} {'mode':<6} {'bytes':>10} {'write ms':>10} {'read ms':>10}"
+    )
+    for name, artifact in sample_values(args.seed).items():
+        for mode in modes:
+            with tempfile.TemporaryDirectory() as tmp:
+                root = Path(tmp)
+                options = "" if mode == "none" else f"?compression={mode}"
+                uris = {
+                    "fs": f"fs://{root}{options}",
+                    "rdbs": f"sqlite:///{os.path.join(tmp, 'store.db')}{options}",
+                }
+                for backend, uri in uris.items():
+                    size, write_ms, read_ms = measure(
+                        uri, root, artifact, args.repeat
+                    )
+                    print(
+                        f"{backend:<8} {name:<8} {mode:<6} {size:>10} {write_ms:>10.2f} {read_ms:>10.2f}"
+                    )
+    return EXIT_SUCCESS
+
+
+if __name__ == "__main__":
+    sys.exit(main())
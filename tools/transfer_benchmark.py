@@ -0,0 +1,176 @@
+"""
+tools/transfer_benchmark.py
+
+A tool for measuring the payload size and latency of artifact transfers with each body encoding.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from typing import Any, Dict, List, Tuple
+
+from fastapi.testclient import TestClient
+
+import mlte.backend.app_factory as app_factory
+import mlte.store.artifact.factory as artifact_store_factory
+import mlte.store.user.factory as user_store_factory
+from mlte.artifact.model import ArtifactModel
+from mlte.backend.api import codes
+from mlte.backend.api.model import WriteArtifactRequest
+from mlte.backend.core.config import settings
+from mlte.backend.state import state
+from mlte.evidence.metadata import EvidenceMetadata, Identifier
+from mlte.store.base import StoreURIPrefix
+from mlte.store.common import encoding
+from mlte.store.user.store import DEFAULT_PASSWORD, DEFAULT_USERNAME
+from mlte.value.types.array import Array
+from mlte.value.types.image import Image
+from mlte.value.types.integer import Integer
+
+# Script exit codes
+EXIT_SUCCESS = 0
+EXIT_FAILURE = 1
+
+MODEL_ID = "model"
+VERSION_ID = "version"
+
+ARTIFACT_URL = (
+    f"{settings.API_PREFIX}/model/{MODEL_ID}/version/{VERSION_ID}/artifact"
+)
+
+
+def _metadata(name: str) -> EvidenceMetadata:
+    """Build the metadata for a benchmark value."""
+    return EvidenceMetadata(
+        measurement_type="benchmark", identifier=Identifier(name=name)
+    )
+
+
+def sample_values(seed: int) -> Dict[str, ArtifactModel]:
+    """Build representative values: a scalar, a large array and an image."""
+    rng = random.Random(seed)
+    size = 256 * 1024
+    return {
+        "integer": Integer(_metadata("integer"), 42).to_model(),
+        "array": Array(
+            _metadata("array"), [rng.random() for _ in range(100_000)]
+        ).to_model(),
+        # Image data is already compressed, so random bytes are representative.
+        "image": Image(
+            _metadata("image"),
+            rng.getrandbits(8 * size).to_bytes(size, "little"),
+        ).to_model(),
+    }
+
+
+def create_client() -> TestClient:
+    """Create an in-process backend with memory stores, and a client authenticated to it."""
+    state.set_artifact_store(
+        artifact_store_factory.create_store(StoreURIPrefix.LOCAL_MEMORY[0])
+    )
+    state.set_user_store(
+        user_store_factory.create_store(StoreURIPrefix.LOCAL_MEMORY[0])
+    )
+    state.set_token_key("benchmark")
+
+    client = TestClient(app_factory.create())
+    res = client.post(
+        f"{settings.API_PREFIX}/token",
+        data={
+            "grant_type": "password",
+            "username": DEFAULT_USERNAME,
+            "password": DEFAULT_PASSWORD,
+        },
+    )
+    if res.status_code != codes.OK:
+        raise RuntimeError(f"Authentication failed: {res.text}")
+    client.headers["Authorization"] = f"Bearer {res.json()['access_token']}"
+    return client
+
+
+def measure(
+    client: TestClient, artifact: ArtifactModel, mode: str, repeat: int
+) -> Tuple[int, int, float, float]:
+    """
+    Write and read an artifact repeatedly with a body encoding.
+    :return: The request and response body sizes in bytes, and the mean write and read times in milliseconds
+    """
+    use_msgpack = mode == "msgpack"
+    headers = {
+        "Accept": (
+            encoding.MSGPACK_CONTENT_TYPE
+            if use_msgpack
+            else encoding.JSON_CONTENT_TYPE
+        ),
+        "Accept-Encoding": "identity" if mode == "json" else "gzip",
+    }
+    payload: Dict[str, Any] = WriteArtifactRequest(
+        artifact=artifact, force=True, parents=True
+    ).model_dump()
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        body = encoding.encode_body(
+            payload, use_msgpack=use_msgpack, compress=mode != "json"
+        )
+        res = client.post(
+            ARTIFACT_URL,
+            content=body["data"],
+            headers={**headers, **body["headers"]},
+        )
+        if res.status_code != codes.OK:
+            raise RuntimeError(f"Write failed: {res.text}")
+    write_ms = (time.perf_counter() - start) * 1000 / repeat
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        res = client.get(
+            f"{ARTIFACT_URL}/{artifact.header.identifier}", headers=headers
+        )
+        if res.status_code != codes.OK:
+            raise RuntimeError(f"Read failed: {res.text}")
+        encoding.decode_body(res.content, res.headers.get("content-type"))
+    read_ms = (time.perf_counter() - start) * 1000 / repeat
+
+    return len(body["data"]), res.num_bytes_downloaded, write_ms, read_ms
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse commandline arguments."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--repeat", type=int, default=20, help="Operations timed per case."
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="Seed for the sample data."
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_arguments()
+
+    modes: List[str] = ["json", "gzip"]
+    if encoding.msgpack_available():
+        modes.append("msgpack")
+
+    client = create_client()
+    print(
+        f"{'value':<8} {'mode':<8} {'sent':>10} {'received':>10} {'write ms':>10} {'read ms':>10}"
+    )
+    for name, artifact in sample_values(args.seed).items():
+        for mode in modes:
+            sent, received, write_ms, read_ms = measure(
+                client, artifact, mode, args.repeat
+            )
+            print(
+                f"{name:<8} {mode:<8} {sent:>10} {received:>10} {write_ms:>10.2f} {read_ms:>10.2f}"
+            )
+    return EXIT_SUCCESS
+
+
+if __name__ == "__main__":
+    sys.exit(main())